@@ -0,0 +1,382 @@
+"""
+벤치마크: 합성 코퍼스 기반 Phase별 핵심 함수 성능 측정
+- news_data.xlsx / datathon_data.json 형태의 합성 데이터 생성
+  (Zipf 분포 키워드, 다중 키워드 문서, SYNONYM_MAP 동의어 변형 포함)
+- calculate_tfidf, calculate_cooccurrence, calculate_gap_index, extract_*_mentions 실행 시간 측정
+- 처리량(문서/초)과 최대 메모리(peak RSS) 기록 → 기준 결과 대비 성능 회귀 확인
+
+사용 예:
+    python benchmark.py --scales 10000 100000
+    python benchmark.py --baseline output/benchmark_results.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing as mp
+import platform
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, SYNONYM_MAP, STOPWORDS, TOPIC_KEYWORDS,
+    NEWS_EXCLUDE_CATEGORIES, NEWS_TFIDF_TOP_N,
+    BENCH_SCALES, BENCH_VOCAB_SIZE, BENCH_ZIPF_EXPONENT,
+    BENCH_NEWS_KEYWORDS_MEAN, BENCH_PAPER_KEYWORDS_MEAN,
+    BENCH_SYNONYM_RATE, BENCH_IO_MAX_DOCS, BENCH_REPEATS,
+    BENCH_REGRESSION_TOLERANCE,
+    normalize_keyword, is_valid_keyword, init_dirs
+)
+from profiling import peak_rss_mb
+
+
+# 측정 대상 함수
+BENCH_CASES = [
+    'calculate_tfidf',
+    'calculate_cooccurrence',
+    'calculate_gap_index',
+    'extract_news_mentions',
+    'extract_paper_mentions',
+]
+
+# 파일 입출력이 필요한 측정
+IO_CASES = {'extract_news_mentions', 'extract_paper_mentions'}
+
+# 합성 뉴스 카테고리 (통합 분류1) - 제외 카테고리 포함
+SYNTHETIC_NEWS_CATEGORIES = [
+    '경제>취업_창업', '경제>산업_기업', '사회>노동_복지', '사회>교육_시험',
+    'IT_과학>과학', 'IT_과학>인터넷_SNS', '문화>학술_문화재', '국제>국제일반',
+] + list(NEWS_EXCLUDE_CATEGORIES)
+
+# 엑셀 시트 최대 행 수 (초과 시 파일 분할)
+XLSX_MAX_ROWS = 1_000_000
+
+CHUNK_DOCS = 200_000
+
+
+# ============================================================
+# 합성 코퍼스 생성
+# ============================================================
+
+def build_synthetic_vocab(vocab_size=BENCH_VOCAB_SIZE, seed=0):
+    """합성 어휘 생성 (상위: 실제 주제어/동의어 원형/불용어, 하위: 합성 롱테일)"""
+    rng = np.random.default_rng(seed)
+
+    head = list(dict.fromkeys(TOPIC_KEYWORDS))
+    head += [kw for kw in dict.fromkeys(SYNONYM_MAP.values()) if kw not in head]
+    head += sorted(STOPWORDS)
+    head = [head[i] for i in rng.permutation(len(head))]
+
+    tail_size = max(vocab_size - len(head), 0)
+    vocab = head + [f'합성키워드{i:07d}' for i in range(tail_size)]
+
+    # 정규형 → 표면형(동의어 변형) 목록
+    variants = defaultdict(list)
+    for surface, canonical in SYNONYM_MAP.items():
+        variants[canonical].append(surface)
+
+    return vocab, variants
+
+
+class SyntheticCorpus:
+    """Zipf 분포를 따르는 합성 키워드 문서 생성기"""
+
+    def __init__(self, vocab_size=BENCH_VOCAB_SIZE, zipf_exponent=BENCH_ZIPF_EXPONENT,
+                 synonym_rate=BENCH_SYNONYM_RATE, seed=0):
+        self.seed = seed
+        self.synonym_rate = synonym_rate
+        self.vocab, variants = build_synthetic_vocab(vocab_size, seed)
+        self.vocab_arr = np.array(self.vocab, dtype=object)
+
+        ranks = np.arange(1, len(self.vocab) + 1, dtype=np.float64)
+        weights = ranks ** -zipf_exponent
+        self.cdf = np.cumsum(weights / weights.sum())
+
+        # 동의어 변형을 평탄화된 배열 + 오프셋으로 보관 (벡터화 치환용)
+        flat = []
+        self.variant_count = np.zeros(len(self.vocab), dtype=np.int64)
+        self.variant_offset = np.zeros(len(self.vocab), dtype=np.int64)
+        for i, kw in enumerate(self.vocab):
+            forms = variants.get(kw, [])
+            self.variant_offset[i] = len(flat)
+            self.variant_count[i] = len(forms)
+            flat.extend(forms)
+        self.variant_flat = np.array(flat, dtype=object)
+
+    def keyword_lists(self, n_docs, mean_len, stream=0):
+        """문서별 원본 키워드 목록을 청크 단위로 생성 (generator)"""
+        rng = np.random.default_rng([self.seed, stream])
+        for start in range(0, n_docs, CHUNK_DOCS):
+            size = min(CHUNK_DOCS, n_docs - start)
+            lengths = rng.poisson(max(mean_len - 1, 0), size) + 1
+            ids = np.searchsorted(self.cdf, rng.random(int(lengths.sum())))
+            ids = np.minimum(ids, len(self.vocab) - 1)
+
+            surface = self.vocab_arr[ids]
+            swap = (rng.random(len(ids)) < self.synonym_rate) & (self.variant_count[ids] > 0)
+            pick = np.nonzero(swap)[0]
+            if len(pick):
+                pick_ids = ids[pick]
+                offset = (rng.random(len(pick)) * self.variant_count[pick_ids]).astype(np.int64)
+                surface[pick] = self.variant_flat[self.variant_offset[pick_ids] + offset]
+
+            bounds = np.concatenate([[0], np.cumsum(lengths)])
+            for i in range(size):
+                yield list(surface[bounds[i]:bounds[i + 1]])
+
+    def news_rows(self, n_docs):
+        """news_data.xlsx 형태의 행 생성 (제목, 통합 분류1, 키워드, 일자)"""
+        rng = np.random.default_rng([self.seed, 10])
+        categories = rng.integers(0, len(SYNTHETIC_NEWS_CATEGORIES), n_docs)
+        days = rng.integers(0, 730, n_docs)
+        start = date(2023, 1, 1)
+        for i, keywords in enumerate(self.keyword_lists(n_docs, BENCH_NEWS_KEYWORDS_MEAN, stream=1)):
+            yield {
+                '일자': int((start + timedelta(days=int(days[i]))).strftime('%Y%m%d')),
+                '제목': ' '.join(keywords[:3]) + ' 관련 보도',
+                '통합 분류1': SYNTHETIC_NEWS_CATEGORIES[categories[i]],
+                '키워드': ','.join(keywords),
+            }
+
+    def paper_nodes(self, n_docs, empty_rate=0.1):
+        """datathon_data.json NODE_LIST 형태의 항목 생성 (TITLE, AUTHORS, KYWD)"""
+        rng = np.random.default_rng([self.seed, 20])
+        empty = rng.random(n_docs) < empty_rate
+        for i, keywords in enumerate(self.keyword_lists(n_docs, BENCH_PAPER_KEYWORDS_MEAN, stream=2)):
+            yield {
+                'TITLE': ' '.join(keywords[:3]) + '에 관한 연구',
+                'AUTHORS': f'저자{i % 997}',
+                'KYWD': '' if empty[i] else ', '.join(keywords),
+            }
+
+    def write_news_xlsx(self, n_docs, out_dir):
+        """합성 뉴스 데이터를 엑셀 파일로 저장 (시트 최대 행 초과 시 분할)"""
+        import pandas as pd
+
+        files = []
+        rows = self.news_rows(n_docs)
+        for part in range(0, n_docs, XLSX_MAX_ROWS):
+            size = min(XLSX_MAX_ROWS, n_docs - part)
+            df = pd.DataFrame([next(rows) for _ in range(size)])
+            path = Path(out_dir) / f'news_data_{part // XLSX_MAX_ROWS}.xlsx'
+            df.to_excel(path, index=False)
+            files.append(str(path))
+        return files
+
+    def write_paper_json(self, n_docs, out_dir):
+        """합성 논문 데이터를 JSON 파일로 저장"""
+        path = Path(out_dir) / 'datathon_data.json'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'NODE_LIST': list(self.paper_nodes(n_docs))}, f, ensure_ascii=False)
+        return str(path)
+
+
+def normalize_docs(keyword_lists):
+    """원본 키워드 목록 → 정규화된 문서 목록 (phase3와 동일한 처리)"""
+    docs = []
+    for keywords in keyword_lists:
+        keywords = [normalize_keyword(k) for k in keywords]
+        keywords = list({k for k in keywords if is_valid_keyword(k)})
+        if keywords:
+            docs.append(keywords)
+    return docs
+
+
+# ============================================================
+# 측정
+# ============================================================
+
+def _prepare_case(case, n_docs, seed, tmp_dir):
+    """측정 대상 함수와 입력 준비 (측정 시간에서 제외)"""
+    corpus = SyntheticCorpus(seed=seed)
+
+    if case == 'calculate_tfidf':
+        from phase2_tfidf import calculate_tfidf
+        docs = normalize_docs(corpus.keyword_lists(n_docs, BENCH_NEWS_KEYWORDS_MEAN, stream=1))
+        counter = Counter(kw for doc in docs for kw in doc)
+        doc_sets = [set(doc) for doc in docs]
+        return lambda: calculate_tfidf(doc_sets, counter, NEWS_TFIDF_TOP_N)
+
+    if case == 'calculate_cooccurrence':
+        from phase3_cooccurrence import calculate_cooccurrence
+        docs = normalize_docs(corpus.keyword_lists(n_docs, BENCH_NEWS_KEYWORDS_MEAN, stream=1))
+        return lambda: calculate_cooccurrence(docs, TOPIC_KEYWORDS)
+
+    if case == 'calculate_gap_index':
+        from phase3_cooccurrence import analyze_source, calculate_gap_index
+        news_docs = normalize_docs(corpus.keyword_lists(n_docs, BENCH_NEWS_KEYWORDS_MEAN, stream=1))
+        paper_docs = normalize_docs(corpus.keyword_lists(n_docs, BENCH_PAPER_KEYWORDS_MEAN, stream=2))
+        with contextlib.redirect_stdout(io.StringIO()):
+            news_results, _, _ = analyze_source('news', news_docs, TOPIC_KEYWORDS)
+            paper_results, _, _ = analyze_source('paper', paper_docs, TOPIC_KEYWORDS)
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                return calculate_gap_index(news_results, paper_results, news_docs, paper_docs)
+        return run
+
+    if case == 'extract_news_mentions':
+        import phase5_keyword_pair_mentions as phase5
+        phase5.NEWS_FILES = corpus.write_news_xlsx(n_docs, tmp_dir)
+        return phase5.extract_news_mentions
+
+    if case == 'extract_paper_mentions':
+        import phase5_keyword_pair_mentions as phase5
+        phase5.PAPER_FILE = corpus.write_paper_json(n_docs, tmp_dir)
+        return phase5.extract_paper_mentions
+
+    raise ValueError(f'알 수 없는 벤치마크: {case}')
+
+
+def _run_case(case, n_docs, seed, repeats):
+    """단일 측정 실행 (별도 프로세스에서 실행되어 peak RSS가 측정 간 섞이지 않음)"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        func = _prepare_case(case, n_docs, seed, tmp_dir)
+        rss_before = peak_rss_mb()
+
+        best_wall, best_cpu = None, None
+        for _ in range(repeats):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            func()
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            if best_wall is None or wall < best_wall:
+                best_wall, best_cpu = wall, cpu
+
+        rss_after = peak_rss_mb()
+
+    return {
+        'case': case,
+        'n_docs': n_docs,
+        'wall_sec': round(best_wall, 6),
+        'cpu_sec': round(best_cpu, 6),
+        'docs_per_sec': round(n_docs / best_wall, 1) if best_wall > 0 else None,
+        'peak_rss_mb': round(rss_after, 1) if rss_after is not None else None,
+        'peak_rss_delta_mb': round(rss_after - rss_before, 1) if rss_after is not None else None,
+    }
+
+
+def run_benchmarks(scales, cases, seed=0, repeats=BENCH_REPEATS):
+    """규모 × 함수 조합별 측정 실행"""
+    ctx = mp.get_context('spawn')
+    results = []
+
+    for n_docs in scales:
+        for case in cases:
+            if case in IO_CASES and n_docs > BENCH_IO_MAX_DOCS:
+                print(f"  건너뜀: {case} @ {n_docs:,} (BENCH_IO_MAX_DOCS={BENCH_IO_MAX_DOCS:,} 초과)")
+                results.append({'case': case, 'n_docs': n_docs, 'skipped': 'io_limit'})
+                continue
+
+            print(f"  측정 중: {case} @ {n_docs:,}문서")
+            with ctx.Pool(1) as pool:
+                result = pool.apply(_run_case, (case, n_docs, seed, repeats))
+            results.append(result)
+            print(f"    {result['wall_sec']:.3f}s | {result['docs_per_sec']:,.0f} docs/s | "
+                  f"peak RSS {result['peak_rss_mb']} MB")
+
+    return results
+
+
+def compare_with_baseline(results, baseline_path, tolerance=BENCH_REGRESSION_TOLERANCE):
+    """기준 결과 대비 실행 시간 비교 → 회귀 목록 반환"""
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    base_times = {(r['case'], r['n_docs']): r['wall_sec']
+                  for r in baseline['results'] if 'wall_sec' in r}
+
+    regressions = []
+    for r in results:
+        base = base_times.get((r['case'], r['n_docs']))
+        if base is None or 'wall_sec' not in r or base <= 0:
+            continue
+        ratio = r['wall_sec'] / base
+        r['baseline_wall_sec'] = base
+        r['ratio_vs_baseline'] = round(ratio, 3)
+        if ratio > 1 + tolerance:
+            regressions.append(r)
+
+    return regressions
+
+
+def print_summary(results):
+    """측정 결과 요약 출력"""
+    print("\n" + "=" * 80)
+    print("벤치마크 결과")
+    print("=" * 80)
+    print(f"{'함수':<25} | {'문서 수':>10} | {'시간(s)':>9} | {'문서/초':>12} | {'peak RSS(MB)':>12}")
+    print("-" * 80)
+    for r in results:
+        if 'skipped' in r:
+            print(f"{r['case']:<25} | {r['n_docs']:>10,} | {'(건너뜀)':>9} |")
+            continue
+        line = (f"{r['case']:<25} | {r['n_docs']:>10,} | {r['wall_sec']:>9.3f} | "
+                f"{r['docs_per_sec']:>12,.0f} | {str(r['peak_rss_mb']):>12}")
+        if 'ratio_vs_baseline' in r:
+            line += f" | 기준 대비 ×{r['ratio_vs_baseline']:.2f}"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='합성 코퍼스 기반 성능 벤치마크')
+    parser.add_argument('--scales', type=int, nargs='+', default=BENCH_SCALES,
+                        help='측정할 문서 수 (예: 10000 100000)')
+    parser.add_argument('--cases', nargs='+', default=BENCH_CASES, choices=BENCH_CASES,
+                        help='측정할 함수')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeats', type=int, default=BENCH_REPEATS)
+    parser.add_argument('--baseline', type=str, default=None,
+                        help='비교할 기준 결과 JSON 경로')
+    parser.add_argument('--output', type=str, default=str(OUTPUT_DIR / 'benchmark_results.json'))
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  벤치마크: 합성 코퍼스 기반 성능 측정")
+    print("#" * 60)
+
+    init_dirs()
+
+    results = run_benchmarks(args.scales, args.cases, args.seed, args.repeats)
+
+    regressions = []
+    if args.baseline:
+        regressions = compare_with_baseline(results, args.baseline)
+
+    print_summary(results)
+
+    if args.baseline:
+        print(f"\n[성능 회귀] (기준 대비 {BENCH_REGRESSION_TOLERANCE:.0%} 이상 느려진 항목)")
+        if regressions:
+            for r in regressions:
+                print(f"  - {r['case']} @ {r['n_docs']:,}: ×{r['ratio_vs_baseline']:.2f}")
+        else:
+            print("  없음")
+
+    output = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'numpy': np.__version__,
+            'seed': args.seed,
+            'repeats': args.repeats,
+            'vocab_size': BENCH_VOCAB_SIZE,
+            'zipf_exponent': BENCH_ZIPF_EXPONENT,
+        },
+        'results': results,
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(output, f, ensure_ascii=False, indent=2)
+    print(f"\n  저장: {args.output}")
+
+
+if __name__ == '__main__':
+    main()
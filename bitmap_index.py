@@ -0,0 +1,383 @@
+"""
+키워드 비트맵 색인 + 불리언 질의
+- 키워드별 문서 집합을 압축 비트맵으로 저장 (Roaring 방식의 컨테이너 선택)
+    문서 빈도가 높은 키워드: 고정 길이 비트셋 (uint64 워드, 문서 수 / 8 바이트)
+    문서 빈도가 낮은 키워드: 정렬된 문서 ID 배열 (uint32, 문서 빈도 × 4 바이트)
+    → 둘 중 작은 쪽을 선택, 질의 시에는 비트셋으로 펼쳐 워드 단위 AND/OR/NOT
+- 질의 언어: AND / OR / NOT, 괄호, 연산자 없이 이어진 항은 AND, "따옴표"로 공백 포함 키워드,
+  category:<통합 분류1> (접두어 일치: category:사회 → 사회>사건_사고, 사회>노동 등, 논문은 해당 없음)
+    예) (인공지능 OR 머신러닝) AND 청년 NOT 코로나19
+        인공지능 category:경제 NOT category:경제>부동산
+- 질의 키워드에도 동의어 정규화 적용 (AI → 인공지능)
+- 문서 ID = 원본 순서 (뉴스: 파일 순서대로 이어 붙인 행 번호, 논문: NODE_LIST 순서)
+- 질의 대상(전체 집합, 1000건당 비율의 분모)은 키워드가 있는 문서, 뉴스는 NEWS_EXCLUDE_CATEGORIES 제외
+  (Phase 2/3, 코퍼스 저장소와 같은 문서 집합, 제외된 행도 ID는 유지)
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    NEWS_FILES, PAPER_FILE, OUTPUT_DIR, NEWS_CATEGORY_COLUMN, NEWS_EXCLUDE_CATEGORIES,
+    normalize_keyword, is_valid_keyword, init_dirs
+)
+from corpus import build_vocab, docs_to_csr, csr_to_matrix
+
+
+INDEX_DIR = OUTPUT_DIR / 'bitmap_index'
+
+
+def _parse_keywords(raw):
+    if not isinstance(raw, str) or not raw:
+        return []
+    keywords = {normalize_keyword(k.strip()) for k in raw.split(',') if k.strip()}
+    return [k for k in keywords if is_valid_keyword(k)]
+
+
+def load_source_docs(source):
+    """원본 데이터 → (문서별 키워드 목록, 문서별 카테고리 또는 None, 파일별 시작 문서 ID)
+
+    키워드가 없는 문서와 제외 카테고리(NEWS_EXCLUDE_CATEGORIES) 문서도 ID를 유지하기 위해 빈 목록으로 포함
+    """
+    if source == 'news':
+        import pandas as pd
+
+        excluded = set(NEWS_EXCLUDE_CATEGORIES)
+        docs, categories, offsets = [], [], []
+        for file in NEWS_FILES:
+            df = pd.read_excel(file, usecols=[NEWS_CATEGORY_COLUMN, '키워드'])
+            offsets.append(len(docs))
+            file_categories = [c if isinstance(c, str) else '' for c in df[NEWS_CATEGORY_COLUMN]]
+            docs.extend([] if c in excluded else _parse_keywords(raw)
+                        for raw, c in zip(df['키워드'], file_categories))
+            categories.extend(file_categories)
+        return docs, categories, offsets
+
+    with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    docs = [_parse_keywords(str(item.get('KYWD') or '')) for item in data['NODE_LIST']]
+    return docs, None, [0]
+
+
+class BitmapIndex:
+    """키워드 → 문서 집합 압축 비트맵 색인"""
+
+    def __init__(self, n_docs, vocab, container, dense, sparse_indptr, sparse_ids,
+                 categories=None, doc_category=None, offsets=(0,), active=None):
+        self.n_docs = int(n_docs)
+        self.n_words = (self.n_docs + 63) // 64
+        # 질의 대상 문서 비트셋 (키워드가 있고 제외 카테고리가 아닌 문서, 기본: 전체)
+        self.active = active if active is not None else self.from_ids(np.arange(self.n_docs))
+        self.n_active = int(np.unpackbits(self.active.view(np.uint8)).sum())
+        self.vocab = list(vocab)
+        self.vocab_index = {kw: i for i, kw in enumerate(self.vocab)}
+        self.container = container          # 키워드별: 비트셋 행 번호 (>= 0) 또는 -1 (ID 배열)
+        self.dense = dense                  # (비트셋 키워드 수 × 워드 수) uint64
+        self.sparse_indptr = sparse_indptr  # 키워드별 ID 배열 구간 (ID 배열 키워드만 비어 있지 않음)
+        self.sparse_ids = sparse_ids
+        self.categories = list(categories or [])
+        self.doc_category = doc_category    # 문서별 카테고리 번호 (논문: None)
+        self.offsets = list(offsets)
+
+    @classmethod
+    def build(cls, docs, categories=None, offsets=(0,)):
+        vocab, vocab_index, doc_freq = build_vocab(docs)
+        indptr, indices = docs_to_csr(docs, vocab_index)
+        postings = csr_to_matrix(indptr, indices, len(vocab), dtype=np.int8).tocsc()
+        postings.sort_indices()
+        n_docs = len(docs)
+
+        # 컨테이너 선택: ID 배열(4 × 문서 빈도 바이트)이 비트셋(문서 수 / 8 바이트)보다 크면 비트셋
+        is_dense = doc_freq * 32 > n_docs
+        container = np.full(len(vocab), -1, dtype=np.int64)
+        container[is_dense] = np.arange(int(is_dense.sum()))
+        n_words = (n_docs + 63) // 64
+        dense = np.zeros((int(is_dense.sum()), n_words), dtype=np.uint64)
+
+        lengths = np.diff(postings.indptr)
+        sparse_lengths = np.where(is_dense, 0, lengths)
+        sparse_indptr = np.zeros(len(vocab) + 1, dtype=np.int64)
+        np.cumsum(sparse_lengths, out=sparse_indptr[1:])
+        keep = np.repeat(~is_dense, lengths)
+        sparse_ids = postings.indices[keep].astype(np.uint32)
+
+        index = cls(n_docs, vocab, container, dense, sparse_indptr, sparse_ids, offsets=offsets)
+        index.active = index.from_ids(np.flatnonzero(np.diff(indptr) > 0))
+        index.n_active = int(np.count_nonzero(np.diff(indptr)))
+        for kw in np.nonzero(is_dense)[0]:
+            ids = postings.indices[postings.indptr[kw]:postings.indptr[kw + 1]]
+            index.dense[container[kw]] = index.from_ids(ids)
+
+        if categories is not None:
+            names = sorted(set(categories))
+            code = {c: i for i, c in enumerate(names)}
+            index.categories = names
+            index.doc_category = np.array([code[c] for c in categories], dtype=np.int32)
+        return index
+
+    # ----- 비트셋 연산 -----
+
+    def from_ids(self, ids):
+        bits = np.zeros(self.n_words * 64, dtype=bool)
+        bits[ids] = True
+        return np.packbits(bits, bitorder='little').view(np.uint64)
+
+    def to_ids(self, words):
+        bits = np.unpackbits(words.view(np.uint8), bitorder='little')[:self.n_docs]
+        return np.flatnonzero(bits)
+
+    def universe(self):
+        return self.active
+
+    def empty(self):
+        return np.zeros(self.n_words, dtype=np.uint64)
+
+    def keyword_bits(self, keyword):
+        """키워드 → 비트셋 (동의어 정규화, 어휘에 없으면 None)"""
+        kw = self.vocab_index.get(normalize_keyword(keyword))
+        if kw is None:
+            return None
+        if self.container[kw] >= 0:
+            return self.dense[self.container[kw]]
+        return self.from_ids(self.sparse_ids[self.sparse_indptr[kw]:self.sparse_indptr[kw + 1]])
+
+    def category_bits(self, prefix):
+        """카테고리 접두어(> 단위) 일치 문서 비트셋 (카테고리가 없는 색인은 빈 집합)"""
+        if self.doc_category is None:
+            return self.empty()
+        codes = [i for i, c in enumerate(self.categories) if c == prefix or c.startswith(prefix + '>')]
+        return self.from_ids(np.flatnonzero(np.isin(self.doc_category, codes))) & self.active
+
+    def evaluate(self, node, unknown=None):
+        """질의 AST → 비트셋 (어휘에 없는 키워드는 빈 집합, unknown 목록에 기록)"""
+        op = node[0]
+        if op == 'term':
+            bits = self.keyword_bits(node[1])
+            if bits is None:
+                if unknown is not None:
+                    unknown.append(node[1])
+                return self.empty()
+            return bits
+        if op == 'category':
+            return self.category_bits(node[1])
+        if op == 'not':
+            return ~self.evaluate(node[1], unknown) & self.universe()
+        left = self.evaluate(node[1], unknown)
+        right = self.evaluate(node[2], unknown)
+        return left & right if op == 'and' else left | right
+
+    def query(self, expression):
+        """질의 문자열 → (문서 ID 배열, 어휘에 없는 키워드 목록)"""
+        unknown = []
+        bits = self.evaluate(parse_query(expression), unknown)
+        return self.to_ids(bits), unknown
+
+    def locate(self, doc_id):
+        """문서 ID → (파일 번호, 파일 내 행 번호)"""
+        file_no = int(np.searchsorted(self.offsets, doc_id, side='right')) - 1
+        return file_no, int(doc_id - self.offsets[file_no])
+
+    # ----- 저장 / 로드 -----
+
+    def save(self, source):
+        INDEX_DIR.mkdir(parents=True, exist_ok=True)
+        arrays = dict(container=self.container, dense=self.dense, active=self.active,
+                      sparse_indptr=self.sparse_indptr, sparse_ids=self.sparse_ids)
+        if self.doc_category is not None:
+            arrays['doc_category'] = self.doc_category
+        np.savez(INDEX_DIR / f'{source}.npz', **arrays)
+        with open(INDEX_DIR / f'{source}_meta.json', 'w', encoding='utf-8') as f:
+            json.dump({'n_docs': self.n_docs, 'vocab': self.vocab, 'categories': self.categories,
+                       'offsets': self.offsets, 'exclude': sorted(NEWS_EXCLUDE_CATEGORIES)}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, source):
+        data = np.load(INDEX_DIR / f'{source}.npz')
+        with open(INDEX_DIR / f'{source}_meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return cls(meta['n_docs'], meta['vocab'], data['container'], data['dense'],
+                   data['sparse_indptr'], data['sparse_ids'], meta['categories'],
+                   data['doc_category'] if 'doc_category' in data else None, meta['offsets'], data['active'])
+
+    @staticmethod
+    def is_current(source):
+        """저장된 색인이 현재 제외 카테고리 설정으로 만들어졌는지 (이전 형식 색인은 다시 생성)"""
+        with open(INDEX_DIR / f'{source}_meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return meta.get('exclude') == sorted(NEWS_EXCLUDE_CATEGORIES)
+
+    def nbytes(self):
+        return self.dense.nbytes + self.sparse_ids.nbytes + self.sparse_indptr.nbytes
+
+
+def load_or_build_index(source, rebuild=False):
+    """저장된 색인 로드, 없거나 원본 파일이 더 최신이거나 제외 카테고리가 바뀌었으면 새로 생성 후 저장"""
+    path = INDEX_DIR / f'{source}.npz'
+    files = NEWS_FILES if source == 'news' else [PAPER_FILE]
+    if not rebuild and path.exists() and BitmapIndex.is_current(source):
+        index_mtime = path.stat().st_mtime
+        if all(os.path.getmtime(f) <= index_mtime for f in files if os.path.exists(f)):
+            return BitmapIndex.load(source)
+
+    print(f"  {source} 비트맵 색인을 새로 생성합니다...")
+    docs, categories, offsets = load_source_docs(source)
+    index = BitmapIndex.build(docs, categories, offsets)
+    index.save(source)
+    return index
+
+
+# ============================================================
+# 질의 파서 (재귀 하강)
+#   expr     := and_expr (OR and_expr)*
+#   and_expr := not_expr ((AND)? not_expr)*
+#   not_expr := NOT not_expr | atom
+#   atom     := '(' expr ')' | category:<값> | 키워드 | "키워드"
+# ============================================================
+
+_QUERY_TOKEN = re.compile(r'\s*("[^"]*"|\(|\)|[^\s()"]+)')
+_OPERATORS = ('AND', 'OR', 'NOT')
+
+
+def tokenize_query(expression):
+    tokens = []
+    pos = 0
+    expression = expression.strip()
+    while pos < len(expression):
+        match = _QUERY_TOKEN.match(expression, pos)
+        if match is None:
+            raise ValueError(f"질의를 해석할 수 없습니다: {expression[pos:]}")
+        tokens.append(match.group(1))
+        pos = match.end()
+    return tokens
+
+
+def parse_query(expression):
+    """질의 문자열 → AST (('and'|'or', 왼쪽, 오른쪽), ('not', 항), ('term', 키워드), ('category', 값))"""
+    tokens = tokenize_query(expression)
+    pos = 0
+
+    def peek():
+        return tokens[pos] if pos < len(tokens) else None
+
+    def take():
+        nonlocal pos
+        pos += 1
+        return tokens[pos - 1]
+
+    def parse_or():
+        node = parse_and()
+        while peek() == 'OR':
+            take()
+            node = ('or', node, parse_and())
+        return node
+
+    def parse_and():
+        node = parse_not()
+        while peek() is not None and peek() not in ('OR', ')'):
+            if peek() == 'AND':
+                take()
+            node = ('and', node, parse_not())
+        return node
+
+    def parse_not():
+        if peek() == 'NOT':
+            take()
+            return ('not', parse_not())
+        return parse_atom()
+
+    def parse_atom():
+        token = peek()
+        if token is None:
+            raise ValueError("질의가 예상보다 일찍 끝났습니다")
+        if token in _OPERATORS or token == ')':
+            raise ValueError(f"'{token}' 위치에 키워드가 필요합니다")
+        take()
+        if token == '(':
+            node = parse_or()
+            if peek() != ')':
+                raise ValueError("닫는 괄호가 없습니다")
+            take()
+            return node
+        if token.startswith('category:'):
+            return ('category', token[len('category:'):].strip('"'))
+        return ('term', token.strip('"'))
+
+    node = parse_or()
+    if peek() is not None:
+        raise ValueError(f"해석하지 못한 부분: {' '.join(tokens[pos:])}")
+    return node
+
+
+def run_query(indexes, expression):
+    """색인별 질의 결과
+
+    Returns:
+        dict[source] → {'count', 'ratio' (1000건당), 'ids', 'unknown', 'ms'}
+    """
+    results = {}
+    for source, index in indexes.items():
+        start = time.perf_counter()
+        ids, unknown = index.query(expression)
+        elapsed = (time.perf_counter() - start) * 1000
+        results[source] = {
+            'count': len(ids),
+            'ratio': len(ids) / index.n_active * 1000 if index.n_active else 0.0,
+            'ids': ids,
+            'unknown': unknown,
+            'ms': elapsed,
+        }
+    return results
+
+
+def print_results(expression, results, limit=10):
+    print(f"\n질의: {expression}")
+    for source, r in results.items():
+        name = '뉴스' if source == 'news' else '논문'
+        print(f"  {name}: {r['count']:,}건 (1000건당 {r['ratio']:.2f}) | 조회 {r['ms']:.2f}ms")
+        if r['unknown']:
+            print(f"    어휘에 없는 키워드: {', '.join(dict.fromkeys(r['unknown']))}")
+        if limit and r['count']:
+            print(f"    문서 ID: {', '.join(str(i) for i in r['ids'][:limit])}{' ...' if r['count'] > limit else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='키워드 비트맵 색인 불리언 질의')
+    parser.add_argument('expression', nargs='*', help='질의 (예: "(인공지능 OR 머신러닝) AND 청년 NOT 코로나19")')
+    parser.add_argument('--rebuild', action='store_true', help='색인 다시 생성')
+    parser.add_argument('--limit', type=int, default=10, help='출력할 문서 ID 수')
+    args = parser.parse_args()
+
+    init_dirs()
+    start = time.perf_counter()
+    indexes = {source: load_or_build_index(source, args.rebuild) for source in ('news', 'paper')}
+    print(f"색인 로드: {(time.perf_counter() - start) * 1000:.0f}ms")
+    for source, index in indexes.items():
+        n_dense = int((index.container >= 0).sum())
+        print(f"  {source}: 문서 {index.n_active:,} (원본 {index.n_docs:,}) / 키워드 {len(index.vocab):,} "
+              f"(비트셋 {n_dense:,}, ID 배열 {len(index.vocab) - n_dense:,}) / {index.nbytes() / 1e6:.1f}MB")
+
+    if not args.expression:
+        return
+    expression = ' '.join(args.expression)
+    results = run_query(indexes, expression)
+    print_results(expression, results, args.limit)
+
+    output_path = OUTPUT_DIR / 'bitmap_query.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'query': expression,
+            'results': {source: {'count': r['count'], 'ratio': round(r['ratio'], 4),
+                                 'unknown': r['unknown'], 'ids': [int(i) for i in r['ids']]}
+                        for source, r in results.items()},
+        }, f, ensure_ascii=False, indent=2)
+    print(f"\n  저장: {output_path}")
+
+
+if __name__ == '__main__':
+    main()
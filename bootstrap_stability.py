@@ -0,0 +1,277 @@
+"""
+부트스트랩 순위 안정성 (TF-IDF 상위 키워드 / 간극 분석 후보)
+- 입력: 메모리 맵 코퍼스 저장소 (corpus.py, Phase 3과 같은 문서 집합), gap_analysis.json의 키워드 목록
+- 포아송 부트스트랩: 반복마다 문서별 가중치 w ~ Poisson(1) (복원 추출의 대규모 근사, 문서 수 고정 불필요)
+    가중 DF = bincount(indices, w[행]), 가중 TF = bincount(indices, w[행] × counts), 가중 문서 수 = Σw
+    → TF-IDF (Phase 2와 같은 식: tf × (log(N / df) + 1)) 와 간극 지수 (Phase 3: 1000건당 비율 차이) 재계산
+- 반복은 프로세스 풀에서 BOOTSTRAP_BATCH개씩 처리 (워커는 저장소를 메모리 맵으로 연결, 반복별 시드 고정)
+- 결과: 키워드별 순위 중앙값/신뢰구간, 상위 K 포함 확률, 블루오션/학술선도 후보 선정 확률
+"""
+
+import argparse
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, NEWS_TFIDF_TOP_N, PAPER_TFIDF_TOP_N,
+    GAP_NEWS_MIN_FREQ, GAP_PAPER_MIN_FREQ, GAP_BLUE_OCEAN_THRESHOLD, GAP_ACADEMIC_THRESHOLD, GAP_TOP_N,
+    BOOTSTRAP_REPLICATES, BOOTSTRAP_TOP_K, BOOTSTRAP_CI, BOOTSTRAP_SEED, BOOTSTRAP_WORKERS, BOOTSTRAP_BATCH,
+    init_dirs
+)
+from corpus import CorpusStore, load_or_build_store
+from gap_sweep import sweep_candidates
+from profiling import span, start_run, finish_run
+
+
+SOURCES = ('news', 'paper')
+TFIDF_TOP_N = {'news': NEWS_TFIDF_TOP_N, 'paper': PAPER_TFIDF_TOP_N}
+
+
+def tfidf_scores(doc_freq, term_freq, n_docs):
+    """Phase 2 TF-IDF (가중 빈도 허용, 문서 빈도 0인 키워드는 0점)"""
+    scores = np.zeros(len(doc_freq), dtype=np.float64)
+    present = doc_freq > 0
+    scores[present] = term_freq[present] * (np.log(n_docs / doc_freq[present]) + 1)
+    return scores
+
+
+def ranks_of(scores, ids):
+    """ids 키워드의 순위 (1부터, 점수가 더 높은 키워드 수 + 1)"""
+    ordered = np.sort(scores)
+    return len(scores) - np.searchsorted(ordered, scores[ids], side='right') + 1
+
+
+def gap_scores(news_freq, paper_freq, n_news, n_paper):
+    """Phase 3 간극 지수 (1000건당 비율 차이)"""
+    return news_freq / n_news * 1000 - paper_freq / n_paper * 1000
+
+
+def gap_selection(news_freq, paper_freq, gap):
+    """Phase 3과 같은 규칙의 블루오션/학술선도 후보 (키워드별 불리언)"""
+    blue, _ = sweep_candidates(news_freq, gap, [GAP_NEWS_MIN_FREQ], [GAP_BLUE_OCEAN_THRESHOLD])
+    academic, _ = sweep_candidates(paper_freq, gap, [GAP_PAPER_MIN_FREQ], [GAP_ACADEMIC_THRESHOLD],
+                                   descending=False)
+    return blue[0, 0], academic[0, 0]
+
+
+# 워커 프로세스별 저장소와 비영 원소의 문서 번호 (initializer에서 1회 준비)
+_worker = {}
+
+
+def _init_worker(paths):
+    for source, path in paths.items():
+        store = CorpusStore(path)
+        _worker[source] = (store, np.repeat(np.arange(store.n_docs, dtype=np.int32), np.diff(store.indptr)))
+
+
+def weighted_counts(store, row_of, weights):
+    """문서 가중치 → (가중 DF, 가중 TF, 가중 문서 수)"""
+    nnz_weights = weights[row_of]
+    doc_freq = np.bincount(store.indices, weights=nnz_weights, minlength=store.n_terms)
+    term_freq = np.bincount(store.indices, weights=nnz_weights * store.counts, minlength=store.n_terms)
+    return doc_freq, term_freq, weights.sum()
+
+
+def _replicate_batch(seeds, tracked, gap_ids):
+    """반복 묶음 → 반복별 TF-IDF 순위, 간극 지수, 후보 선정 여부
+
+    Args:
+        tracked: {source: 순위를 기록할 키워드 ID 배열}
+        gap_ids: {source: 간극 키워드별 ID 배열 (어휘에 없으면 -1)}
+    """
+    out = {'tfidf_ranks': {s: [] for s in SOURCES}, 'gap': [], 'blue': [], 'academic': []}
+    for seed in seeds:
+        rng = np.random.default_rng(seed)
+        freq, n_docs = {}, {}
+        for source in SOURCES:
+            store, row_of = _worker[source]
+            weights = rng.poisson(1.0, store.n_docs).astype(np.float64)
+            doc_freq, term_freq, n_docs[source] = weighted_counts(store, row_of, weights)
+            scores = tfidf_scores(doc_freq, term_freq, n_docs[source])
+            out['tfidf_ranks'][source].append(ranks_of(scores, tracked[source]))
+            ids = gap_ids[source]
+            freq[source] = np.where(ids >= 0, doc_freq[np.maximum(ids, 0)], 0)
+        gap = gap_scores(freq['news'], freq['paper'], n_docs['news'], n_docs['paper'])
+        blue, academic = gap_selection(freq['news'], freq['paper'], gap)
+        out['gap'].append(gap)
+        out['blue'].append(blue)
+        out['academic'].append(academic)
+    return out
+
+
+def run_bootstrap(stores, tracked, gap_ids, replicates=BOOTSTRAP_REPLICATES, seed=BOOTSTRAP_SEED,
+                  workers=BOOTSTRAP_WORKERS, batch=BOOTSTRAP_BATCH):
+    """전체 반복 실행 (반복별 시드는 SeedSequence에서 생성 → 워커 수/묶음 크기와 무관하게 재현)
+
+    Returns:
+        dict: tfidf_ranks {source: (반복 × 추적 키워드)}, gap / blue / academic (반복 × 간극 키워드)
+    """
+    seeds = np.random.SeedSequence(seed).generate_state(replicates)
+    batches = [seeds[i:i + batch] for i in range(0, replicates, batch)]
+    paths = {source: str(store.path) for source, store in stores.items()}
+    func = partial(_replicate_batch, tracked=tracked, gap_ids=gap_ids)
+    if workers == 1:
+        _init_worker(paths)
+        parts = [func(b) for b in batches]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(paths,)) as pool:
+            parts = list(pool.map(func, batches))
+
+    return {
+        'tfidf_ranks': {s: np.vstack([r for p in parts for r in p['tfidf_ranks'][s]]) for s in SOURCES},
+        'gap': np.vstack([g for p in parts for g in p['gap']]),
+        'blue': np.vstack([b for p in parts for b in p['blue']]),
+        'academic': np.vstack([a for p in parts for a in p['academic']]),
+    }
+
+
+def interval(values, level=BOOTSTRAP_CI):
+    """반복 축(0) 백분위수 구간 → (하한, 중앙값, 상한)"""
+    alpha = (1 - level) / 2 * 100
+    return np.percentile(values, [alpha, 50, 100 - alpha], axis=0)
+
+
+def tfidf_stability(store, ids, point_ranks, ranks, top_n, top_k=BOOTSTRAP_TOP_K):
+    lo, median, hi = interval(ranks)
+    p_top_k = (ranks <= top_k).mean(axis=0)
+    p_top_n = (ranks <= top_n).mean(axis=0)
+    return [{
+        'keyword': store.vocab[i],
+        'rank': int(point_ranks[k]),
+        'rank_median': float(median[k]),
+        'rank_ci': [float(lo[k]), float(hi[k])],
+        'p_top_k': round(float(p_top_k[k]), 4),
+        'p_top_n': round(float(p_top_n[k]), 4),
+    } for k, i in enumerate(ids)]
+
+
+def gap_stability(keywords, point_gap, blue_point, academic_point, result, top_k=BOOTSTRAP_TOP_K):
+    gap = result['gap']
+    # 간극 순위 (내림차순, 1부터) - 반복별 키워드 순위
+    gap_ranks = (gap[:, None, :] > gap[:, :, None]).sum(axis=2) + 1
+    lo, median, hi = interval(gap_ranks)
+    gap_lo, _, gap_hi = interval(gap)
+    point_ranks = (point_gap[None, :] > point_gap[:, None]).sum(axis=1) + 1
+    p_blue = result['blue'].mean(axis=0)
+    p_academic = result['academic'].mean(axis=0)
+    p_top_k = (gap_ranks <= top_k).mean(axis=0)
+    return [{
+        'keyword': kw,
+        'gap_index': round(float(point_gap[k]), 4),
+        'gap_ci': [round(float(gap_lo[k]), 4), round(float(gap_hi[k]), 4)],
+        'rank': int(point_ranks[k]),
+        'rank_median': float(median[k]),
+        'rank_ci': [float(lo[k]), float(hi[k])],
+        'p_top_k': round(float(p_top_k[k]), 4),
+        'blue_ocean': bool(blue_point[k]),
+        'p_blue_ocean': round(float(p_blue[k]), 4),
+        'academic_lead': bool(academic_point[k]),
+        'p_academic_lead': round(float(p_academic[k]), 4),
+    } for k, kw in enumerate(keywords)]
+
+
+def print_tfidf(name, records, top_k=BOOTSTRAP_TOP_K):
+    print(f"\n[{name} TF-IDF 상위 {top_k}개 순위 안정성]")
+    print("-" * 70)
+    print(f"{'순위':>4} | {'키워드':<20} | {'순위 중앙값':>10} | {'신뢰구간':>13} | {'상위 K 확률':>10}")
+    print("-" * 70)
+    for r in records[:top_k]:
+        ci = f"{r['rank_ci'][0]:.0f}~{r['rank_ci'][1]:.0f}"
+        print(f"{r['rank']:>4} | {r['keyword']:<20} | {r['rank_median']:>10.1f} | {ci:>13} | {r['p_top_k']:>10.2f}")
+
+
+def print_gap(title, records, flag, prob):
+    print(f"\n[{title}]")
+    print("-" * 80)
+    print(f"{'키워드':<15} | {'간극':>8} | {'간극 신뢰구간':>17} | {'순위 구간':>9} | {'선정 확률':>8}")
+    print("-" * 80)
+    chosen = [r for r in records if r[flag] or r[prob] >= 0.05]
+    chosen.sort(key=lambda r: -r[prob])
+    if not chosen:
+        print("  (해당 없음)")
+    for r in chosen[:GAP_TOP_N]:
+        mark = '' if r[flag] else ' (신규)'
+        gap_ci = f"{r['gap_ci'][0]:.2f}~{r['gap_ci'][1]:.2f}"
+        rank_ci = f"{r['rank_ci'][0]:.0f}~{r['rank_ci'][1]:.0f}"
+        print(f"{r['keyword']:<15} | {r['gap_index']:>8.2f} | {gap_ci:>17} | {rank_ci:>9} | {r[prob]:>8.2f}{mark}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='부트스트랩 순위 안정성 (TF-IDF / 간극 분석)')
+    parser.add_argument('--replicates', type=int, default=BOOTSTRAP_REPLICATES)
+    parser.add_argument('--workers', type=int, default=BOOTSTRAP_WORKERS)
+    parser.add_argument('--seed', type=int, default=BOOTSTRAP_SEED)
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  부트스트랩 순위 안정성")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('bootstrap_stability')
+
+    with span('load', '코퍼스 저장소'):
+        stores = {source: load_or_build_store(source) for source in SOURCES}
+        gap_path = OUTPUT_DIR / 'gap_analysis.json'
+        gap_keywords = []
+        if gap_path.exists():
+            with open(gap_path, 'r', encoding='utf-8') as f:
+                gap_keywords = [g['keyword'] for g in json.load(f)]
+        else:
+            print("  gap_analysis.json이 없어 간극 분석 안정성은 생략합니다 (Phase 3 실행 필요).")
+
+    # 점추정 (가중치 1) + 추적할 키워드
+    tracked, point_ranks, gap_ids, point_freq = {}, {}, {}, {}
+    with span('score', '점추정'):
+        for source, store in stores.items():
+            doc_freq = np.asarray(store.doc_freq, dtype=np.float64)
+            _, term_freq, _ = weighted_counts(store, np.repeat(np.arange(store.n_docs), np.diff(store.indptr)),
+                                              np.ones(store.n_docs))
+            scores = tfidf_scores(doc_freq, term_freq, store.n_docs)
+            tracked[source] = np.argsort(-scores, kind='stable')[:TFIDF_TOP_N[source]]
+            point_ranks[source] = ranks_of(scores, tracked[source])
+            vocab_index = store.vocab_index
+            gap_ids[source] = np.array([vocab_index.get(kw, -1) for kw in gap_keywords], dtype=np.int64)
+            point_freq[source] = np.where(gap_ids[source] >= 0, doc_freq[np.maximum(gap_ids[source], 0)], 0)
+        point_gap = gap_scores(point_freq['news'], point_freq['paper'], stores['news'].n_docs, stores['paper'].n_docs)
+        blue_point, academic_point = gap_selection(point_freq['news'], point_freq['paper'], point_gap)
+
+    start = time.perf_counter()
+    with span('score', f'부트스트랩 {args.replicates}회', items=args.replicates):
+        result = run_bootstrap(stores, tracked, gap_ids, args.replicates, args.seed, args.workers)
+    elapsed = time.perf_counter() - start
+    print(f"\n재표본 {args.replicates}회 완료: {elapsed:.2f}s ({args.replicates / max(elapsed, 1e-9):.1f}회/초)")
+
+    output = {'replicates': args.replicates, 'seed': args.seed, 'ci': BOOTSTRAP_CI, 'top_k': BOOTSTRAP_TOP_K}
+    for source, name in (('news', '뉴스'), ('paper', '논문')):
+        records = tfidf_stability(stores[source], tracked[source], point_ranks[source],
+                                  result['tfidf_ranks'][source], TFIDF_TOP_N[source])
+        output[f'{source}_tfidf'] = records
+        print_tfidf(name, records)
+
+    if gap_keywords:
+        records = gap_stability(gap_keywords, point_gap, blue_point, academic_point, result)
+        output['gap'] = records
+        print_gap("블루오션 후보 선정 확률 (신규: 점추정에서는 제외)", records, 'blue_ocean', 'p_blue_ocean')
+        print_gap("학술선도 후보 선정 확률 (신규: 점추정에서는 제외)", records, 'academic_lead', 'p_academic_lead')
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'bootstrap_stability.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  부트스트랩 안정성 분석 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
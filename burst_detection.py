@@ -0,0 +1,237 @@
+"""
+뉴스 키워드 버스트(급증) 탐지
+- 카테고리 × 기간 집계 큐브(category_cube.py)에서 기간 × 키워드 기사 비율 행렬 생성
+- 이동 구간(직전 BURST_WINDOW 기간) 평균/표준편차 기준 z-점수를 전체 키워드에 대해 한 번에 계산
+  (누적합 기반, 표준편차 하한은 이항 비율 표준오차 → 저빈도 키워드의 과잉 탐지 방지)
+- 연속된 버스트 기간을 구간으로 묶어 강도(최대 z, 초과 기사 수) 산출
+- 같은 연도의 논문 수와 결합 → 뉴스만 급증하고 논문은 정체된 키워드를 조기 경보로 표시
+"""
+
+import argparse
+import json
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, PAPER_FILE, NEWS_EXCLUDE_CATEGORIES, PAPER_YEAR_FIELD,
+    BURST_WINDOW, BURST_Z, BURST_MIN_COUNT, BURST_PAPER_GROWTH, BURST_TOP_N,
+    CUBE_UNKNOWN_PERIOD,
+    normalize_keyword, is_valid_keyword, init_dirs
+)
+from category_cube import load_or_build_cube
+from profiling import span, start_run, finish_run
+
+
+def period_series(cube, mask):
+    """선택한 셀 → 기간 × 키워드 문서 빈도 행렬 + 기간별 기사 수
+
+    Returns:
+        periods: list[str] (정렬, 날짜 미상 제외)
+        counts: np.ndarray (기간 수 × 키워드 수)
+        docs: np.ndarray (기간별 기사 수)
+    """
+    periods = [p for p in cube.periods if p != CUBE_UNKNOWN_PERIOD]
+    period_index = {p: i for i, p in enumerate(periods)}
+    cells = np.nonzero(mask & (cube.cell_period != CUBE_UNKNOWN_PERIOD))[0]
+    rows = np.array([period_index[cube.cell_period[c]] for c in cells], dtype=np.int64)
+
+    assign = sparse.csr_matrix((np.ones(len(cells)), (rows, cells)), shape=(len(periods), len(cube.cells)))
+    counts = (assign @ cube.df).toarray()
+    docs = assign @ cube.cell_docs.astype(np.float64)
+    return periods, counts, docs
+
+
+def rolling_zscores(counts, docs, window=BURST_WINDOW):
+    """기간별 기사 비율의 이동 구간 z-점수 (직전 window 기간 기준, 전체 키워드 벡터화)
+
+    Returns:
+        z: np.ndarray (기간 수 × 키워드 수, 기준 구간이 부족한 앞부분은 0)
+        expected: np.ndarray (기준선 기대 기사 수)
+    """
+    rate = np.divide(counts, docs[:, None], out=np.zeros_like(counts, dtype=np.float64),
+                     where=docs[:, None] > 0)
+    zeros = np.zeros((1, rate.shape[1]))
+    csum = np.vstack([zeros, np.cumsum(rate, axis=0)])
+    csum_sq = np.vstack([zeros, np.cumsum(rate ** 2, axis=0)])
+
+    n_periods = rate.shape[0]
+    z = np.zeros_like(rate)
+    expected = np.zeros_like(rate)
+    if n_periods <= window:
+        return z, expected
+
+    t = np.arange(window, n_periods)
+    mean = (csum[t] - csum[t - window]) / window
+    var = np.maximum((csum_sq[t] - csum_sq[t - window]) / window - mean ** 2, 0)
+    # 표준편차 하한: 이항 비율 표준오차 (기준선 비율에서 해당 기간 기사 수로 관측될 때의 변동)
+    binomial = np.maximum(mean, 1 / docs.sum()) * (1 - mean) / np.maximum(docs[t, None], 1)
+    std = np.sqrt(np.maximum(var, binomial))
+
+    z[t] = (rate[t] - mean) / std
+    expected[t] = mean * docs[t, None]
+    return z, expected
+
+
+def burst_intervals(z, counts, expected, threshold=BURST_Z, min_count=BURST_MIN_COUNT):
+    """연속 버스트 기간 → 구간 (키워드, 시작, 끝, 최대 z, 초과 기사 수)
+
+    Returns:
+        np.ndarray 구조 배열
+    """
+    burst = (z >= threshold) & (counts >= min_count)
+    padded = np.vstack([np.zeros((1, burst.shape[1]), dtype=bool), burst,
+                        np.zeros((1, burst.shape[1]), dtype=bool)]).astype(np.int8)
+    change = np.diff(padded, axis=0)
+    # 키워드 순으로 정렬된 시작/끝 위치 (전치 후 nonzero)
+    start_kw, start_t = np.nonzero(change.T == 1)
+    _, end_t = np.nonzero(change.T == -1)
+
+    intervals = np.zeros(len(start_kw), dtype=[('keyword', np.int64), ('start', np.int64), ('end', np.int64),
+                                                ('peak_z', np.float64), ('excess', np.float64),
+                                                ('count', np.int64)])
+    if len(start_kw) == 0:
+        return intervals
+
+    # 구간별 최대 z / 초과 기사 수: 버스트 위치를 구간 번호로 묶어 reduceat
+    burst_kw, burst_t = np.nonzero(burst.T)
+    z_vals = z[burst_t, burst_kw]
+    excess = counts[burst_t, burst_kw] - expected[burst_t, burst_kw]
+    seg = np.r_[0, np.cumsum(end_t - start_t)[:-1]]
+
+    intervals['keyword'] = start_kw
+    intervals['start'] = start_t
+    intervals['end'] = end_t - 1
+    intervals['peak_z'] = np.maximum.reduceat(z_vals, seg)
+    intervals['excess'] = np.add.reduceat(excess, seg)
+    intervals['count'] = np.add.reduceat(counts[burst_t, burst_kw], seg).astype(np.int64)
+    return intervals
+
+
+def paper_counts_by_year(vocab_index, year_field=PAPER_YEAR_FIELD):
+    """논문 연도 × 키워드 문서 수 (연도 필드가 없으면 None)
+
+    Returns:
+        years: list[str], counts: scipy.sparse.csr_matrix (연도 수 × 큐브 어휘 수) 또는 (None, None)
+    """
+    with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    year_index = {}
+    rows, cols = [], []
+    for item in data['NODE_LIST']:
+        year, kywd = item.get(year_field), item.get('KYWD')
+        if not year or not kywd:
+            continue
+        keywords = {normalize_keyword(k.strip()) for k in str(kywd).split(',') if k.strip()}
+        ids = [vocab_index[k] for k in keywords if is_valid_keyword(k) and k in vocab_index]
+        y = year_index.setdefault(str(year)[:4], len(year_index))
+        rows.extend([y] * len(ids))
+        cols.extend(ids)
+
+    if not year_index:
+        return None, None
+    counts = sparse.csr_matrix((np.ones(len(rows)), (rows, cols)),
+                               shape=(len(year_index), len(vocab_index)))
+    years = [None] * len(year_index)
+    for year, i in year_index.items():
+        years[i] = year
+    return years, counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 키워드 버스트 탐지')
+    parser.add_argument('--categories', nargs='+', help='포함할 카테고리 (통합 분류1)')
+    parser.add_argument('--exclude', nargs='+', help='제외할 카테고리 (기본값: config.NEWS_EXCLUDE_CATEGORIES)')
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  뉴스 키워드 버스트(급증) 탐지")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('burst_detection')
+
+    with span('load', '집계 큐브'):
+        cube = load_or_build_cube()
+    exclude = args.exclude if args.exclude is not None else NEWS_EXCLUDE_CATEGORIES
+    mask = cube.select(categories=args.categories, exclude=exclude)
+
+    with span('normalize', '기간별 시계열'):
+        periods, counts, docs = period_series(cube, mask)
+    print(f"\n기간 수: {len(periods):,} ({cube.unit}) / 키워드 시계열 수: {counts.shape[1]:,}")
+
+    with span('score', '버스트 탐지', items=counts.shape[1]):
+        z, expected = rolling_zscores(counts, docs)
+        intervals = burst_intervals(z, counts, expected)
+    print(f"버스트 구간 수 (z ≥ {BURST_Z}, 기사 ≥ {BURST_MIN_COUNT}): {len(intervals):,}")
+
+    with span('load', '논문 연도별 빈도'):
+        years, paper_counts = paper_counts_by_year(cube.vocab_index)
+    if years is None:
+        print(f"  논문 연도 필드({PAPER_YEAR_FIELD})가 없어 논문 수는 결합하지 않습니다.")
+    year_index = {y: i for i, y in enumerate(years or [])}
+    if paper_counts is not None:
+        paper_counts = paper_counts.tocsc()
+
+    order = np.argsort(-intervals['peak_z'], kind='stable')[:BURST_TOP_N]
+    bursts = []
+    for k in order:
+        iv = intervals[k]
+        kw = int(iv['keyword'])
+        record = {
+            'keyword': cube.vocab[kw],
+            'start': periods[iv['start']],
+            'end': periods[iv['end']],
+            'peak_z': round(float(iv['peak_z']), 3),
+            'news_count': int(iv['count']),
+            'excess_count': round(float(iv['excess']), 1),
+        }
+        # 같은 연도의 논문 수와 직전 연도 대비 증가율
+        year = periods[iv['end']][:4]
+        if year in year_index:
+            series = paper_counts[:, kw].toarray().ravel()
+            current = series[year_index[year]]
+            previous = [series[year_index[y]] for y in sorted(year_index) if y < year]
+            baseline = np.mean(previous[-3:]) if previous else 0
+            growth = current / baseline if baseline > 0 else None
+            record['paper_year'] = year
+            record['paper_count'] = int(current)
+            record['paper_growth'] = round(float(growth), 3) if growth is not None else None
+            record['early_warning'] = bool(growth is not None and growth < BURST_PAPER_GROWTH)
+        bursts.append(record)
+
+    print("\n[버스트 상위 키워드]")
+    print("-" * 80)
+    print(f"{'키워드':<20} | {'구간':<17} | {'최대 z':>7} | {'기사 수':>8} | {'초과':>8} | {'논문':>6}")
+    print("-" * 80)
+    for b in bursts[:20]:
+        span_label = b['start'] if b['start'] == b['end'] else f"{b['start']}~{b['end']}"
+        paper = f"{b['paper_count']:,}" if 'paper_count' in b else '-'
+        flag = ' ⚠' if b.get('early_warning') else ''
+        print(f"{b['keyword']:<20} | {span_label:<17} | {b['peak_z']:>7.2f} | {b['news_count']:>8,} | "
+              f"{b['excess_count']:>8.1f} | {paper:>6}{flag}")
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'burst_detection.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'periods': periods,
+                'window': BURST_WINDOW,
+                'z_threshold': BURST_Z,
+                'n_intervals': int(len(intervals)),
+                'bursts': bursts,
+                'early_warnings': [b['keyword'] for b in bursts if b.get('early_warning')],
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  버스트 탐지 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,338 @@
+"""
+뉴스 카테고리(통합 분류1) × 기간 집계 큐브
+- 뉴스 원본을 한 번만 읽어 (카테고리, 기간) 셀 × 키워드 문서 빈도(DF)/출현 빈도(TF) 희소 행렬로 저장
+- 카테고리 부분집합/제외 목록/기간 조건은 셀 선택 → 행 합산으로 처리 (원본 재로딩 없음)
+- 조회: 상위 키워드, TF-IDF (Phase 2와 같은 식), 논문 대비 간극 지수 (Phase 3 calculate_gap_index와 같은 정의)
+- 메타에 서명(뉴스 코퍼스 저장소 서명 + 기간 단위) 저장 → 원본/정규화 설정/CUBE_PERIOD가 바뀌면 다시 생성
+
+사용법:
+    python category_cube.py                      # 큐브 생성 + 기본 제외 목록 기준 요약
+    python category_cube.py --query --exclude 정치>선거 --periods 2023-01 2023-02
+"""
+
+import argparse
+import json
+import time
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    NEWS_FILES, OUTPUT_DIR, NEWS_EXCLUDE_CATEGORIES,
+    NEWS_CATEGORY_COLUMN, NEWS_DATE_COLUMN,
+    CUBE_PERIOD, CUBE_UNKNOWN_PERIOD, VIZ_TOP_N,
+    normalize_keyword, is_valid_keyword, init_dirs
+)
+from corpus import load_or_build_store, store_signature
+from profiling import span, start_run, finish_run
+
+
+CUBE_PATH = OUTPUT_DIR / 'category_cube.npz'
+CUBE_META_PATH = OUTPUT_DIR / 'category_cube_meta.json'
+
+
+def cube_signature(unit=CUBE_PERIOD):
+    """큐브 내용을 결정하는 설정 (뉴스 코퍼스 저장소 서명 + 기간 단위)"""
+    return {**store_signature('news'), 'unit': unit}
+
+
+def to_periods(values, unit=CUBE_PERIOD):
+    """날짜 컬럼 → 기간 문자열 배열 (YYYYMMDD 정수, 문자열, datetime 모두 지원)"""
+    import pandas as pd
+
+    values = pd.Series(values)
+    if pd.api.types.is_numeric_dtype(values):
+        dates = pd.to_datetime(values.astype('Int64').astype(str), format='%Y%m%d', errors='coerce')
+    else:
+        dates = pd.to_datetime(values, errors='coerce')
+
+    if unit == 'year':
+        periods = dates.dt.year.astype('Int64').astype(str)
+    elif unit == 'quarter':
+        periods = dates.dt.year.astype('Int64').astype(str) + 'Q' + dates.dt.quarter.astype('Int64').astype(str)
+    else:
+        periods = dates.dt.strftime('%Y-%m')
+    return np.where(dates.isna(), CUBE_UNKNOWN_PERIOD, periods.astype(str))
+
+
+def _doc_keywords(raw):
+    """키워드 문자열 → 정규화/불용어 제거된 키워드 목록 (중복 포함, Phase 3과 같은 정제)"""
+    keywords = [normalize_keyword(k.strip()) for k in str(raw).split(',') if k.strip()]
+    return [k for k in keywords if is_valid_keyword(k)]
+
+
+def build_cube(files=NEWS_FILES, unit=CUBE_PERIOD):
+    """뉴스 파일 → 집계 큐브
+
+    Returns:
+        CategoryCube
+    """
+    # 원본 엑셀을 읽는 생성 단계에서만 pandas 필요 (저장된 큐브 조회는 pandas 없이 동작)
+    import pandas as pd
+
+    vocab_index = {}
+    cell_index = {}
+    codes, tf = [], []      # 파일별 (셀 << 32 | 키워드) 코드 / 출현 빈도
+    cell_docs = []
+
+    for file in files:
+        with span('load', file) as s:
+            df = pd.read_excel(file, usecols=[NEWS_CATEGORY_COLUMN, NEWS_DATE_COLUMN, '키워드'])
+            s.items = len(df)
+
+        with span('normalize', file) as s:
+            categories = df[NEWS_CATEGORY_COLUMN].fillna('').astype(str).to_numpy()
+            periods = to_periods(df[NEWS_DATE_COLUMN], unit)
+            file_codes, file_tf = [], []
+            for category, period, raw in zip(categories, periods, df['키워드']):
+                if pd.isna(raw):
+                    continue
+                keywords = _doc_keywords(raw)
+                if not keywords:
+                    continue
+                cell = cell_index.setdefault((category, period), len(cell_index))
+                if cell == len(cell_docs):
+                    cell_docs.append(0)
+                cell_docs[cell] += 1
+
+                counts = {}
+                for kw in keywords:
+                    kid = vocab_index.setdefault(kw, len(vocab_index))
+                    counts[kid] = counts.get(kid, 0) + 1
+                file_codes.extend((cell << 32) | kid for kid in counts)
+                file_tf.extend(counts.values())
+            s.items = len(df)
+
+        with span('count', file) as s:
+            # 파일 단위로 같은 (셀, 키워드) 집계 → 메모리는 고유 조합 수에 비례
+            file_codes = np.array(file_codes, dtype=np.int64)
+            unique, inverse, df_counts = np.unique(file_codes, return_inverse=True, return_counts=True)
+            codes.append(unique)
+            tf.append(np.stack([df_counts, np.bincount(inverse, weights=file_tf).astype(np.int64)]))
+            s.items = len(file_codes)
+
+    codes = np.concatenate(codes) if codes else np.empty(0, dtype=np.int64)
+    counts = np.concatenate(tf, axis=1) if tf else np.empty((2, 0), dtype=np.int64)
+    shape = (len(cell_index), len(vocab_index))
+    rows, cols = (codes >> 32).astype(np.int32), (codes & 0xFFFFFFFF).astype(np.int32)
+    df_matrix = sparse.csr_matrix((counts[0], (rows, cols)), shape=shape, dtype=np.int64)
+    tf_matrix = sparse.csr_matrix((counts[1], (rows, cols)), shape=shape, dtype=np.int64)
+
+    vocab = [None] * len(vocab_index)
+    for kw, i in vocab_index.items():
+        vocab[i] = kw
+    cells = [None] * len(cell_index)
+    for key, i in cell_index.items():
+        cells[i] = key
+
+    return CategoryCube(df_matrix, tf_matrix, np.array(cell_docs, dtype=np.int64), cells, vocab, unit)
+
+
+class CategoryCube:
+    """(카테고리, 기간) 셀 × 키워드 DF/TF 희소 큐브"""
+
+    def __init__(self, df_matrix, tf_matrix, cell_docs, cells, vocab, unit=CUBE_PERIOD):
+        self.df = df_matrix.tocsr()
+        self.tf = tf_matrix.tocsr()
+        self.cell_docs = cell_docs
+        self.cells = [tuple(c) for c in cells]
+        self.vocab = list(vocab)
+        self.vocab_index = {kw: i for i, kw in enumerate(self.vocab)}
+        self.unit = unit
+        self.cell_category = np.array([c[0] for c in self.cells], dtype=object)
+        self.cell_period = np.array([c[1] for c in self.cells], dtype=object)
+
+    @property
+    def categories(self):
+        return sorted(set(self.cell_category))
+
+    @property
+    def periods(self):
+        return sorted(set(self.cell_period))
+
+    def select(self, categories=None, exclude=None, periods=None):
+        """조건에 맞는 셀 선택 마스크 (None이면 조건 없음)"""
+        mask = np.ones(len(self.cells), dtype=bool)
+        if categories is not None:
+            mask &= np.isin(self.cell_category, list(categories))
+        if exclude is not None:
+            mask &= ~np.isin(self.cell_category, list(exclude))
+        if periods is not None:
+            mask &= np.isin(self.cell_period, list(periods))
+        return mask
+
+    def n_docs(self, mask):
+        return int(self.cell_docs[mask].sum())
+
+    def doc_freq(self, mask):
+        """선택한 셀의 키워드별 문서 빈도 (셀 행 합산)"""
+        return np.asarray(self.df[np.nonzero(mask)[0]].sum(axis=0)).ravel()
+
+    def term_freq(self, mask):
+        """선택한 셀의 키워드별 출현 빈도"""
+        return np.asarray(self.tf[np.nonzero(mask)[0]].sum(axis=0)).ravel()
+
+    def top_keywords(self, mask, n=VIZ_TOP_N):
+        freq = self.doc_freq(mask)
+        top = np.argsort(-freq, kind='stable')[:n]
+        return [(self.vocab[i], int(freq[i])) for i in top if freq[i] > 0]
+
+    def tfidf(self, mask, n=VIZ_TOP_N):
+        """선택한 셀 전체를 한 문서 집합으로 본 키워드 TF-IDF (Phase 2 calculate_tfidf와 같은 식: TF × (log(N / DF) + 1))"""
+        n_docs = self.n_docs(mask)
+        df = self.doc_freq(mask)
+        tf = self.term_freq(mask)
+        score = np.zeros(len(self.vocab))
+        present = df > 0
+        score[present] = tf[present] * (np.log(n_docs / df[present]) + 1)
+        top = np.argsort(-score, kind='stable')[:n]
+        return [(self.vocab[i], round(float(score[i]), 6)) for i in top if score[i] > 0]
+
+    def gap_index(self, mask, paper_vocab, paper_freq, n_paper):
+        """논문 대비 간극 지수 (1000건당 비율 차이, Phase 3 calculate_gap_index와 같은 정의)
+
+        Returns:
+            list[dict] (간극 지수 내림차순)
+        """
+        n_news = self.n_docs(mask)
+        # 공통 키워드 공간: 큐브 어휘 + 논문에만 있는 키워드
+        paper_ids = np.array([self.vocab_index.get(kw, -1) for kw in paper_vocab], dtype=np.int64)
+        paper_only = np.nonzero(paper_ids < 0)[0]
+        paper_ids[paper_only] = len(self.vocab) + np.arange(len(paper_only))
+        keywords = self.vocab + [paper_vocab[i] for i in paper_only]
+
+        news = np.concatenate([self.doc_freq(mask), np.zeros(len(paper_only), dtype=np.int64)])
+        paper = np.zeros(len(keywords), dtype=np.int64)
+        paper[paper_ids] = paper_freq
+        keep = (news > 0) | (paper > 0)
+        news_ratio = news / n_news * 1000 if n_news else np.zeros(len(keywords))
+        paper_ratio = paper / n_paper * 1000 if n_paper else np.zeros(len(keywords))
+        gap = news_ratio - paper_ratio
+
+        order = [i for i in np.argsort(-gap, kind='stable') if keep[i]]
+        return [{
+            'keyword': keywords[i],
+            'news_freq': int(news[i]),
+            'paper_freq': int(paper[i]),
+            'news_ratio': round(float(news_ratio[i]), 4),
+            'paper_ratio': round(float(paper_ratio[i]), 4),
+            'gap_index': round(float(gap[i]), 4),
+        } for i in order]
+
+    def save(self, path=CUBE_PATH, meta_path=CUBE_META_PATH):
+        np.savez_compressed(
+            path,
+            df_data=self.df.data, df_indices=self.df.indices, df_indptr=self.df.indptr,
+            tf_data=self.tf.data, tf_indices=self.tf.indices, tf_indptr=self.tf.indptr,
+            cell_docs=self.cell_docs, shape=np.array(self.df.shape),
+        )
+        with open(meta_path, 'w', encoding='utf-8') as f:
+            json.dump({'unit': self.unit, 'signature': cube_signature(self.unit),
+                       'cells': self.cells, 'vocab': self.vocab}, f, ensure_ascii=False)
+        print(f"  저장: {path}")
+        print(f"  저장: {meta_path}")
+
+    @classmethod
+    def load(cls, path=CUBE_PATH, meta_path=CUBE_META_PATH):
+        data = np.load(path)
+        shape = tuple(data['shape'])
+        df_matrix = sparse.csr_matrix((data['df_data'], data['df_indices'], data['df_indptr']), shape=shape)
+        tf_matrix = sparse.csr_matrix((data['tf_data'], data['tf_indices'], data['tf_indptr']), shape=shape)
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return cls(df_matrix, tf_matrix, data['cell_docs'], meta['cells'], meta['vocab'], meta['unit'])
+
+
+def load_or_build_cube():
+    """저장된 큐브 로드, 없거나 원본 파일/정규화 설정/CUBE_PERIOD가 바뀌었으면 새로 생성 후 저장"""
+    if CUBE_PATH.exists() and CUBE_META_PATH.exists():
+        with open(CUBE_META_PATH, 'r', encoding='utf-8') as f:
+            signature = json.load(f).get('signature')
+        if signature == cube_signature():
+            return CategoryCube.load()
+        print("  설정 또는 원본 파일이 바뀌어 뉴스 집계 큐브를 다시 생성합니다...")
+    else:
+        print("  뉴스 집계 큐브를 새로 생성합니다...")
+    cube = build_cube()
+    cube.save()
+    return cube
+
+
+def print_query(cube, mask, label, top_n=VIZ_TOP_N):
+    """선택한 셀의 상위 키워드 / TF-IDF / 간극 지수 출력"""
+    print(f"\n[{label}] 기사 수: {cube.n_docs(mask):,} / 셀 수: {int(mask.sum()):,}")
+
+    start = time.perf_counter()
+    top = cube.top_keywords(mask, top_n)
+    tfidf = cube.tfidf(mask, top_n)
+    paper = load_or_build_store('paper')
+    gap = cube.gap_index(mask, paper.vocab, paper.doc_freq, paper.n_docs)
+    elapsed = (time.perf_counter() - start) * 1000
+
+    print(f"  상위 키워드: {', '.join(f'{kw}({cnt:,})' for kw, cnt in top[:10])}")
+    print(f"  TF-IDF 상위: {', '.join(kw for kw, _ in tfidf[:10])}")
+    print(f"  간극 상위 (블루오션 후보): {', '.join(g['keyword'] for g in gap[:10])}")
+    print(f"  조회 시간: {elapsed:.1f}ms")
+    return {'n_docs': cube.n_docs(mask), 'top_keywords': top, 'tfidf': tfidf, 'gap_analysis': gap[:top_n]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 카테고리 × 기간 집계 큐브')
+    parser.add_argument('--query', action='store_true', help='기존 큐브로 조회만 수행 (없으면 생성)')
+    parser.add_argument('--categories', nargs='+', help='포함할 카테고리 (통합 분류1)')
+    parser.add_argument('--exclude', nargs='+', help='제외할 카테고리 (기본값: config.NEWS_EXCLUDE_CATEGORIES)')
+    parser.add_argument('--periods', nargs='+', help='포함할 기간 (예: 2023-01, 2023Q1, 2023)')
+    parser.add_argument('--top', type=int, default=VIZ_TOP_N, help='출력 키워드 수')
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  뉴스 카테고리 × 기간 집계 큐브")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('category_cube')
+
+    if args.query:
+        with span('load', '큐브'):
+            cube = load_or_build_cube()
+    else:
+        cube = build_cube()
+        with span('save', '큐브'):
+            cube.save()
+
+    print(f"\n셀 수: {len(cube.cells):,} (카테고리 {len(cube.categories):,} × 기간 {len(cube.periods):,})"
+          f" / 키워드 수: {len(cube.vocab):,} / 기사 수: {int(cube.cell_docs.sum()):,}")
+
+    exclude = args.exclude if args.exclude is not None else NEWS_EXCLUDE_CATEGORIES
+    mask = cube.select(categories=args.categories, exclude=exclude, periods=args.periods)
+    with span('score', '조회'):
+        result = print_query(cube, mask, '선택 조건', args.top)
+
+    if not args.query:
+        print("\n[카테고리별 기사 수 / 상위 키워드]")
+        for category in cube.categories:
+            cat_mask = cube.select(categories=[category])
+            top = cube.top_keywords(cat_mask, 5)
+            print(f"  {category:<20} {cube.n_docs(cat_mask):>9,}건 | {', '.join(kw for kw, _ in top)}")
+
+    with span('save', '조회 결과'):
+        output_path = OUTPUT_DIR / 'category_cube_query.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'categories': args.categories,
+                'exclude': exclude,
+                'periods': args.periods,
+                **result,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  집계 큐브 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,189 @@
+"""
+키워드 카테고리 자동 할당
+- config.KEYWORD_CATEGORIES(약 50개)를 시드로 전체 어휘에 카테고리 전파
+- 뉴스/논문 동시 출현 행렬을 공통 어휘로 합친 그래프 사용 (코퍼스별 문서 수로 정규화)
+- 방법 1 (propagation): 희소 라벨 전파 F ← α·S·F + (1-α)·Y, S = D^-1/2 W D^-1/2
+- 방법 2 (centroid): PPMI + SVD 임베딩 공간에서 카테고리 중심점과의 코사인 최댓값
+- 결과(output/keyword_categories.json)는 Phase 4 카테고리별 간극 차트에서 사용
+"""
+
+import json
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, KEYWORD_CATEGORIES,
+    CATEGORY_METHOD, CATEGORY_MIN_FREQ, CATEGORY_ALPHA, CATEGORY_MIN_CONFIDENCE,
+    CATEGORY_UNASSIGNED, NETWORK_MAX_ITER,
+    init_dirs
+)
+from cooccurrence_external import load_or_build_cooccurrence_matrix
+from embedding import keyword_vectors
+from profiling import span, start_run, finish_run
+
+
+def joint_graph(news, paper, min_freq=CATEGORY_MIN_FREQ):
+    """뉴스/논문 동시 출현 행렬 → 공통 어휘 그래프 (각 코퍼스 문서 수로 정규화 후 합산)
+
+    Returns:
+        graph: scipy.sparse.csr_matrix
+        vocab: list[str]
+        freq: np.ndarray (뉴스+논문 문서 빈도)
+    """
+    vocab = sorted(set(news[1]) | set(paper[1]))
+    index = {kw: i for i, kw in enumerate(vocab)}
+    graph = sparse.csr_matrix((len(vocab), len(vocab)), dtype=np.float64)
+    freq = np.zeros(len(vocab), dtype=np.int64)
+
+    for matrix, source_vocab, keyword_freq, n_docs in (news, paper):
+        ids = np.array([index[kw] for kw in source_vocab], dtype=np.int64)
+        coo = matrix.tocoo()
+        graph = graph + sparse.csr_matrix(
+            (coo.data / max(n_docs, 1), (ids[coo.row], ids[coo.col])), shape=graph.shape)
+        freq[ids] += keyword_freq
+
+    keep = np.nonzero(freq >= min_freq)[0]
+    return graph[keep][:, keep].tocsr(), [vocab[i] for i in keep], freq[keep]
+
+
+def seed_matrix(vocab, categories=KEYWORD_CATEGORIES):
+    """시드 라벨 행렬 Y (키워드 × 카테고리)"""
+    index = {kw: i for i, kw in enumerate(vocab)}
+    y = np.zeros((len(vocab), len(categories)))
+    for c, keywords in enumerate(categories.values()):
+        for kw in keywords:
+            if kw in index:
+                y[index[kw], c] = 1
+    return y
+
+
+def propagate_labels(graph, y, alpha=CATEGORY_ALPHA, max_iter=NETWORK_MAX_ITER, tol=1e-8):
+    """희소 라벨 전파 (Zhou et al. label spreading)
+
+    - 시드 수가 많은 카테고리가 전체를 잠식하지 않도록 카테고리별 시드 질량을 1로 정규화
+    - 전파 후 카테고리별 점수 합도 정규화 (class mass normalization)
+    """
+    seed_mass = y.sum(axis=0)
+    y = y / np.where(seed_mass > 0, seed_mass, 1)
+    degree = np.asarray(graph.sum(axis=1)).ravel()
+    inv_sqrt = np.zeros_like(degree)
+    inv_sqrt[degree > 0] = 1 / np.sqrt(degree[degree > 0])
+    s = (sparse.diags(inv_sqrt) @ graph @ sparse.diags(inv_sqrt)).tocsr()
+
+    f = y.copy()
+    for _ in range(max_iter):
+        new_f = alpha * (s @ f) + (1 - alpha) * y
+        if np.abs(new_f - f).max() < tol:
+            f = new_f
+            break
+        f = new_f
+
+    # 카테고리별 질량 정규화 (연결이 많은 카테고리로 쏠리는 현상 보정)
+    mass = f.sum(axis=0)
+    return f / np.where(mass > 0, mass, 1)
+
+
+def centroid_scores(graph, freq, y):
+    """임베딩 공간의 카테고리 중심점 코사인 유사도 (음수는 0)"""
+    vectors, _ = keyword_vectors(graph, freq, min_freq=0)
+    centroids = y.T @ vectors
+    norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+    centroids = centroids / np.where(norms > 0, norms, 1)
+    return np.maximum(vectors @ centroids.T, 0)
+
+
+def assign_categories(scores, vocab, y, categories=KEYWORD_CATEGORIES,
+                      min_confidence=CATEGORY_MIN_CONFIDENCE):
+    """점수 행렬 → 키워드별 카테고리/신뢰도 (시드 키워드는 원래 카테고리 유지)"""
+    names = list(categories)
+    total = scores.sum(axis=1)
+    best = np.argmax(scores, axis=1)
+    confidence = np.divide(scores[np.arange(len(vocab)), best], total,
+                           out=np.zeros(len(vocab)), where=total > 0)
+
+    is_seed = y.sum(axis=1) > 0
+    best[is_seed] = np.argmax(y[is_seed], axis=1)
+    confidence[is_seed] = 1.0
+
+    result = {}
+    for i, kw in enumerate(vocab):
+        assigned = total[i] > 0 and confidence[i] >= min_confidence
+        result[kw] = {
+            'category': names[best[i]] if assigned else CATEGORY_UNASSIGNED,
+            'confidence': round(float(confidence[i]), 4),
+            'seed': bool(is_seed[i]),
+        }
+    return result
+
+
+def load_keyword_categories():
+    """저장된 키워드 카테고리 로드 (없으면 None)
+
+    Returns:
+        dict[str, str] (키워드 → 카테고리) 또는 None
+    """
+    path = OUTPUT_DIR / 'keyword_categories.json'
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return {kw: v['category'] for kw, v in data['keywords'].items()
+            if v['category'] != CATEGORY_UNASSIGNED}
+
+
+def main():
+    print("\n" + "#" * 60)
+    print("#  키워드 카테고리 자동 할당")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('category_propagation')
+
+    with span('load', '동시 출현 행렬'):
+        news = load_or_build_cooccurrence_matrix('news')
+        paper = load_or_build_cooccurrence_matrix('paper')
+
+    with span('normalize', '공통 그래프'):
+        graph, vocab, freq = joint_graph(news, paper)
+        y = seed_matrix(vocab)
+    print(f"\n키워드 수 (빈도 {CATEGORY_MIN_FREQ} 이상): {len(vocab):,} / 시드: {int(y.sum()):,}개")
+
+    with span('score', CATEGORY_METHOD, items=len(vocab)):
+        if CATEGORY_METHOD == 'centroid':
+            scores = centroid_scores(graph, freq, y)
+        else:
+            scores = propagate_labels(graph, y)
+        keywords = assign_categories(scores, vocab, y)
+
+    summary = {}
+    for v in keywords.values():
+        summary[v['category']] = summary.get(v['category'], 0) + 1
+
+    print(f"\n[카테고리별 키워드 수] ({CATEGORY_METHOD})")
+    for cat in list(KEYWORD_CATEGORIES) + [CATEGORY_UNASSIGNED]:
+        members = sorted((kw for kw, v in keywords.items() if v['category'] == cat and not v['seed']),
+                         key=lambda kw: -keywords[kw]['confidence'])
+        print(f"  {cat:<10} {summary.get(cat, 0):>7,}개 | {', '.join(members[:6])}")
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'keyword_categories.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'method': CATEGORY_METHOD,
+                'min_freq': CATEGORY_MIN_FREQ,
+                'summary': summary,
+                'keywords': keywords,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  카테고리 할당 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
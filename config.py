@@ -23,6 +23,17 @@ NEWS_EXCLUDE_CATEGORIES = [
     '사회>사건_사고',
 ]
 
+# 뉴스 컬럼 (카테고리/날짜 집계 큐브용)
+NEWS_CATEGORY_COLUMN = '통합 분류1'
+NEWS_DATE_COLUMN = '일자'
+
+# 제목 컬럼/필드 (제목 형태소 분석용)
+NEWS_TITLE_COLUMN = '제목'
+PAPER_TITLE_FIELD = 'TITLE'
+
+# 논문 발행 연도 필드 (NODE_LIST 항목, 버스트 탐지 시 연도별 논문 수 집계용)
+PAPER_YEAR_FIELD = 'PUB_YEAR'
+
 # 출력 경로
 OUTPUT_DIR = Path('output')
 VIZ_DIR = Path('visualizations')
@@ -45,10 +56,178 @@ GAP_NEWS_MIN_FREQ = 100     # 블루오션 판정 시 뉴스 최소 빈도
 GAP_PAPER_MIN_FREQ = 50     # 학술선도 판정 시 논문 최소 빈도
 GAP_BLUE_OCEAN_THRESHOLD = 5    # 블루오션 간극 지수 기준 (이상)
 GAP_ACADEMIC_THRESHOLD = -1     # 학술선도 간극 지수 기준 (이하)
+GAP_TOP_N = 20                  # 블루오션/학술선도 후보 표시 개수
+
+# 간극 분석 기준 스윕 (gap_sweep.py, 모든 조합을 한 번에 평가)
+GAP_SWEEP_NEWS_MIN_FREQ = [50, 100, 200, 500]
+GAP_SWEEP_PAPER_MIN_FREQ = [20, 50, 100, 200]
+GAP_SWEEP_BLUE_OCEAN_THRESHOLD = [1, 2, 5, 10, 20]
+GAP_SWEEP_ACADEMIC_THRESHOLD = [-0.5, -1, -2, -5, -10]
+
+# 부트스트랩 순위 안정성 (bootstrap_stability.py, 문서 단위 포아송 가중치 재표본)
+BOOTSTRAP_REPLICATES = 200      # 재표본 반복 수
+BOOTSTRAP_TOP_K = 20            # 포함 확률을 계산할 상위 K (TF-IDF 순위 / 간극 순위)
+BOOTSTRAP_CI = 0.95             # 순위 신뢰구간 수준 (백분위수 구간)
+BOOTSTRAP_SEED = 42             # 재현 가능한 난수 시드 (워커 수와 무관하게 같은 결과)
+BOOTSTRAP_WORKERS = None        # 반복 병렬 프로세스 수 (None: CPU 코어 수)
+BOOTSTRAP_BATCH = 10            # 워커 1개가 한 번에 처리할 반복 수
+
+# 키워드 쌍 간극 분석 (pair_gap.py)
+PAIR_MIN_NEWS_COUNT = 20        # 후보 쌍 최소 뉴스 동시 출현 문서 수
+PAIR_MIN_PAPER_COUNT = 10       # 후보 쌍 최소 논문 동시 출현 문서 수 (둘 중 하나만 만족해도 후보)
+PAIR_MIN_Z = 3.0                # 유의한 쌍으로 볼 두 비율 z-검정 |z| 최솟값
+PAIR_TOP_N = 50                 # 저장할 블루오션/학술선도 쌍 개수
+
+# 2단계 어휘 구축 (vocab_builder.py) - 문서 빈도 범위 밖 키워드를 해시 버킷으로 합쳐 집계 구조 축소
+VOCAB_PRUNE = False             # True: Phase 1 뉴스 / Phase 2 키워드 집계에 min/max-df 가지치기 적용
+VOCAB_MIN_DF = 2                # 최소 문서 빈도 (미만은 해시 버킷으로)
+VOCAB_MAX_DF = 1.0              # 최대 문서 빈도 (1 이하 실수: 문서 비율, 정수: 문서 수)
+VOCAB_OVERFLOW_BUCKETS = 1024   # 가지치기된 키워드를 합산할 해시 버킷 수 (전체 합계 보존)
+VOCAB_BATCH_DOCS = 10_000       # 해시 계산/빈도 표 병합 단위 문서 수
+
+# 상위 N개 키워드 간 동시 출현 분석 (top5_cooccurrence_analysis.py)
+TOP_COOCCUR_N = 5               # 코퍼스별 문서 빈도 상위 키워드 수 (수천 개까지 가능, 희소 행렬로 계산)
+TOP_COOCCUR_PRINT_N = 20        # 콘솔에 출력할 키워드/쌍 수 (저장 결과는 전체)
+
+# 빈발 키워드 집합 마이닝 (itemset_mining.py, Eclat)
+ITEMSET_MIN_SUPPORT = 0.002     # 최소 지지도 (코퍼스 문서 대비 비율)
+ITEMSET_MIN_COUNT = 10          # 최소 지지도 하한 (문서 수, 작은 코퍼스 보호)
+ITEMSET_MAX_LEN = 4             # 최대 집합 크기
+ITEMSET_MAX_ITEMSETS = 1_000_000  # 코퍼스별 최대 수집 집합 수 (초과 시 최소 지지도를 2배로 올려 재탐색, 메모리 상한)
+ITEMSET_COMPARE_N = 1000        # 코퍼스 간 비교에 사용할 코퍼스별 상위 집합 수 (지지도 순)
+ITEMSET_TOP_N = 50              # 저장할 블루오션/학술선도 집합 개수
+
+# 스트리밍 근사 집계 (Phase 1 뉴스 키워드, 스케치 모드)
+PHASE1_SKETCH_MODE = False      # True: Counter 대신 고정 메모리 스케치로 뉴스 키워드 집계
+SKETCH_EPSILON = 1e-5           # Count-Min 상대 오차 (추정 오차 ≤ ε × 전체 키워드 수)
+SKETCH_DELTA = 1e-3             # Count-Min 오차 한계 초과 확률
+SKETCH_CAPACITY = 5000          # Space-Saving 추적 용량 (상위 키워드/쌍 각각)
+SKETCH_HLL_ERROR = 0.01         # HyperLogLog 고유 키워드 수 목표 상대 표준오차
+SKETCH_BATCH_DOCS = 10_000      # 스케치 반영 전 정확 집계할 문서 묶음 크기
+SKETCH_TRACK_PAIRS = True       # 상위 키워드 쌍도 추적
+SKETCH_WORKERS = None           # 파일별 스케치 병렬 프로세스 수 (None: CPU 코어 수)
+
+# 전체 어휘 동시 출현 (외부 메모리 모드)
+COOCCUR_FULL_VOCAB = False      # True: 전체 어휘 동시 출현 행렬 계산 (TOPIC_KEYWORDS 제한 없음)
+COOCCUR_SHARDS = 64             # 쌍 코드 파티션 수 (파티션 1개가 메모리에 올라갈 크기가 되도록 설정)
+COOCCUR_SPILL_BUFFER = 4_000_000  # 디스크로 내보내기 전 버퍼에 모을 쌍 코드 수 (int64, 약 32MB)
+COOCCUR_CHUNK_DOCS = 50_000     # 쌍 생성 시 한 번에 처리할 문서 수
+COOCCUR_WORKERS = None          # 파티션 집계 병렬 프로세스 수 (None: CPU 코어 수)
+COOCCUR_TMP_DIR = None          # 임시 파일 경로 (None: 시스템 기본 임시 디렉토리)
+
+# 제목 형태소 분석 (tokenizer.py)
+TITLE_TOKENS = False            # True: 제목에서 추출한 명사를 문서 키워드에 추가 (Phase 2 TF-IDF, Phase 3 동시 출현)
+TOKENIZER_BACKEND = 'auto'      # 'auto' (kiwipiepy 설치 시 kiwi, 없으면 simple), 'kiwi', 'simple' (순수 Python 명사/n-gram)
+TOKENIZER_NGRAM = 2             # simple: 인접 명사를 이어 붙인 복합어 최대 길이 (1: 복합어 생성 안 함)
+TOKENIZER_CACHE = OUTPUT_DIR / 'tokenizer_cache.sqlite'  # 분석 결과 캐시 (텍스트 해시 → 명사 목록)
+TOKENIZER_WORKERS = None        # 형태소 분석 병렬 프로세스 수 (None: CPU 코어 수)
+TOKENIZER_CHUNK = 2000          # 워커 1개가 한 번에 분석할 제목 수 (이보다 적으면 단일 프로세스)
+
+# 키워드 없는 문서 보완 (keyword_matcher.py, Aho-Corasick 제목 매칭)
+BACKFILL_KEYWORDS = False       # True: 키워드/KYWD가 비어 있는 문서에 제목 매칭으로 추론 키워드 부여 (Phase 2/3)
+BACKFILL_MIN_FREQ = 3           # 패턴으로 사용할 키워드 최소 문서 빈도 (키워드가 있는 문서 기준)
+BACKFILL_MAX_KEYWORDS = 10      # 문서당 최대 추론 키워드 수
+
+# 뉴스 → 논문 검색 (paper_retrieval.py)
+RETRIEVAL_METHOD = 'bm25'       # 'bm25' 또는 'tfidf' (코사인 유사도)
+RETRIEVAL_BM25_K1 = 1.2         # BM25 TF 포화 계수
+RETRIEVAL_BM25_B = 0.75         # BM25 문서 길이 정규화 강도
+RETRIEVAL_USE_TITLES = True     # 논문/뉴스 제목 명사도 색인·질의에 사용 (tokenizer.py, 캐시 재사용)
+RETRIEVAL_TOP_K = 10            # 질의별 반환 논문 수
+RETRIEVAL_BATCH_SIZE = 2048     # 한 번에 행렬곱할 질의 수 (점수 행렬 메모리 결정)
+
+# 메모리 맵 코퍼스 저장소 (워커 프로세스가 복사 없이 공유)
+CORPUS_STORE_DIR = OUTPUT_DIR / 'corpus'  # 소스별 저장소 경로 (output/corpus/<source>/)
+CORPUS_CHUNK_DOCS = 50_000      # 워커 1개가 한 번에 처리할 문서 범위 크기
+CORPUS_WORKERS = None           # 저장소 병렬 질의/집계 프로세스 수 (None: CPU 코어 수)
+
+# 체크포인트 수집 (ingest.py) - 원본을 행 청크 단위로 정규화하고 청크마다 CSR 조각 + 매니페스트 저장
+INGEST_CHECKPOINT = False       # True: Phase 3/코퍼스 저장소가 ingest.py로 원본을 읽음 (중단 시 마지막 완료 청크부터 재개)
+INGEST_CHUNK_ROWS = 50_000      # 청크당 원본 행 수 (뉴스 엑셀 행 / 논문 NODE_LIST 항목)
+INGEST_DIR = OUTPUT_DIR / 'ingest'  # 소스별 조각/매니페스트 경로 (output/ingest/<source>/)
+
+# 표본 미리보기 (preview.py) - 층화 표본으로 설정 변경(SYNONYM_MAP, STOPWORDS 등) 효과를 빠르게 확인
+PREVIEW_FRACTION = 0.05         # 표본 비율 (뉴스: 통합 분류1별 층화, 논문: 단순 무작위)
+PREVIEW_MIN_STRATUM = 2         # 층별 최소 표본 수 (표준오차 계산용, 층이 더 작으면 전수)
+PREVIEW_SEED = 42               # 표본 추출 시드 (같은 시드/비율이면 같은 표본 → 설정 변경 효과만 비교)
+PREVIEW_TOP_N = 50              # 순위 변동을 확인할 TF-IDF 상위 키워드 수
+PREVIEW_Z = 1.96                # 신뢰구간 z 값 (구간이 선정 경계를 넘으면 '변동 가능'으로 표시)
+PREVIEW_DIR = OUTPUT_DIR / 'preview'  # 원본 표본 캐시와 미리보기 결과 (전체 실행 결과는 덮어쓰지 않음)
+
+# 키워드 네트워크 분석 (동시 출현 그래프)
+NETWORK_MIN_FREQ = 5            # 그래프에 포함할 키워드 최소 문서 빈도
+NETWORK_MIN_EDGE_WEIGHT = 2     # 포함할 간선(동시 출현 수) 최솟값
+NETWORK_PAGERANK_DAMPING = 0.85  # PageRank 감쇠 계수
+NETWORK_MAX_ITER = 100          # PageRank / 라벨 전파 최대 반복 횟수
+NETWORK_TOP_N = 50              # 결과에 저장할 중심성 상위 키워드 수
+NETWORK_SEED = 42               # 라벨 전파 난수 시드
+
+# 키워드 임베딩 (PPMI + 절단 SVD)
+EMBED_DIM = 100                 # 임베딩 차원
+EMBED_MIN_FREQ = 5              # 임베딩할 키워드 최소 문서 빈도
+EMBED_CONTEXT_ALPHA = 0.75      # 문맥 빈도 평활 지수 (PPMI)
+EMBED_OVERSAMPLE = 10           # 무작위 SVD 추가 샘플 차원
+EMBED_POWER_ITER = 4            # 무작위 SVD 거듭제곱 반복 횟수
+EMBED_QUANTIZE = False          # 최근접 이웃 인덱스를 int8로 양자화 (메모리 1/4)
+EMBED_BLOCK_SIZE = 8192         # 최근접 이웃 검색 블록 크기 (어휘 행 수)
+EMBED_TOP_K = 20                # 유사 키워드 검색 개수
+EMBED_SEED = 42
+
+# 의미 변화(drift) 분석: 뉴스/논문 공통 키워드의 동시 출현 맥락 비교
+DRIFT_MIN_FREQ = 10             # 뉴스/논문 각각 최소 문서 빈도
+DRIFT_TOP_K = 20                # 맥락 비교에 사용할 상위 이웃 수 (Jaccard)
+DRIFT_TOP_N = 50                # 결과에 저장할 상위 키워드 수
+
+# 토픽 모델링 (미니배치 온라인 NMF, 뉴스+논문 공통 어휘)
+TOPIC_N_TOPICS = 30             # 토픽 수
+TOPIC_MIN_DF = 5                # 어휘 최소 문서 빈도
+TOPIC_MAX_DF_RATIO = 0.5        # 어휘 최대 문서 비율 (너무 흔한 키워드 제외)
+TOPIC_BATCH_SIZE = 4096         # 미니배치 문서 수 (뉴스/논문 절반씩)
+TOPIC_EPOCHS = 3                # 학습 반복 (큰 코퍼스 기준 1 epoch)
+TOPIC_INNER_ITER = 10           # 배치별 문서-토픽 가중치 갱신 횟수
+TOPIC_DECAY = 0.7               # 이전 배치 통계 감쇠율
+TOPIC_TOP_WORDS = 15            # 토픽별 대표 키워드 수
+TOPIC_WORKERS = None            # 문서별 토픽 비중 계산 프로세스 수 (None: CPU 코어 수)
+TOPIC_SEED = 42
+
+# 키워드 카테고리 자동 할당 (KEYWORD_CATEGORIES를 시드로 전파)
+CATEGORY_METHOD = 'propagation'     # 'propagation': 동시 출현 그래프 라벨 전파 / 'centroid': 임베딩 중심점
+CATEGORY_MIN_FREQ = 10              # 카테고리를 할당할 키워드 최소 문서 빈도 (뉴스+논문)
+CATEGORY_ALPHA = 0.9                # 라벨 전파 시 이웃 정보 비중 (1 - alpha: 시드 유지 비중)
+CATEGORY_MIN_CONFIDENCE = 0.0       # 이 값 미만의 신뢰도는 '미분류'
+CATEGORY_UNASSIGNED = '미분류'
+
+# 뉴스 카테고리 × 기간 집계 큐브
+CUBE_PERIOD = 'month'               # 기간 단위: 'year' / 'quarter' / 'month'
+CUBE_UNKNOWN_PERIOD = 'unknown'     # 날짜가 없거나 해석할 수 없는 기사의 기간
+
+# 뉴스 키워드 버스트(급증) 탐지 (카테고리 × 기간 큐브 기반)
+BURST_WINDOW = 6                # 기준선 이동 구간 (기간 수)
+BURST_Z = 3.0                   # 버스트 판정 z-점수 기준
+BURST_MIN_COUNT = 10            # 버스트 기간 최소 기사 수
+BURST_PAPER_GROWTH = 1.5        # 논문 증가율이 이 값 미만이면 '조기 경보' (뉴스만 급증)
+BURST_TOP_N = 50                # 저장할 상위 버스트 수
 
 # 시각화
 VIZ_TOP_N = 20              # 시각화에 표시할 상위 N개
 
+# 벤치마크 (합성 코퍼스)
+BENCH_SCALES = [10_000, 100_000, 1_000_000]  # 측정할 문서 수 규모 (최대 10,000,000)
+BENCH_VOCAB_SIZE = 200_000      # 합성 어휘 크기
+BENCH_ZIPF_EXPONENT = 1.1       # 키워드 빈도 Zipf 지수
+BENCH_NEWS_KEYWORDS_MEAN = 12   # 뉴스 기사당 평균 키워드 수
+BENCH_PAPER_KEYWORDS_MEAN = 5   # 논문당 평균 키워드 수
+BENCH_SYNONYM_RATE = 0.3        # 동의어 변형(SYNONYM_MAP 원형)으로 치환할 비율
+BENCH_IO_MAX_DOCS = 100_000     # 파일 입출력이 필요한 측정(extract_*_mentions)의 최대 규모
+BENCH_REPEATS = 3               # 반복 측정 횟수 (최솟값 사용)
+BENCH_REGRESSION_TOLERANCE = 0.2  # 기준 대비 20% 이상 느려지면 회귀로 표시
+
+# 실행 계측 (환경변수 SSU_PROFILE_TRACE=1, SSU_PROFILE_STAGE=<단계>로도 지정 가능)
+PROFILE_REPORT = True       # 단계별 실행 리포트 저장 (output/run_report_<phase>.json)
+PROFILE_TRACE = False       # Chrome trace 파일 저장 (output/trace_<phase>.json)
+PROFILE_STAGE = None        # cProfile로 분석할 단계 (load/normalize/count/score/save/plot)
+PROFILE_TOP_N = 30          # cProfile 상위 함수 출력 개수
+
 
 # ============================================================
 # 3. 동의어 매핑 (영어 → 한국어 통합)
@@ -657,6 +836,14 @@ TOPIC_KEYWORDS = [
     '민주주의', '인권', '표현의자유', '불평등', '도시재생', '지방소멸',
 ]
 
+# 키워드 조합별 문서 발췌 대상 (Phase 5, pair_gap.py)
+TARGET_PAIRS = [
+    ('인공지능', '혁신'),
+    ('인공지능', '청년'),
+    ('플랫폼', '혁신'),
+    ('여성', '인공지능'),
+]
+
 
 # ============================================================
 # 6. 카테고리 분류 (시각화용)
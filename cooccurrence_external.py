@@ -0,0 +1,240 @@
+"""
+외부 메모리(Out-of-core) 전체 어휘 동시 출현 빈도 계산
+- 키워드 쌍을 int64 코드 (i << 32 | j, i < j)로 압축
+- 쌍 코드를 해시로 N개 파티션에 분배하여 임시 파일로 내보냄 (map / spill)
+- 파티션별 집계를 병렬 프로세스로 수행 (reduce)
+- 집계 결과를 희소 대칭 행렬(키워드 × 키워드)로 병합
+- 메모리 사용량: 버퍼 + 파티션 1개 + 결과 행렬 수준으로 제한 (코퍼스 크기와 무관)
+- 메모리 맵 코퍼스 저장소(corpus.CorpusStore) 입력 시 map 단계도 문서 범위별 병렬 실행
+  (워커는 저장소 파일에 직접 연결하므로 문서 목록을 복사/전송하지 않음)
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR,
+    COOCCUR_SHARDS, COOCCUR_SPILL_BUFFER, COOCCUR_CHUNK_DOCS,
+    COOCCUR_WORKERS, COOCCUR_TMP_DIR,
+)
+from corpus import map_ranges, attached_store, load_or_build_store, store_signature
+
+
+# 64비트 곱셈 해시 상수 (피보나치 해싱)
+_HASH_MULTIPLIER = np.uint64(0x9E3779B97F4A7C15)
+
+
+def pair_codes(indptr, indices):
+    """CSR 문서 묶음 → 문서 내 모든 키워드 쌍의 int64 코드 (문서 길이별 벡터화)"""
+    lengths = np.diff(indptr)
+    chunks = []
+    for length in np.unique(lengths):
+        if length < 2:
+            continue
+        rows = np.nonzero(lengths == length)[0]
+        # docs_to_csr가 문서 내 ID 오름차순을 보장하므로 a < b 인 쌍은 항상 i < j
+        ids = indices[indptr[rows][:, None] + np.arange(length)].astype(np.int64)
+        a, b = np.triu_indices(length, k=1)
+        chunks.append(((ids[:, a] << 32) | ids[:, b]).ravel())
+
+    if not chunks:
+        return np.empty(0, dtype=np.int64)
+    return np.concatenate(chunks)
+
+
+def shard_of(codes, n_shards):
+    """쌍 코드 → 파티션 번호 (곱셈 해시 상위 비트 사용)"""
+    hashed = codes.astype(np.uint64) * _HASH_MULTIPLIER
+    return ((hashed >> np.uint64(32)) % np.uint64(n_shards)).astype(np.int64)
+
+
+def pair_batches(indptr, max_pairs):
+    """CSR 문서 묶음 → 쌍 수 합계가 max_pairs 이하인 문서 구간 경계 (문서 1개가 넘으면 단독 구간)"""
+    lengths = np.diff(indptr)
+    cum = np.r_[0, np.cumsum(lengths * (lengths - 1) // 2)]
+    bounds = [0]
+    while bounds[-1] < len(lengths):
+        start = bounds[-1]
+        end = np.searchsorted(cum, cum[start] + max_pairs, side='right') - 1
+        bounds.append(max(int(end), start + 1))
+    return bounds
+
+
+def decode_pairs(codes):
+    """int64 쌍 코드 → (행 ID, 열 ID)"""
+    return (codes >> 32).astype(np.int32), (codes & 0xFFFFFFFF).astype(np.int32)
+
+
+class _ShardWriter:
+    """쌍 코드를 버퍼에 모았다가 파티션별 임시 파일에 추가 기록"""
+
+    def __init__(self, tmp_dir, n_shards, buffer_size, suffix=''):
+        self.n_shards = n_shards
+        self.buffer_size = buffer_size
+        self.paths = [os.path.join(tmp_dir, f'shard_{i:04d}{suffix}.bin') for i in range(n_shards)]
+        self.buffer = []
+        self.buffered = 0
+        self.total = 0
+
+    def add(self, codes):
+        if len(codes) == 0:
+            return
+        self.buffer.append(codes)
+        self.buffered += len(codes)
+        if self.buffered >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if not self.buffer:
+            return
+        codes = np.concatenate(self.buffer)
+        shards = shard_of(codes, self.n_shards)
+        order = np.argsort(shards, kind='stable')
+        codes, shards = codes[order], shards[order]
+        bounds = np.searchsorted(shards, np.arange(self.n_shards + 1))
+        for i in range(self.n_shards):
+            if bounds[i] < bounds[i + 1]:
+                with open(self.paths[i], 'ab') as f:
+                    codes[bounds[i]:bounds[i + 1]].tofile(f)
+        self.total += len(codes)
+        self.buffer = []
+        self.buffered = 0
+
+
+def _reduce_shard(paths):
+    """파티션 1개 집계 (파티션 파일 목록, 병렬 프로세스에서 실행)"""
+    paths = [p for p in paths if os.path.exists(p)]
+    if not paths:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    codes = np.concatenate([np.fromfile(p, dtype=np.int64) for p in paths])
+    unique, counts = np.unique(codes, return_counts=True)
+    for p in paths:
+        os.remove(p)
+    return unique, counts
+
+
+def _merge_reduced(reduced, n_terms):
+    """파티션별 (쌍 코드, 횟수) → 대칭 희소 행렬"""
+    codes = np.concatenate([r[0] for r in reduced])
+    counts = np.concatenate([r[1] for r in reduced])
+    rows, cols = decode_pairs(codes)
+    upper = sparse.coo_matrix((counts, (rows, cols)), shape=(n_terms, n_terms))
+    return (upper + upper.T).tocsr()
+
+
+def _map_store_range(work_dir, n_shards, buffer_size, bounds):
+    """저장소 문서 범위 1개의 쌍 코드 → 범위 전용 파티션 파일 (워커 프로세스에서 실행)
+
+    쌍 코드는 buffer_size 쌍 이하의 문서 구간별로 생성 → 메모리는 범위 크기가 아니라 버퍼 크기에 비례
+    """
+    indptr, indices, _ = attached_store().slice(*bounds)
+    indices = np.asarray(indices)
+    writer = _ShardWriter(work_dir, n_shards, buffer_size, suffix=f'_{bounds[0]}')
+    batches = pair_batches(indptr, buffer_size)
+    for start, end in zip(batches[:-1], batches[1:]):
+        writer.add(pair_codes(indptr[start:end + 1], indices))
+    writer.flush()
+    return writer.paths
+
+
+def calculate_cooccurrence_store(store, n_shards=COOCCUR_SHARDS, buffer_size=COOCCUR_SPILL_BUFFER,
+                                 chunk_docs=COOCCUR_CHUNK_DOCS, workers=COOCCUR_WORKERS,
+                                 tmp_dir=COOCCUR_TMP_DIR):
+    """메모리 맵 저장소 → 전체 어휘 동시 출현 행렬 (map/reduce 모두 병렬)
+
+    Returns:
+        matrix: scipy.sparse.csr_matrix (키워드 × 키워드 동시 출현 문서 수, 대칭, 대각선 0)
+        vocab: list[str]
+        keyword_freq: np.ndarray[int64] (키워드별 문서 빈도)
+    """
+    work_dir = tempfile.mkdtemp(prefix='cooccur_', dir=tmp_dir)
+    try:
+        # 1. map: 문서 범위별 워커가 저장소에 직접 연결해 쌍 코드 생성
+        mapped = map_ranges(store, partial(_map_store_range, work_dir, n_shards, buffer_size),
+                            chunk_docs=chunk_docs, workers=workers)
+
+        # 2. reduce: 파티션별로 모든 범위의 파일을 모아 집계
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reduced = list(pool.map(_reduce_shard, [list(paths) for paths in zip(*mapped)]))
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    matrix = _merge_reduced(reduced, store.n_terms)
+    return matrix, store.vocab, np.asarray(store.doc_freq, dtype=np.int64)
+
+
+def top_cooccurring(matrix, vocab, keyword_freq, targets, top_n=20):
+    """행렬에서 대상 키워드별 동시 출현 상위 키워드 추출 (phase3 결과 형식)"""
+    index = {kw: i for i, kw in enumerate(vocab)}
+    results = {}
+    for target in targets:
+        i = index.get(target)
+        if i is None:
+            continue
+        start, end = matrix.indptr[i], matrix.indptr[i + 1]
+        if start == end:
+            continue
+        cols = matrix.indices[start:end]
+        vals = matrix.data[start:end]
+        order = np.lexsort((cols, -vals))[:top_n]
+        results[target] = {
+            'freq': int(keyword_freq[i]),
+            'top_cooccur': [{'keyword': vocab[cols[k]], 'count': int(vals[k])} for k in order]
+        }
+    return results
+
+
+def save_cooccurrence_matrix(source, matrix, vocab, keyword_freq, n_docs):
+    """동시 출현 행렬 저장 (output/<source>_cooccurrence_matrix.npz + _vocab.json, 저장소 서명 포함)"""
+    matrix_path = OUTPUT_DIR / f'{source}_cooccurrence_matrix.npz'
+    vocab_path = OUTPUT_DIR / f'{source}_cooccurrence_vocab.json'
+    sparse.save_npz(matrix_path, matrix)
+    with open(vocab_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'n_docs': int(n_docs),
+            'vocab': list(vocab),
+            'keyword_freq': [int(x) for x in keyword_freq],
+            'signature': store_signature(source),
+        }, f, ensure_ascii=False)
+    print(f"  저장: {matrix_path}")
+    print(f"  저장: {vocab_path}")
+
+
+def load_cooccurrence_matrix(source):
+    """저장된 동시 출현 행렬 로드
+
+    Returns:
+        matrix, vocab, keyword_freq, n_docs
+    """
+    matrix = sparse.load_npz(OUTPUT_DIR / f'{source}_cooccurrence_matrix.npz').tocsr()
+    with open(OUTPUT_DIR / f'{source}_cooccurrence_vocab.json', 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    return matrix, meta['vocab'], np.array(meta['keyword_freq'], dtype=np.int64), meta['n_docs']
+
+
+def load_or_build_cooccurrence_matrix(source):
+    """저장된 동시 출현 행렬 로드, 없거나 설정/원본 파일이 바뀌었으면 원본 데이터에서 계산 후 저장
+
+    Returns:
+        matrix, vocab, keyword_freq, n_docs
+    """
+    vocab_path = OUTPUT_DIR / f'{source}_cooccurrence_vocab.json'
+    if (OUTPUT_DIR / f'{source}_cooccurrence_matrix.npz').exists() and vocab_path.exists():
+        with open(vocab_path, 'r', encoding='utf-8') as f:
+            signature = json.load(f).get('signature')
+        if signature == store_signature(source):
+            return load_cooccurrence_matrix(source)
+
+    print(f"  {source} 동시 출현 행렬을 새로 계산합니다...")
+    store = load_or_build_store(source)
+    matrix, vocab, keyword_freq = calculate_cooccurrence_store(store)
+    save_cooccurrence_matrix(source, matrix, vocab, keyword_freq, len(store))
+    return matrix, vocab, keyword_freq, len(store)
@@ -0,0 +1,299 @@
+"""
+문서-키워드 코퍼스의 배열(CSR) 표현
+- 키워드 문자열 ↔ 정수 ID 어휘 사전 (문서 빈도 내림차순)
+- 문서 목록(list of sets/lists) → CSR 배열 (indptr, indices) 변환
+- 희소 행렬(문서 × 키워드) 변환
+- 메모리 맵 저장소: indptr/indices/어휘 오프셋/문자열 blob을 .npy 파일로 저장하고
+  워커 프로세스가 np.load(mmap_mode='r')로 연결 → 모든 프로세스가 페이지 캐시의 같은 물리 메모리 공유
+- meta.json에 정규화 설정/원본 파일 서명 기록 → 설정(SYNONYM_MAP, STOPWORDS 등)이나 원본이 바뀌면 다시 생성
+"""
+
+import json
+import os
+import shutil
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from pathlib import Path
+
+import numpy as np
+
+# config에서 설정 import
+from config import CORPUS_STORE_DIR, CORPUS_CHUNK_DOCS, CORPUS_WORKERS, INGEST_CHECKPOINT
+
+
+def build_vocab(docs, min_df=1):
+    """문서 빈도 기준 어휘 사전 생성 (빈도 내림차순, 동률은 사전순)
+
+    Returns:
+        vocab: list[str] (ID → 키워드)
+        vocab_index: dict[str, int] (키워드 → ID)
+        doc_freq: np.ndarray[int64] (ID별 문서 빈도)
+    """
+    df_counter = Counter()
+    for doc in docs:
+        df_counter.update(set(doc))
+
+    vocab = sorted((kw for kw, cnt in df_counter.items() if cnt >= min_df),
+                   key=lambda kw: (-df_counter[kw], kw))
+    vocab_index = {kw: i for i, kw in enumerate(vocab)}
+    doc_freq = np.array([df_counter[kw] for kw in vocab], dtype=np.int64)
+
+    return vocab, vocab_index, doc_freq
+
+
+def docs_to_csr(docs, vocab_index):
+    """문서 목록 → CSR 배열 (어휘에 없는 키워드 제외, 문서 내 중복 제거, ID 오름차순)
+
+    Returns:
+        indptr: np.ndarray[int64] (길이: 문서 수 + 1)
+        indices: np.ndarray[int32] (문서별 키워드 ID)
+    """
+    indptr = [0]
+    indices = []
+    for doc in docs:
+        ids = sorted({vocab_index[kw] for kw in doc if kw in vocab_index})
+        indices.extend(ids)
+        indptr.append(len(indices))
+
+    return np.array(indptr, dtype=np.int64), np.array(indices, dtype=np.int32)
+
+
+def csr_to_matrix(indptr, indices, n_terms, data=None, dtype=np.float32):
+    """CSR 배열 → scipy 희소 행렬 (문서 × 키워드, 기본값: 이진 행렬)"""
+    from scipy import sparse
+
+    if data is None:
+        data = np.ones(len(indices), dtype=dtype)
+    return sparse.csr_matrix((data, indices, indptr), shape=(len(indptr) - 1, n_terms))
+
+
+# ============================================================
+# 메모리 맵 코퍼스 저장소
+# ============================================================
+
+_STORE_ARRAYS = ('indptr', 'indices', 'counts', 'doc_freq', 'vocab_offsets', 'vocab_blob')
+
+
+def save_store(path, docs, vocab=None, signature=None):
+    """문서 목록 → 메모리 맵 저장소 (임시 디렉토리에 기록 후 교체)
+
+    Args:
+        path: 저장소 디렉토리
+        docs: 문서별 키워드 목록 (재순회 가능한 시퀀스)
+        vocab: (vocab, vocab_index, doc_freq) 튜플, None이면 docs에서 생성
+        signature: meta.json에 기록할 서명 (store_signature, 소스 저장소일 때)
+
+    Returns:
+        CorpusStore
+    """
+    path = Path(path)
+    if vocab is None:
+        vocab = build_vocab(docs)
+    vocab, vocab_index, doc_freq = vocab
+
+    # 문서 내 키워드 출현 횟수(counts)도 함께 저장 (TF 집계용, 중복 제거 목록이면 모두 1)
+    indptr = [0]
+    indices, counts = [], []
+    for doc in docs:
+        doc_counts = Counter(vocab_index[kw] for kw in doc if kw in vocab_index)
+        ids = sorted(doc_counts)
+        indices.extend(ids)
+        counts.extend(doc_counts[i] for i in ids)
+        indptr.append(len(indices))
+
+    return write_store(path, indptr, indices, counts, doc_freq, vocab, signature)
+
+
+def write_store(path, indptr, indices, counts, doc_freq, vocab, signature=None):
+    """CSR 배열 + 어휘 → 메모리 맵 저장소 (임시 디렉토리에 기록 후 교체)
+
+    indices는 문서 안에서 ID 오름차순, vocab은 ID 순서 키워드 목록
+
+    Returns:
+        CorpusStore
+    """
+    path = Path(path)
+    encoded = [kw.encode('utf-8') for kw in vocab]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    arrays = {
+        'indptr': np.asarray(indptr, dtype=np.int64),
+        'indices': np.asarray(indices, dtype=np.int32),
+        'counts': np.asarray(counts, dtype=np.int32),
+        'doc_freq': np.asarray(doc_freq, dtype=np.int64),
+        'vocab_offsets': offsets,
+        'vocab_blob': np.frombuffer(b''.join(encoded), dtype=np.uint8),
+    }
+
+    tmp_path = path.with_name(path.name + '.tmp')
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    tmp_path.mkdir(parents=True)
+    for name, array in arrays.items():
+        np.save(tmp_path / f'{name}.npy', array)
+    with open(tmp_path / 'meta.json', 'w', encoding='utf-8') as f:
+        json.dump({'n_docs': len(arrays['indptr']) - 1, 'n_terms': len(vocab), 'nnz': len(arrays['indices']),
+                   'signature': signature}, f, ensure_ascii=False)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.replace(tmp_path, path)
+    return CorpusStore(path)
+
+
+class CorpusStore:
+    """메모리 맵 코퍼스 저장소 (읽기 전용)
+
+    - 배열은 np.load(mmap_mode='r')로 연결 → 여러 프로세스가 같은 파일을 열어도 물리 메모리는 1벌
+    - 어휘 문자열은 처음 필요할 때 blob에서 한 번에 복원
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path / 'meta.json', 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        self.n_docs = meta['n_docs']
+        self.n_terms = meta['n_terms']
+        self.signature = meta.get('signature')
+        for name in _STORE_ARRAYS:
+            setattr(self, name, np.load(self.path / f'{name}.npy', mmap_mode='r'))
+        self._vocab = None
+        self._vocab_index = None
+
+    def __len__(self):
+        return self.n_docs
+
+    @property
+    def vocab(self):
+        if self._vocab is None:
+            blob = self.vocab_blob.tobytes()
+            offsets = self.vocab_offsets.tolist()
+            self._vocab = [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(self.n_terms)]
+        return self._vocab
+
+    @property
+    def vocab_index(self):
+        if self._vocab_index is None:
+            self._vocab_index = {kw: i for i, kw in enumerate(self.vocab)}
+        return self._vocab_index
+
+    def term(self, i):
+        """키워드 ID → 문자열 (전체 어휘 복원 없이)"""
+        start, end = self.vocab_offsets[i], self.vocab_offsets[i + 1]
+        return self.vocab_blob[start:end].tobytes().decode('utf-8')
+
+    def doc_ids(self, i):
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    def doc(self, i):
+        return [self.vocab[j] for j in self.doc_ids(i)]
+
+    def iter_docs(self):
+        """문서별 키워드 목록 순회 (기존 docs 인자를 받는 함수와 호환)"""
+        for i in range(self.n_docs):
+            yield self.doc(i)
+
+    def __iter__(self):
+        return self.iter_docs()
+
+    def slice(self, start, end):
+        """문서 범위 [start, end) → (0부터 시작하는 indptr, indices, counts) 뷰"""
+        indptr = np.asarray(self.indptr[start:end + 1])
+        lo, hi = indptr[0], indptr[-1]
+        return indptr - lo, self.indices[lo:hi], self.counts[lo:hi]
+
+    def to_matrix(self, binary=True):
+        """전체 문서 × 키워드 희소 행렬 (binary=False이면 문서 내 출현 횟수)"""
+        data = None if binary else np.asarray(self.counts, dtype=np.float32)
+        return csr_to_matrix(np.asarray(self.indptr), np.asarray(self.indices), self.n_terms, data=data)
+
+
+def store_path(source):
+    return CORPUS_STORE_DIR / source
+
+
+def store_signature(source):
+    """소스 저장소 내용을 결정하는 정규화 설정 + 원본 파일 (크기, 수정 시각)
+
+    ingest.settings_signature와 같은 설정 (청크 크기는 결과와 무관하므로 제외)
+    """
+    from ingest import settings_signature, source_files
+
+    settings = settings_signature(source)
+    settings.pop('chunk_rows')
+    return {'settings': settings, 'files': source_files(source)}
+
+
+def load_or_build_store(source):
+    """소스별 저장소 로드, 없거나 설정/원본 파일이 바뀌었으면 원본 데이터에서 다시 생성
+
+    Returns:
+        CorpusStore
+    """
+    path = store_path(source)
+    if (path / 'meta.json').exists():
+        store = CorpusStore(path)
+        if store.signature == store_signature(source):
+            return store
+        print(f"  {source}: 설정 또는 원본 파일이 바뀌어 코퍼스 저장소를 다시 생성합니다...")
+
+    if INGEST_CHECKPOINT:
+        from ingest import ingest_source
+        return ingest_source(source)
+
+    # phase3가 이 모듈을 간접 import하므로 순환 참조를 피해 함수 내부에서 import
+    from phase3_cooccurrence import extract_docs_with_keywords
+
+    print(f"  {source} 코퍼스 저장소를 생성합니다...")
+    return save_store(path, extract_docs_with_keywords(source), signature=store_signature(source))
+
+
+# 워커 프로세스별 연결된 저장소 (ProcessPoolExecutor initializer에서 설정)
+_attached_store = None
+
+
+def attach_store(path):
+    """워커 프로세스에서 저장소 연결 (메모리 맵, 데이터 복사 없음)"""
+    global _attached_store
+    if _attached_store is None or _attached_store.path != Path(path):
+        _attached_store = CorpusStore(path)
+
+
+def attached_store():
+    return _attached_store
+
+
+def doc_ranges(n_docs, chunk_docs=CORPUS_CHUNK_DOCS):
+    return [(start, min(start + chunk_docs, n_docs)) for start in range(0, n_docs, chunk_docs)]
+
+
+def map_ranges(store, func, chunk_docs=CORPUS_CHUNK_DOCS, workers=CORPUS_WORKERS):
+    """문서 범위별로 func((start, end))를 병렬 실행 (워커는 attached_store()로 저장소 접근)
+
+    func는 pickle 가능한 모듈 수준 함수여야 함 (추가 인자는 functools.partial로 전달)
+    범위가 1개 이하(chunk_docs 이하의 작은 저장소)면 프로세스 풀 없이 현재 프로세스에서 실행
+    """
+    ranges = doc_ranges(store.n_docs, chunk_docs)
+    if len(ranges) <= 1:
+        attach_store(store.path)
+        return [func(bounds) for bounds in ranges]
+    with ProcessPoolExecutor(max_workers=workers, initializer=attach_store,
+                             initargs=(str(store.path),)) as pool:
+        return list(pool.map(func, ranges))
+
+
+def _find_range(ids, bounds):
+    store = attached_store()
+    indptr, indices, _ = store.slice(*bounds)
+    # 문서별 일치 키워드 수 = 누적합 차이 (빈 문서 포함 안전)
+    hits = np.r_[0, np.cumsum(np.isin(indices, ids))]
+    matched = hits[indptr[1:]] - hits[indptr[:-1]]
+    return np.nonzero(matched == len(ids))[0] + bounds[0]
+
+
+def find_docs(store, keywords, **kwargs):
+    """주어진 키워드를 모두 포함한 문서 ID (병렬, 작은 저장소는 직렬, 어휘에 없는 키워드가 있으면 빈 배열)"""
+    index = store.vocab_index
+    if not keywords or any(kw not in index for kw in keywords):
+        return np.empty(0, dtype=np.int64)
+    ids = np.unique([index[kw] for kw in keywords]).astype(np.int32)
+    return np.concatenate(map_ranges(store, partial(_find_range, ids), **kwargs) or [np.empty(0, dtype=np.int64)])
@@ -0,0 +1,224 @@
+"""
+키워드 임베딩: PPMI + 무작위 절단 SVD
+- 동시 출현 행렬 → PPMI(양의 점별 상호정보량) 희소 행렬
+- 무작위 절단 SVD (Halko et al.)로 밀집 키워드 벡터 생성 (뉴스/논문 각각)
+- 블록 행렬곱 기반 코사인 최근접 이웃 인덱스 (선택: int8 양자화)
+- TOPIC_KEYWORDS별 유사 키워드 저장 → 주제 키워드/키워드 쌍 선정 보조
+"""
+
+import json
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, TOPIC_KEYWORDS,
+    EMBED_DIM, EMBED_MIN_FREQ, EMBED_CONTEXT_ALPHA, EMBED_OVERSAMPLE,
+    EMBED_POWER_ITER, EMBED_QUANTIZE, EMBED_BLOCK_SIZE, EMBED_TOP_K, EMBED_SEED,
+    init_dirs
+)
+from cooccurrence_external import load_or_build_cooccurrence_matrix
+from profiling import span, start_run, finish_run
+
+
+def ppmi_matrix(matrix, alpha=EMBED_CONTEXT_ALPHA):
+    """동시 출현 행렬 → PPMI 희소 행렬 (문맥 빈도 alpha 평활)"""
+    matrix = matrix.tocoo()
+    total = matrix.data.sum()
+    if total == 0:
+        return sparse.csr_matrix(matrix.shape, dtype=np.float32)
+
+    row_sum = np.asarray(matrix.sum(axis=1)).ravel()
+    col_sum = np.asarray(matrix.sum(axis=0)).ravel() ** alpha
+    col_prob = col_sum / col_sum.sum()
+
+    pmi = np.log(matrix.data / total) - np.log(row_sum[matrix.row] / total) - np.log(col_prob[matrix.col])
+    keep = pmi > 0
+    return sparse.csr_matrix(
+        (pmi[keep].astype(np.float32), (matrix.row[keep], matrix.col[keep])),
+        shape=matrix.shape,
+    )
+
+
+def randomized_svd(x, rank, oversample=EMBED_OVERSAMPLE, power_iter=EMBED_POWER_ITER,
+                   seed=EMBED_SEED):
+    """무작위 절단 SVD (거듭제곱 반복 + QR 재직교화)
+
+    Returns:
+        u (n × rank), s (rank,), vt (rank × m)
+    """
+    rng = np.random.default_rng(seed)
+    n, m = x.shape
+    k = min(rank + oversample, n, m)
+
+    q, _ = np.linalg.qr(x @ rng.standard_normal((m, k)).astype(np.float32))
+    for _ in range(power_iter):
+        z, _ = np.linalg.qr(x.T @ q)
+        q, _ = np.linalg.qr(x @ z)
+
+    b = (x.T @ q).T
+    u_b, s, vt = np.linalg.svd(b, full_matrices=False)
+    u = q @ u_b
+    return u[:, :rank], s[:rank], vt[:rank]
+
+
+def keyword_vectors(matrix, keyword_freq, dim=EMBED_DIM, min_freq=EMBED_MIN_FREQ):
+    """동시 출현 행렬 → L2 정규화된 키워드 벡터
+
+    Returns:
+        vectors: np.ndarray[float32] (키워드 수 × dim)
+        keep: np.ndarray (원래 어휘에서의 ID)
+    """
+    keep = np.nonzero(keyword_freq >= min_freq)[0]
+    sub = matrix[keep][:, keep]
+    ppmi = ppmi_matrix(sub)
+
+    u, s, _ = randomized_svd(ppmi, min(dim, max(len(keep) - 1, 1)))
+    vectors = (u * np.sqrt(s)).astype(np.float32)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    return vectors / norms, keep
+
+
+class NeighborIndex:
+    """블록 행렬곱 기반 코사인 최근접 이웃 인덱스 (선택: 행별 스케일 int8 양자화)"""
+
+    def __init__(self, vectors, vocab, quantize=EMBED_QUANTIZE, block_size=EMBED_BLOCK_SIZE):
+        self.vocab = list(vocab)
+        self.index = {kw: i for i, kw in enumerate(self.vocab)}
+        self.block_size = block_size
+        self.quantize = quantize
+        if quantize:
+            scale = np.abs(vectors).max(axis=1, keepdims=True) / 127
+            scale[scale == 0] = 1
+            self.data = np.round(vectors / scale).astype(np.int8)
+            self.scale = scale.astype(np.float32)
+        else:
+            self.data = vectors.astype(np.float32)
+            self.scale = None
+
+    def _block(self, start, end):
+        if self.quantize:
+            return self.data[start:end].astype(np.float32) * self.scale[start:end]
+        return self.data[start:end]
+
+    def vectors_of(self, keywords):
+        ids = [self.index[kw] for kw in keywords]
+        if self.quantize:
+            return self.data[ids].astype(np.float32) * self.scale[ids]
+        return self.data[ids]
+
+    def search(self, queries, k=EMBED_TOP_K, exclude=None):
+        """질의 벡터 묶음의 상위 k개 이웃 (블록 단위 행렬곱 + 부분 정렬 병합)
+
+        Returns:
+            ids (질의 수 × k), scores (질의 수 × k)
+        """
+        n_q = len(queries)
+        best_ids = np.full((n_q, 0), -1, dtype=np.int64)
+        best_scores = np.full((n_q, 0), -np.inf, dtype=np.float32)
+
+        for start in range(0, len(self.vocab), self.block_size):
+            end = min(start + self.block_size, len(self.vocab))
+            scores = queries @ self._block(start, end).T
+            if exclude is not None:
+                own = (exclude >= start) & (exclude < end)
+                scores[np.nonzero(own)[0], exclude[own] - start] = -np.inf
+
+            kk = min(k, end - start)
+            part = np.argpartition(-scores, kk - 1, axis=1)[:, :kk]
+            cand_ids = np.concatenate([best_ids, part + start], axis=1)
+            cand_scores = np.concatenate([best_scores, np.take_along_axis(scores, part, axis=1)], axis=1)
+
+            kk = min(k, cand_ids.shape[1])
+            top = np.argpartition(-cand_scores, kk - 1, axis=1)[:, :kk]
+            best_ids = np.take_along_axis(cand_ids, top, axis=1)
+            best_scores = np.take_along_axis(cand_scores, top, axis=1)
+
+        order = np.argsort(-best_scores, axis=1)
+        return np.take_along_axis(best_ids, order, axis=1), np.take_along_axis(best_scores, order, axis=1)
+
+    def similar(self, keywords, k=EMBED_TOP_K):
+        """키워드 목록별 유사 키워드 (자기 자신 제외)"""
+        keywords = [kw for kw in keywords if kw in self.index]
+        if not keywords:
+            return {}
+        exclude = np.array([self.index[kw] for kw in keywords])
+        ids, scores = self.search(self.vectors_of(keywords), k, exclude=exclude)
+        return {
+            kw: [{'keyword': self.vocab[j], 'similarity': round(float(sc), 4)}
+                 for j, sc in zip(ids[i], scores[i]) if j >= 0 and np.isfinite(sc)]
+            for i, kw in enumerate(keywords)
+        }
+
+
+def save_embeddings(source, vectors, vocab):
+    """임베딩 저장 (output/<source>_embeddings.npz, 어휘는 고정 길이 문자열 배열 → pickle 없이 로드)"""
+    path = OUTPUT_DIR / f'{source}_embeddings.npz'
+    np.savez_compressed(path, vectors=vectors, vocab=np.array(vocab, dtype=np.str_))
+    print(f"  저장: {path}")
+
+
+def load_index(source, quantize=EMBED_QUANTIZE):
+    """저장된 임베딩으로 최근접 이웃 인덱스 생성"""
+    data = np.load(OUTPUT_DIR / f'{source}_embeddings.npz')
+    return NeighborIndex(data['vectors'], data['vocab'].tolist(), quantize=quantize)
+
+
+def embed_source(source_name, source):
+    """소스별 임베딩 생성 및 유사 키워드 검색"""
+    print(f"\n{'=' * 50}")
+    print(f"{source_name} 키워드 임베딩")
+    print('=' * 50)
+
+    with span('load', f'{source} 동시 출현 행렬'):
+        matrix, vocab, keyword_freq, _ = load_or_build_cooccurrence_matrix(source)
+
+    with span('score', f'{source} PPMI + SVD', items=int(np.count_nonzero(keyword_freq >= EMBED_MIN_FREQ))):
+        vectors, keep = keyword_vectors(matrix, keyword_freq)
+    kept_vocab = [vocab[i] for i in keep]
+    print(f"임베딩 키워드 수: {len(kept_vocab):,} / 차원: {vectors.shape[1]}")
+
+    index = NeighborIndex(vectors, kept_vocab)
+    with span('score', f'{source} 유사 키워드 검색', items=len(TOPIC_KEYWORDS)):
+        similar = index.similar(TOPIC_KEYWORDS)
+
+    print(f"\n[주요 키워드별 유사 키워드]")
+    for kw in TOPIC_KEYWORDS[:10]:
+        if kw in similar:
+            neighbors = ', '.join(f"{n['keyword']}({n['similarity']:.2f})" for n in similar[kw][:5])
+            print(f"  ▶ {kw}: {neighbors}")
+
+    with span('save', f'{source} 임베딩'):
+        save_embeddings(source, vectors, kept_vocab)
+
+    return similar
+
+
+def main():
+    print("\n" + "#" * 60)
+    print("#  키워드 임베딩: PPMI + 절단 SVD")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('embedding')
+
+    news_similar = embed_source("뉴스", 'news')
+    paper_similar = embed_source("논문", 'paper')
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'keyword_embeddings.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({'news': news_similar, 'paper': paper_similar}, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  키워드 임베딩 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
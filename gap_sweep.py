@@ -0,0 +1,170 @@
+"""
+간극 분석 기준 스윕 (Parameter Sweep)
+- Phase 3 결과(gap_analysis.json)의 빈도/간극 지수를 그대로 사용 (원본 데이터 재로딩 없음)
+- 뉴스/논문 최소 빈도 × 간극 기준의 모든 조합을 브로드캐스팅으로 한 번에 평가
+  (조합 × 키워드 불리언 배열, 상위 N개는 간극 순 누적합으로 선택 → Phase 3과 같은 규칙)
+- 키워드별 안정성: 전체 조합 중 후보로 선정된 비율
+"""
+
+import argparse
+import json
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR,
+    GAP_NEWS_MIN_FREQ, GAP_PAPER_MIN_FREQ,
+    GAP_BLUE_OCEAN_THRESHOLD, GAP_ACADEMIC_THRESHOLD, GAP_TOP_N,
+    GAP_SWEEP_NEWS_MIN_FREQ, GAP_SWEEP_PAPER_MIN_FREQ,
+    GAP_SWEEP_BLUE_OCEAN_THRESHOLD, GAP_SWEEP_ACADEMIC_THRESHOLD,
+    init_dirs
+)
+from profiling import span, start_run, finish_run
+
+
+def load_gap_arrays(path=OUTPUT_DIR / 'gap_analysis.json'):
+    """gap_analysis.json → (키워드, 뉴스 빈도, 논문 빈도, 간극 지수) 배열"""
+    with open(path, 'r', encoding='utf-8') as f:
+        gap_data = json.load(f)
+    keywords = np.array([g['keyword'] for g in gap_data], dtype=object)
+    news_freq = np.array([g['news_freq'] for g in gap_data], dtype=np.int64)
+    paper_freq = np.array([g['paper_freq'] for g in gap_data], dtype=np.int64)
+    gap = np.array([g['gap_index'] for g in gap_data], dtype=np.float64)
+    return keywords, news_freq, paper_freq, gap
+
+
+def sweep_candidates(freq, gap, min_freqs, thresholds, top_n=GAP_TOP_N, descending=True):
+    """모든 (최소 빈도, 간극 기준) 조합의 후보 집합
+
+    - descending=True: 블루오션 (빈도 > 최소 빈도 & 간극 > 기준, 간극 내림차순 상위 N)
+    - descending=False: 학술선도 (빈도 > 최소 빈도 & 간극 < 기준, 간극 오름차순 상위 N)
+
+    Returns:
+        selected: bool 배열 (최소 빈도 수 × 기준 수 × 키워드 수, 원래 키워드 순서)
+        qualified: int 배열 (최소 빈도 수 × 기준 수, 상위 N 제한 전 후보 수)
+    """
+    order = np.argsort(-gap if descending else gap, kind='stable')
+    freq, gap = freq[order], gap[order]
+    min_freqs = np.asarray(min_freqs, dtype=np.float64)[:, None, None]
+    thresholds = np.asarray(thresholds, dtype=np.float64)[None, :, None]
+
+    passes_gap = gap > thresholds if descending else gap < thresholds
+    mask = (freq > min_freqs) & passes_gap
+    selected_sorted = mask & (np.cumsum(mask, axis=-1) <= top_n)
+
+    selected = np.empty_like(selected_sorted)
+    selected[..., order] = selected_sorted
+    return selected, mask.sum(axis=-1)
+
+
+def stability(keywords, selected, top=None):
+    """키워드별 선정 비율 (전체 조합 대비)"""
+    rate = selected.reshape(-1, selected.shape[-1]).mean(axis=0)
+    order = np.argsort(-rate, kind='stable')
+    result = [{'keyword': keywords[i], 'rate': round(float(rate[i]), 4)} for i in order if rate[i] > 0]
+    return result[:top] if top else result
+
+
+def combination_table(keywords, selected, qualified, min_freqs, thresholds, baseline):
+    """조합별 후보 수 + 기본 설정(config) 후보 집합과의 Jaccard 유사도"""
+    rows = []
+    for a, min_freq in enumerate(min_freqs):
+        for b, threshold in enumerate(thresholds):
+            chosen = selected[a, b]
+            union = np.count_nonzero(chosen | baseline)
+            rows.append({
+                'min_freq': min_freq,
+                'threshold': threshold,
+                'qualified': int(qualified[a, b]),
+                'selected': [keywords[i] for i in np.nonzero(chosen)[0]],
+                'jaccard_vs_config': round(np.count_nonzero(chosen & baseline) / union, 4) if union else 1.0,
+            })
+    return rows
+
+
+def print_stability(title, items):
+    print(f"\n[{title}]")
+    print("-" * 50)
+    print(f"{'키워드':<20} | {'선정 비율':>10}")
+    print("-" * 50)
+    if not items:
+        print("  (해당 없음)")
+    for item in items[:GAP_TOP_N]:
+        print(f"{item['keyword']:<20} | {item['rate']:>10.1%}")
+
+
+def print_counts(title, min_freqs, thresholds, qualified):
+    print(f"\n[{title}]")
+    print(f"{'':>10} | " + ' | '.join(f'{t:>7g}' for t in thresholds))
+    for a, min_freq in enumerate(min_freqs):
+        print(f"{min_freq:>10g} | " + ' | '.join(f'{int(q):>7,}' for q in qualified[a]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='간극 분석 기준 스윕')
+    parser.add_argument('--news-min-freq', type=float, nargs='+', default=GAP_SWEEP_NEWS_MIN_FREQ)
+    parser.add_argument('--paper-min-freq', type=float, nargs='+', default=GAP_SWEEP_PAPER_MIN_FREQ)
+    parser.add_argument('--blue-ocean', type=float, nargs='+', default=GAP_SWEEP_BLUE_OCEAN_THRESHOLD)
+    parser.add_argument('--academic', type=float, nargs='+', default=GAP_SWEEP_ACADEMIC_THRESHOLD)
+    parser.add_argument('--top', type=int, default=GAP_TOP_N, help='조합별 후보 상위 N개 (Phase 3과 동일)')
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  간극 분석 기준 스윕")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('gap_sweep')
+
+    with span('load', 'gap_analysis.json'):
+        keywords, news_freq, paper_freq, gap = load_gap_arrays()
+
+    n_blue = len(args.news_min_freq) * len(args.blue_ocean)
+    n_academic = len(args.paper_min_freq) * len(args.academic)
+    print(f"\n키워드 수: {len(keywords):,} / 블루오션 조합: {n_blue} / 학술선도 조합: {n_academic}")
+
+    with span('score', '스윕', items=(n_blue + n_academic) * len(keywords)):
+        blue, blue_qualified = sweep_candidates(news_freq, gap, args.news_min_freq, args.blue_ocean,
+                                                args.top, descending=True)
+        academic, academic_qualified = sweep_candidates(paper_freq, gap, args.paper_min_freq,
+                                                        args.academic, args.top, descending=False)
+        blue_base, _ = sweep_candidates(news_freq, gap, [GAP_NEWS_MIN_FREQ], [GAP_BLUE_OCEAN_THRESHOLD],
+                                        args.top, descending=True)
+        academic_base, _ = sweep_candidates(paper_freq, gap, [GAP_PAPER_MIN_FREQ], [GAP_ACADEMIC_THRESHOLD],
+                                            args.top, descending=False)
+
+    blue_stability = stability(keywords, blue)
+    academic_stability = stability(keywords, academic)
+    print_stability("블루오션 후보 안정성 (전체 조합 중 선정 비율)", blue_stability)
+    print_stability("학술선도 후보 안정성 (전체 조합 중 선정 비율)", academic_stability)
+
+    blue_rows = combination_table(keywords, blue, blue_qualified, args.news_min_freq,
+                                  args.blue_ocean, blue_base[0, 0])
+    academic_rows = combination_table(keywords, academic, academic_qualified, args.paper_min_freq,
+                                      args.academic, academic_base[0, 0])
+
+    print_counts("블루오션 조합별 후보 수 (뉴스 최소 빈도 × 간극 기준)",
+                 args.news_min_freq, args.blue_ocean, blue_qualified)
+    print_counts("학술선도 조합별 후보 수 (논문 최소 빈도 × 간극 기준)",
+                 args.paper_min_freq, args.academic, academic_qualified)
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'gap_sweep.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'top_n': args.top,
+                'blue_ocean': {'stability': blue_stability, 'combinations': blue_rows},
+                'academic_lead': {'stability': academic_stability, 'combinations': academic_rows},
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  간극 기준 스윕 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
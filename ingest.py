@@ -0,0 +1,282 @@
+"""
+체크포인트 수집 - 대용량 원본을 중단 후 이어서 정규화
+- 원본을 INGEST_CHUNK_ROWS 행 단위로 읽어 Phase 3(extract_docs_with_keywords)과 같은 규칙으로 정규화
+    뉴스: openpyxl 읽기 전용 모드로 행을 순차 스트리밍 (시트 전체를 DataFrame으로 올리지 않음)
+    논문: NODE_LIST를 항목 청크로 분할
+- 청크마다 CSR 조각 저장: 청크 로컬 어휘 + indptr/indices + 부분 집계(로컬 문서 빈도, 키워드 없는 문서 제목)
+  → manifest.json에 완료 청크 기록 (조각/매니페스트 모두 임시 파일에 쓴 뒤 교체하므로 중간에 죽어도 손상 없음)
+- 재실행 시 설정/원본 파일(크기, 수정 시각)이 같으면 완료된 청크는 정규화 없이 건너뛰고 다음 청크부터 처리
+- 모든 청크 완료 후 병합: 부분 문서 빈도 합산 → 전역 어휘(빈도 내림차순) → 로컬 ID 재매핑 → 코퍼스 저장소 (corpus.py)
+  BACKFILL_KEYWORDS는 전체 어휘가 필요하므로 병합 단계에서 적용
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import time
+from collections import Counter
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    NEWS_FILES, PAPER_FILE, NEWS_EXCLUDE_CATEGORIES, NEWS_CATEGORY_COLUMN,
+    NEWS_TITLE_COLUMN, PAPER_TITLE_FIELD, SYNONYM_MAP, STOPWORDS,
+    TITLE_TOKENS, TOKENIZER_BACKEND, TOKENIZER_NGRAM, BACKFILL_KEYWORDS, BACKFILL_MIN_FREQ,
+    INGEST_CHUNK_ROWS, INGEST_DIR,
+    normalize_keyword, is_valid_keyword, init_dirs
+)
+from corpus import CorpusStore, docs_to_csr, store_path, store_signature, write_store
+from profiling import span, start_run, finish_run
+
+
+def ingest_dir(source):
+    return INGEST_DIR / source
+
+
+def settings_signature(source, chunk_rows=INGEST_CHUNK_ROWS):
+    """정규화 결과에 영향을 주는 설정 (바뀌면 처음부터 다시 수집)"""
+    rules = json.dumps([sorted(SYNONYM_MAP.items()), sorted(STOPWORDS), sorted(NEWS_EXCLUDE_CATEGORIES)],
+                       ensure_ascii=False)
+    signature = {
+        'source': source,
+        'chunk_rows': chunk_rows,
+        'rules': hashlib.sha1(rules.encode('utf-8')).hexdigest(),
+        'title_tokens': None,
+        'backfill': [BACKFILL_KEYWORDS, BACKFILL_MIN_FREQ],
+    }
+    if TITLE_TOKENS:
+        from tokenizer import backend_key, resolve_backend
+
+        signature['title_tokens'] = backend_key(resolve_backend(TOKENIZER_BACKEND), TOKENIZER_NGRAM)
+    return signature
+
+
+def source_files(source):
+    files = NEWS_FILES if source == 'news' else [PAPER_FILE]
+    return [{'path': str(f), 'size': os.path.getsize(f), 'mtime': os.path.getmtime(f)} for f in files]
+
+
+def _write_json(path, data):
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(source, restart=False, chunk_rows=INGEST_CHUNK_ROWS):
+    """이전 매니페스트 (설정과 원본이 같을 때), 아니면 조각을 지우고 새 매니페스트"""
+    directory = ingest_dir(source)
+    path = directory / 'manifest.json'
+    signature = settings_signature(source, chunk_rows)
+    files = source_files(source)
+    if not restart and path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest['signature'] == signature and manifest['files'] == files:
+            return manifest
+        print(f"  {source}: 설정 또는 원본 파일이 바뀌어 처음부터 다시 수집합니다.")
+
+    shutil.rmtree(directory, ignore_errors=True)
+    directory.mkdir(parents=True)
+    manifest = {'signature': signature, 'files': files, 'chunks': [], 'ingested': False, 'merged': False}
+    _write_json(path, manifest)
+    return manifest
+
+
+def _normalize(raw):
+    keywords = [normalize_keyword(k.strip()) for k in str(raw).split(',') if k.strip()]
+    return [k for k in keywords if is_valid_keyword(k)]  # 불용어 필터링
+
+
+def normalize_chunk(raws, titles):
+    """청크의 (키워드 원문, 제목) → (키워드가 있는 문서의 키워드 목록, 키워드 없는 문서 제목)"""
+    kept = [(raw, title) for raw, title in zip(raws, titles) if raw not in (None, '')]
+    missing = [title for raw, title in zip(raws, titles) if raw in (None, '')]
+    if TITLE_TOKENS:
+        from tokenizer import title_keywords
+
+        title_kw = title_keywords([title for _, title in kept])
+    else:
+        title_kw = [[] for _ in kept]
+
+    docs = []
+    for (raw, _), extra in zip(kept, title_kw):
+        keywords = list(set(_normalize(raw) + extra))
+        if keywords:
+            docs.append(keywords)
+    return docs, [t if isinstance(t, str) else '' for t in missing]
+
+
+def iter_news_chunks(chunk_rows=INGEST_CHUNK_ROWS):
+    """뉴스 엑셀 → (파일 번호, 시작 행, [(카테고리, 키워드, 제목)]) 청크 (행 번호는 헤더 제외 0부터)"""
+    from openpyxl import load_workbook
+
+    for file_no, file in enumerate(NEWS_FILES):
+        workbook = load_workbook(file, read_only=True, data_only=True)
+        try:
+            rows = workbook.worksheets[0].iter_rows(values_only=True)
+            header = list(next(rows))
+            columns = [header.index(name) for name in (NEWS_CATEGORY_COLUMN, '키워드', NEWS_TITLE_COLUMN)]
+            start, chunk = 0, []
+            for row in rows:
+                chunk.append(tuple(row[c] if c < len(row) else None for c in columns))
+                if len(chunk) == chunk_rows:
+                    yield file_no, start, chunk
+                    start, chunk = start + len(chunk), []
+            if chunk:
+                yield file_no, start, chunk
+        finally:
+            workbook.close()
+
+
+def iter_paper_chunks(chunk_rows=INGEST_CHUNK_ROWS):
+    """논문 NODE_LIST → (0, 시작 항목, [(None, KYWD, TITLE)]) 청크"""
+    with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+        items = json.load(f)['NODE_LIST']
+    for start in range(0, len(items), chunk_rows):
+        yield 0, start, [(None, item.get('KYWD'), item.get(PAPER_TITLE_FIELD))
+                         for item in items[start:start + chunk_rows]]
+
+
+def write_shard(directory, name, docs, missing):
+    """청크 → CSR 조각 (로컬 어휘, indptr, indices, 로컬 문서 빈도, 키워드 없는 제목)"""
+    local_vocab = sorted({kw for doc in docs for kw in doc})
+    indptr, indices = docs_to_csr(docs, {kw: i for i, kw in enumerate(local_vocab)})
+    tmp_path = directory / f'{name}.tmp.npz'
+    np.savez(tmp_path, vocab=np.array(local_vocab, dtype=str), indptr=indptr, indices=indices,
+             doc_freq=np.bincount(indices, minlength=len(local_vocab)).astype(np.int64),
+             missing=np.array(missing, dtype=str))
+    os.replace(tmp_path, directory / f'{name}.npz')
+
+
+def read_shard(directory, name):
+    with np.load(directory / f'{name}.npz') as data:
+        return {key: data[key] for key in data.files}
+
+
+def iter_shard_docs(directory, manifest):
+    """조각 순서대로 문서별 키워드 목록 (키워드 보완 패턴 구축용, 한 번에 조각 1개만 메모리에)"""
+    for chunk in manifest['chunks']:
+        shard = read_shard(directory, chunk['shard'])
+        vocab = shard['vocab'].tolist()
+        indptr, indices = shard['indptr'], shard['indices']
+        for d in range(len(indptr) - 1):
+            yield [vocab[i] for i in indices[indptr[d]:indptr[d + 1]]]
+
+
+def merge_shards(source, manifest):
+    """완료된 조각 병합 → 코퍼스 저장소 (Phase 3 문서 순서와 동일: 청크 순서, 보완 문서는 마지막)"""
+    directory = ingest_dir(source)
+    doc_freq = Counter()
+    missing = []
+    for chunk in manifest['chunks']:
+        shard = read_shard(directory, chunk['shard'])
+        doc_freq.update(dict(zip(shard['vocab'].tolist(), shard['doc_freq'].tolist())))
+        missing.extend(shard['missing'].tolist())
+
+    inferred = []
+    if BACKFILL_KEYWORDS:
+        from keyword_matcher import backfill_keywords
+
+        inferred = backfill_keywords(iter_shard_docs(directory, manifest), missing, source)
+        for doc in inferred:
+            doc_freq.update(set(doc))
+
+    # corpus.build_vocab과 같은 순서 (빈도 내림차순, 동률은 사전순)
+    vocab = sorted(doc_freq, key=lambda kw: (-doc_freq[kw], kw))
+    vocab_index = {kw: i for i, kw in enumerate(vocab)}
+
+    indptr_parts, index_parts = [np.zeros(1, dtype=np.int64)], []
+    offset = 0
+    for chunk in manifest['chunks']:
+        shard = read_shard(directory, chunk['shard'])
+        mapping = np.array([vocab_index[kw] for kw in shard['vocab'].tolist()], dtype=np.int32)
+        indptr, ids = shard['indptr'], mapping[shard['indices']]
+        # 문서 안에서 전역 ID 오름차순으로 재정렬
+        rows = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+        index_parts.append(ids[np.lexsort((ids, rows))])
+        indptr_parts.append(indptr[1:] + offset)
+        offset += int(indptr[-1])
+    if inferred:
+        indptr, ids = docs_to_csr(inferred, vocab_index)
+        index_parts.append(ids)
+        indptr_parts.append(indptr[1:] + offset)
+
+    indptr = np.concatenate(indptr_parts)
+    indices = np.concatenate(index_parts) if index_parts else np.zeros(0, dtype=np.int32)
+    return write_store(store_path(source), indptr, indices, np.ones(len(indices), dtype=np.int32),
+                       np.array([doc_freq[kw] for kw in vocab], dtype=np.int64), vocab, store_signature(source))
+
+
+def ingest_source(source, restart=False, chunk_rows=INGEST_CHUNK_ROWS):
+    """청크 단위 체크포인트 수집 → 코퍼스 저장소 (완료된 청크는 건너뛰고 재개)
+
+    Returns:
+        CorpusStore
+    """
+    directory = ingest_dir(source)
+    manifest = load_manifest(source, restart, chunk_rows)
+    if manifest['merged'] and (store_path(source) / 'meta.json').exists():
+        store = CorpusStore(store_path(source))
+        if store.signature == store_signature(source):
+            return store
+
+    if not manifest['ingested']:
+        done = {(c['file'], c['start']) for c in manifest['chunks']}
+        if done:
+            print(f"  {source}: 완료된 청크 {len(done):,}개 이후부터 재개합니다.")
+        chunks = iter_news_chunks(chunk_rows) if source == 'news' else iter_paper_chunks(chunk_rows)
+        for file_no, start, rows in chunks:
+            if (file_no, start) in done:
+                continue
+            chunk_start = time.perf_counter()
+            with span('normalize', f'{source} 청크 {file_no}:{start}', items=len(rows)):
+                if source == 'news':
+                    rows = [r for r in rows if r[0] not in NEWS_EXCLUDE_CATEGORIES]
+                docs, missing = normalize_chunk([r[1] for r in rows], [r[2] for r in rows])
+            name = f'{file_no:03d}_{start:010d}'
+            with span('save', f'{source} 조각 {name}'):
+                write_shard(directory, name, docs, missing)
+                manifest['chunks'].append({'file': file_no, 'start': start, 'n_rows': len(rows),
+                                           'n_docs': len(docs), 'n_missing': len(missing), 'shard': name})
+                _write_json(directory / 'manifest.json', manifest)
+            print(f"  {source} 청크 {file_no}:{start:,} → 문서 {len(docs):,}건 "
+                  f"({time.perf_counter() - chunk_start:.2f}s)")
+        manifest['ingested'] = True
+        _write_json(directory / 'manifest.json', manifest)
+
+    with span('merge', f'{source} 조각 병합', items=len(manifest['chunks'])):
+        store = merge_shards(source, manifest)
+    manifest['merged'] = True
+    _write_json(directory / 'manifest.json', manifest)
+    print(f"  {source}: 조각 {len(manifest['chunks']):,}개 병합 → 문서 {store.n_docs:,} / 어휘 {store.n_terms:,}")
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description='체크포인트 수집 (중단 후 재실행하면 이어서 처리)')
+    parser.add_argument('--source', nargs='+', choices=['news', 'paper'], default=['news', 'paper'])
+    parser.add_argument('--restart', action='store_true', help='기존 조각/매니페스트를 지우고 처음부터 수집')
+    parser.add_argument('--chunk-rows', type=int, default=INGEST_CHUNK_ROWS)
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  체크포인트 수집")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('ingest')
+    for source in args.source:
+        ingest_source(source, args.restart, args.chunk_rows)
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  수집 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
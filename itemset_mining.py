@@ -0,0 +1,279 @@
+"""
+빈발 키워드 집합 마이닝 (Frequent Itemset Mining, Eclat)
+- 쌍을 넘어 3개 이상 키워드가 함께 나오는 주제 (예: 인공지능 + 청년 + 일자리) 탐색
+- 입력: 메모리 맵 코퍼스 저장소 (corpus.py, Phase 3과 같은 문서 집합)
+- 수직 표현: 빈발 키워드별 문서 ID 배열 (CSC 열)
+- 2개 집합 지지도는 희소 행렬곱 XᵀX로 한 번에 계산 → 3개 이상 확장 후보를 빈발 쌍으로 미리 제한
+- 깊이 우선 탐색: 접두 집합의 문서를 표시 배열(문서 수 바이트)에 표시한 뒤 후보의 문서 ID를 걸러 교집합 계산
+  메모리: 수직 표현(코퍼스 비영 원소 수) + 탐색 깊이 × 후보 교집합 수준으로 제한
+- ITEMSET_MAX_ITEMSETS에 도달하면 결과를 버리고 최소 지지도를 2배로 올려 다시 탐색
+  → 저장/비교하는 집합은 항상 (최종) 최소 지지도 이상인 집합 전체 (상위 집합이 잘리지 않음)
+- 뉴스/논문 각각 마이닝 후, 상위 집합의 상대 코퍼스 지지도를 계산해 1000건당 비율 차이와 z-검정 비교
+"""
+
+import json
+import time
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, PAIR_MIN_Z,
+    ITEMSET_MIN_SUPPORT, ITEMSET_MIN_COUNT, ITEMSET_MAX_LEN, ITEMSET_MAX_ITEMSETS,
+    ITEMSET_COMPARE_N, ITEMSET_TOP_N,
+    init_dirs
+)
+from corpus import load_or_build_store
+from pair_gap import pair_gap_scores
+from profiling import span, start_run, finish_run
+
+
+def min_count_for(n_docs, min_support=ITEMSET_MIN_SUPPORT, floor=ITEMSET_MIN_COUNT):
+    return max(int(np.ceil(min_support * n_docs)), floor)
+
+
+def mine_itemsets(store, min_count, max_len=ITEMSET_MAX_LEN, max_itemsets=ITEMSET_MAX_ITEMSETS):
+    """Eclat 빈발 집합 마이닝 (크기 2 이상)
+
+    Returns:
+        itemsets: list[tuple[int, ...]] (키워드 ID, 지지도 오름차순 키워드 순서)
+        counts: np.ndarray[int64] (집합별 지지 문서 수)
+        truncated: bool (max_itemsets 도달로 탐색 중단 여부)
+    """
+    matrix = store.to_matrix().tocsc()
+    freq = np.diff(matrix.indptr)
+    items = np.nonzero(freq >= min_count)[0]
+    # 지지도 오름차순: 앞쪽 키워드의 문서 집합이 작아 교집합 비용 감소
+    items = items[np.argsort(freq[items], kind='stable')]
+    tidsets = [matrix.indices[matrix.indptr[i]:matrix.indptr[i + 1]] for i in items]
+
+    # 빈발 쌍 (XᵀX, 빈발 키워드 열만)
+    sub = matrix[:, items]
+    pair_counts = (sub.T @ sub).tocsr()
+    pair_counts.setdiag(0)
+    pair_counts.eliminate_zeros()
+    frequent_pair = pair_counts >= min_count
+    neighbors = [set(frequent_pair.indices[frequent_pair.indptr[a]:frequent_pair.indptr[a + 1]])
+                 for a in range(len(items))]
+
+    itemsets, counts = [], []
+    mark = np.zeros(store.n_docs, dtype=bool)
+    truncated = False
+
+    def extend(prefix, members):
+        """members: 같은 접두 집합을 공유하는 (마지막 키워드 위치, 문서 ID 배열) 목록"""
+        nonlocal truncated
+        for k, (a, tid_a) in enumerate(members):
+            itemset = prefix + (a,)
+            if len(itemset) >= 2:
+                itemsets.append(itemset)
+                counts.append(len(tid_a))
+                if len(itemsets) >= max_itemsets:
+                    truncated = True
+                    return
+            if len(itemset) >= max_len:
+                continue
+            candidates = [(b, tid_b) for b, tid_b in members[k + 1:] if b in neighbors[a]]
+            if not candidates:
+                continue
+            if len(itemset) == 1:
+                # 크기 2는 XᵀX 결과를 그대로 사용하고 문서 ID만 교집합
+                mark[tid_a] = True
+                children = [(b, tid_b[mark[tid_b]]) for b, tid_b in candidates]
+                mark[tid_a] = False
+            else:
+                mark[tid_a] = True
+                children = []
+                for b, tid_b in candidates:
+                    tid = tid_b[mark[tid_b]]
+                    if len(tid) >= min_count:
+                        children.append((b, tid))
+                mark[tid_a] = False
+            if children:
+                extend(itemset, children)
+                if truncated:
+                    return
+
+    extend((), list(enumerate(tidsets)))
+    itemsets = [tuple(int(items[p]) for p in itemset) for itemset in itemsets]
+    return itemsets, np.array(counts, dtype=np.int64), truncated
+
+
+def mine_complete(store, min_count, max_len=ITEMSET_MAX_LEN, max_itemsets=ITEMSET_MAX_ITEMSETS):
+    """max_itemsets 안에 빈발 집합이 모두 들어갈 때까지 최소 지지도를 2배씩 올려 다시 마이닝
+
+    Returns:
+        itemsets, counts: mine_itemsets와 같은 형식 (최종 최소 지지도 이상인 집합 전체)
+        min_count: 최종 최소 지지도
+    """
+    while True:
+        itemsets, counts, truncated = mine_itemsets(store, min_count, max_len, max_itemsets)
+        if not truncated:
+            return itemsets, counts, min_count
+        print(f"  집합 수가 ITEMSET_MAX_ITEMSETS({max_itemsets:,})에 도달 → 최소 지지도 {min_count:,} → "
+              f"{min_count * 2:,}건으로 다시 탐색")
+        min_count *= 2
+
+
+def itemset_support(matrix, vocab_index, keywords, mark):
+    """CSC 문서 × 키워드 행렬에서 키워드 집합의 지지 문서 수 (어휘에 없으면 0)"""
+    ids = [vocab_index.get(kw) for kw in keywords]
+    if any(i is None for i in ids):
+        return 0
+    postings = sorted((matrix.indices[matrix.indptr[i]:matrix.indptr[i + 1]] for i in ids), key=len)
+    tid = postings[0]
+    for other in postings[1:]:
+        mark[tid] = True
+        next_tid = other[mark[other]]
+        mark[tid] = False
+        tid = next_tid
+        if len(tid) == 0:
+            break
+    return len(tid)
+
+
+def summarize(store, itemsets, counts, top_n=ITEMSET_TOP_N):
+    """집합 크기별 개수 및 크기별 상위 집합"""
+    vocab = store.vocab
+    lengths = np.array([len(s) for s in itemsets], dtype=np.int64)
+    by_length = {}
+    for length in np.unique(lengths):
+        idx = np.nonzero(lengths == length)[0]
+        idx = idx[np.argsort(-counts[idx], kind='stable')][:top_n]
+        by_length[int(length)] = {
+            'count': int((lengths == length).sum()),
+            'top': [{'keywords': [vocab[i] for i in itemsets[k]], 'support': int(counts[k]),
+                     'ratio': round(float(counts[k] / store.n_docs * 1000), 4)} for k in idx],
+        }
+    return by_length
+
+
+def compare_corpora(mined, stores, compare_n=ITEMSET_COMPARE_N):
+    """코퍼스별 상위 집합의 합집합 → 양쪽 지지도, 간극 지수, z-검정
+
+    Returns:
+        keywords: list[tuple[str, ...]], news_count, paper_count: np.ndarray, scores: dict
+    """
+    candidates = {}
+    for source, (itemsets, counts, _) in mined.items():
+        vocab = stores[source].vocab
+        for k in np.argsort(-counts, kind='stable')[:compare_n]:
+            key = tuple(sorted(vocab[i] for i in itemsets[k]))
+            candidates.setdefault(key, {})[source] = int(counts[k])
+
+    keywords = list(candidates)
+    support = {}
+    for source, store in stores.items():
+        matrix = store.to_matrix().tocsc()
+        vocab_index = store.vocab_index
+        mark = np.zeros(store.n_docs, dtype=bool)
+        support[source] = np.array([
+            candidates[key][source] if source in candidates[key]
+            else itemset_support(matrix, vocab_index, key, mark)
+            for key in keywords
+        ], dtype=np.int64)
+
+    scores = pair_gap_scores(support['news'], support['paper'], stores['news'].n_docs, stores['paper'].n_docs)
+    return keywords, support['news'], support['paper'], scores
+
+
+def itemset_records(order, keywords, news_count, paper_count, scores):
+    return [{
+        'keywords': list(keywords[k]),
+        'news_count': int(news_count[k]),
+        'paper_count': int(paper_count[k]),
+        'news_ratio': round(float(scores['news_ratio'][k]), 4),
+        'paper_ratio': round(float(scores['paper_ratio'][k]), 4),
+        'gap_index': round(float(scores['gap_index'][k]), 4),
+        'z': round(float(scores['z'][k]), 3),
+    } for k in order]
+
+
+def print_itemsets(title, records):
+    print(f"\n[{title}]")
+    print("-" * 80)
+    print(f"{'키워드 집합':<40} | {'뉴스':>7} | {'논문':>7} | {'간극':>8} | {'z':>7}")
+    print("-" * 80)
+    if not records:
+        print("  (해당 없음)")
+    for r in records[:20]:
+        name = ' + '.join(r['keywords'])
+        print(f"{name:<40} | {r['news_count']:>7,} | {r['paper_count']:>7,} | {r['gap_index']:>8.2f} | {r['z']:>7.2f}")
+
+
+def main():
+    print("\n" + "#" * 60)
+    print("#  빈발 키워드 집합 마이닝 (Eclat)")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('itemset_mining')
+
+    stores, mined, summaries = {}, {}, {}
+    for source, name in (('news', '뉴스'), ('paper', '논문')):
+        with span('load', f'{source} 코퍼스 저장소'):
+            store = stores[source] = load_or_build_store(source)
+        config_min_count = min_count_for(store.n_docs)
+
+        start = time.perf_counter()
+        with span('count', f'{name} 빈발 집합', items=store.n_docs):
+            itemsets, counts, min_count = mine_complete(store, config_min_count)
+        raised = min_count > config_min_count
+        mined[source] = (itemsets, counts, raised)
+        summaries[source] = {
+            'n_docs': store.n_docs,
+            'min_count': min_count,
+            'config_min_count': config_min_count,
+            'n_itemsets': len(itemsets),
+            'raised_min_count': raised,
+            'by_length': summarize(store, itemsets, counts),
+        }
+        sizes = ', '.join(f"{length}개 집합 {v['count']:,}" for length, v in summaries[source]['by_length'].items())
+        print(f"\n{name}: 문서 {store.n_docs:,} / 최소 지지도 {min_count:,}건 → {len(itemsets):,}개 "
+              f"({sizes or '없음'}) / {time.perf_counter() - start:.2f}s")
+        if raised:
+            print(f"  ※ 집합 수가 ITEMSET_MAX_ITEMSETS({ITEMSET_MAX_ITEMSETS:,})를 넘어 최소 지지도를 "
+                  f"{config_min_count:,}건에서 {min_count:,}건으로 올렸습니다.")
+        for length, v in summaries[source]['by_length'].items():
+            if length >= 3:
+                top = ', '.join(f"{'+'.join(t['keywords'])}({t['support']:,})" for t in v['top'][:5])
+                print(f"  {length}개 상위: {top}")
+
+    with span('score', '코퍼스 간 비교'):
+        keywords, news_count, paper_count, scores = compare_corpora(mined, stores)
+    significant = np.abs(scores['z']) >= PAIR_MIN_Z
+    gap = scores['gap_index']
+    blue = np.nonzero(significant & (gap > 0))[0]
+    blue = blue[np.argsort(-gap[blue], kind='stable')][:ITEMSET_TOP_N]
+    academic = np.nonzero(significant & (gap < 0))[0]
+    academic = academic[np.argsort(gap[academic], kind='stable')][:ITEMSET_TOP_N]
+
+    args = (keywords, news_count, paper_count, scores)
+    blue_sets = itemset_records(blue, *args)
+    academic_sets = itemset_records(academic, *args)
+    print_itemsets(f"블루오션 키워드 집합 (|z| ≥ {PAIR_MIN_Z}, 간극 내림차순)", blue_sets)
+    print_itemsets(f"학술선도 키워드 집합 (|z| ≥ {PAIR_MIN_Z}, 간극 오름차순)", academic_sets)
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'itemset_mining.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'min_support': ITEMSET_MIN_SUPPORT,
+                'max_len': ITEMSET_MAX_LEN,
+                'news': summaries['news'],
+                'paper': summaries['paper'],
+                'n_compared': len(keywords),
+                'blue_ocean_itemsets': blue_sets,
+                'academic_lead_itemsets': academic_sets,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  빈발 집합 마이닝 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
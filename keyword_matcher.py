@@ -0,0 +1,157 @@
+"""
+다중 패턴 키워드 매칭 (Aho-Corasick) - 키워드 없는 문서 보완
+- 패턴: 키워드가 있는 문서의 정규화 어휘 + SYNONYM_MAP 표면형(→ 대표 키워드)
+- 오토마톤 1개로 제목을 한 번만 훑어 모든 패턴 위치를 찾음 (키워드별 정규식 반복 없음, 텍스트 길이에 선형)
+- 겹치는 매칭은 왼쪽 우선 + 가장 긴 패턴 선택 (예: '감성분석'이 있으면 '감성'은 제외)
+- 영문 패턴은 대소문자 무시, 단어 경계(앞뒤가 영문/숫자가 아님) 필요
+    대소문자만 다른 표면형이 겹치면 동의어 표면형(→ 다른 대표 키워드) 우선, 그다음 표면형 사전순
+- KYWD/키워드가 비어 있는 문서에 추론 키워드를 부여 (InferredKeywords.inferred = True)
+  output/<source>_inferred_keywords.json에도 표시
+"""
+
+import json
+from collections import Counter, deque
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, SYNONYM_MAP,
+    BACKFILL_MIN_FREQ, BACKFILL_MAX_KEYWORDS,
+    is_valid_keyword
+)
+
+
+def _is_word_char(ch):
+    return ch.isascii() and ch.isalnum()
+
+
+class InferredKeywords(list):
+    """제목에서 추론한 문서 키워드 목록 (list와 같이 쓰고 inferred로 구분)"""
+
+    inferred = True
+
+
+class KeywordMatcher:
+    """Aho-Corasick 오토마톤 (문자 단위 trie + 실패 링크 + 출력 링크)"""
+
+    def __init__(self, patterns):
+        """
+        Args:
+            patterns: dict[str, str] (표면형 → 대표 키워드)
+        """
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [None]     # 노드에서 끝나는 패턴 (길이, 대표 키워드)
+
+        # 대소문자만 다른 표면형 충돌 (예: 어휘 'ai' / 동의어 'AI' → 인공지능): 동의어 우선, 그다음 사전순
+        folded = {}
+        for surface, canonical in sorted(patterns.items(), key=lambda p: (p[0] == p[1], p[0])):
+            folded.setdefault(surface.casefold(), canonical)
+
+        for surface, canonical in folded.items():
+            node = 0
+            for ch in surface:
+                child = self.goto[node].get(ch)
+                if child is None:
+                    child = len(self.goto)
+                    self.goto[node][ch] = child
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append(None)
+                node = child
+            self.output[node] = (len(surface), canonical)
+
+        # 실패 링크 / 출력 링크 (실패 경로에서 가장 가까운 패턴 노드) - 너비 우선
+        self.dict_link = [0] * len(self.goto)
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self.goto[node].items():
+                f = self.fail[node]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                fail = self.fail[child] = self.goto[f].get(ch, 0)
+                self.dict_link[child] = fail if self.output[fail] else self.dict_link[fail]
+                queue.append(child)
+
+    def __len__(self):
+        return len(self.goto)
+
+    def iter_matches(self, text):
+        """모든 매칭 (시작, 끝, 대표 키워드) - 영문 단어 경계 검사 포함"""
+        text = text.casefold()
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in self.goto[node]:
+                node = self.fail[node]
+            node = self.goto[node].get(ch, 0)
+            k = node if self.output[node] else self.dict_link[node]
+            while k:
+                length, canonical = self.output[k]
+                start, end = pos - length + 1, pos + 1
+                # 영문/숫자로 시작하거나 끝나는 패턴은 더 긴 영문 단어의 일부이면 제외
+                cut_left = start > 0 and _is_word_char(text[start]) and _is_word_char(text[start - 1])
+                cut_right = end < len(text) and _is_word_char(text[pos]) and _is_word_char(text[end])
+                if not (cut_left or cut_right):
+                    yield start, end, canonical
+                k = self.dict_link[k]
+
+    def find(self, text):
+        """겹치지 않는 매칭의 대표 키워드 (왼쪽 우선, 같은 위치는 긴 패턴, 순서 유지 중복 제거)"""
+        matches = sorted(self.iter_matches(text), key=lambda m: (m[0], -m[1]))
+        keywords = []
+        last_end = 0
+        for start, end, canonical in matches:
+            if start >= last_end:
+                keywords.append(canonical)
+                last_end = end
+        return list(dict.fromkeys(keywords))
+
+
+def build_patterns(docs, min_freq=BACKFILL_MIN_FREQ):
+    """키워드가 있는 문서의 어휘 + 동의어 표면형 → 패턴 사전 (표면형 → 대표 키워드)"""
+    df_counter = Counter()
+    for doc in docs:
+        df_counter.update(set(doc))
+
+    vocab = {kw for kw, cnt in df_counter.items() if cnt >= min_freq and is_valid_keyword(kw)}
+    patterns = {kw: kw for kw in vocab}
+    for surface, canonical in SYNONYM_MAP.items():
+        if canonical in vocab and len(surface) >= 2:
+            patterns.setdefault(surface, canonical)
+    return patterns
+
+
+def backfill_keywords(docs, titles, source, min_freq=BACKFILL_MIN_FREQ, max_keywords=BACKFILL_MAX_KEYWORDS):
+    """키워드 없는 문서의 제목 → 추론 키워드 목록 (매칭이 없는 문서는 제외)
+
+    Args:
+        docs: 키워드가 있는 문서의 키워드 목록 (패턴 어휘)
+        titles: 키워드가 없는 문서의 제목
+        source: 'news' / 'paper' (결과 파일 이름)
+
+    Returns:
+        list[InferredKeywords] (추론 키워드가 있는 문서만)
+    """
+    matcher = KeywordMatcher(build_patterns(docs, min_freq))
+    inferred = []
+    records = []
+    for title in titles:
+        if not isinstance(title, str) or not title:
+            continue
+        keywords = matcher.find(title)[:max_keywords]
+        if keywords:
+            inferred.append(InferredKeywords(keywords))
+            records.append({'title': title, 'keywords': keywords, 'inferred': True})
+
+    print(f"  키워드 보완 ({source}): 키워드 없는 문서 {len(titles):,}건 중 {len(inferred):,}건에 추론 키워드 부여 "
+          f"(패턴 노드 {len(matcher):,}개)")
+
+    output_path = OUTPUT_DIR / f'{source}_inferred_keywords.json'
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'n_missing': len(titles),
+            'n_inferred': len(inferred),
+            'min_freq': min_freq,
+            'documents': records,
+        }, f, ensure_ascii=False, indent=2)
+    return inferred
@@ -0,0 +1,280 @@
+"""
+키워드 네트워크 분석 (동시 출현 그래프)
+- 뉴스/논문 동시 출현 희소 행렬을 가중 그래프로 사용 (노드별 Python 객체 없이 배열 연산)
+- 중심성: 가중 연결 중심성(weighted degree), PageRank (희소 행렬 power iteration)
+- 커뮤니티 탐지: 가중 라벨 전파 (벡터화), 모듈성(modularity) 계산
+- 뉴스 vs 논문 커뮤니티 구성 비교 (NMI, 커뮤니티별 최대 Jaccard 매칭)
+"""
+
+import json
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR,
+    NETWORK_MIN_FREQ, NETWORK_MIN_EDGE_WEIGHT, NETWORK_PAGERANK_DAMPING,
+    NETWORK_MAX_ITER, NETWORK_TOP_N, NETWORK_SEED,
+    init_dirs
+)
+from cooccurrence_external import load_or_build_cooccurrence_matrix
+from profiling import span, start_run, finish_run
+
+
+def build_graph(matrix, vocab, keyword_freq, min_freq=NETWORK_MIN_FREQ,
+                min_weight=NETWORK_MIN_EDGE_WEIGHT):
+    """동시 출현 행렬 → 분석용 그래프 (저빈도 노드/약한 간선 제거)
+
+    Returns:
+        graph: scipy.sparse.csr_matrix (float64 가중 인접 행렬)
+        nodes: list[str]
+        freq: np.ndarray (노드별 문서 빈도)
+    """
+    keep = np.nonzero(keyword_freq >= min_freq)[0]
+    graph = matrix[keep][:, keep].tocsr().astype(np.float64)
+    graph.data[graph.data < min_weight] = 0
+    graph.eliminate_zeros()
+    return graph, [vocab[i] for i in keep], keyword_freq[keep]
+
+
+def weighted_degree(graph):
+    """가중 연결 중심성 (간선 가중치 합)"""
+    return np.asarray(graph.sum(axis=1)).ravel()
+
+
+def pagerank(graph, damping=NETWORK_PAGERANK_DAMPING, max_iter=NETWORK_MAX_ITER, tol=1e-10):
+    """가중 PageRank (희소 행렬 power iteration, 고립 노드 질량은 균등 분배)"""
+    n = graph.shape[0]
+    if n == 0:
+        return np.empty(0)
+
+    out_weight = weighted_degree(graph)
+    dangling = out_weight == 0
+    inv = np.zeros(n)
+    inv[~dangling] = 1.0 / out_weight[~dangling]
+    transition_t = (sparse.diags(inv) @ graph).T.tocsr()
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        new_rank = damping * (transition_t @ rank)
+        new_rank += (damping * rank[dangling].sum() + (1 - damping)) / n
+        if np.abs(new_rank - rank).sum() < tol:
+            rank = new_rank
+            break
+        rank = new_rank
+    return rank
+
+
+def label_propagation(graph, max_iter=NETWORK_MAX_ITER, seed=NETWORK_SEED):
+    """가중 라벨 전파 커뮤니티 탐지 (벡터화)
+
+    - 각 반복에서 무작위 절반의 노드만 갱신하여 동기 갱신의 진동을 방지
+    - 이웃 라벨별 가중치 합이 최대인 라벨 선택 (동률이면 현재 라벨 유지, 아니면 무작위)
+    """
+    rng = np.random.default_rng(seed)
+    n = graph.shape[0]
+    labels = np.arange(n, dtype=np.int64)
+    if graph.nnz == 0:
+        # 간선이 없으면 (NETWORK_MIN_EDGE_WEIGHT로 모두 걸러진 경우 등) 노드마다 단독 커뮤니티
+        return labels
+    coo = graph.tocoo()
+    rows, cols, weights = coo.row.astype(np.int64), coo.col, coo.data
+    has_edges = np.diff(graph.indptr) > 0
+    eps = 1e-6 * (weights.min() if len(weights) else 1.0)
+
+    for _ in range(max_iter):
+        key = rows * n + labels[cols]
+        unique_keys, inverse = np.unique(key, return_inverse=True)
+        node, label = unique_keys // n, unique_keys % n
+
+        # 동률 처리용 미세 가산: 현재 라벨 우선, 나머지는 무작위
+        score = np.bincount(inverse, weights=weights.astype(np.float64), minlength=len(unique_keys))
+        score += eps * (0.5 * (label == labels[node]) + 0.4 * rng.random(len(score)))
+
+        # unique_keys가 노드 순으로 정렬되어 있으므로 노드별 구간 최댓값으로 최선 라벨 선택
+        starts = np.nonzero(np.r_[True, node[1:] != node[:-1]])[0]
+        group_max = np.maximum.reduceat(score, starts)
+        is_best = score == np.repeat(group_max, np.diff(np.r_[starts, len(score)]))
+        best = np.nonzero(is_best)[0]
+        best = best[np.r_[True, node[best][1:] != node[best][:-1]]]
+        best_node, best_label = node[best], label[best]
+
+        if np.array_equal(labels[best_node], best_label):
+            break
+        update = rng.random(len(best_node)) < 0.5
+        labels[best_node[update]] = best_label[update]
+
+    labels[~has_edges] = np.arange(n)[~has_edges]
+    _, labels = np.unique(labels, return_inverse=True)
+    return labels
+
+
+def modularity(graph, labels):
+    """가중 모듈성 Q"""
+    total = graph.sum()
+    if total == 0:
+        return 0.0
+    coo = graph.tocoo()
+    internal = np.bincount(labels[coo.row], weights=coo.data * (labels[coo.row] == labels[coo.col]),
+                           minlength=labels.max() + 1)
+    degree = np.bincount(labels, weights=weighted_degree(graph), minlength=labels.max() + 1)
+    return float(np.sum(internal / total - (degree / total) ** 2))
+
+
+def normalized_mutual_info(labels_a, labels_b):
+    """두 커뮤니티 할당 간 정규화 상호정보량 (NMI, 산술평균 정규화)"""
+    n = len(labels_a)
+    if n == 0:
+        return 0.0
+    _, a = np.unique(labels_a, return_inverse=True)
+    _, b = np.unique(labels_b, return_inverse=True)
+    joint = sparse.coo_matrix((np.ones(n), (a, b))).tocsr()
+    joint.sum_duplicates()
+    pa = np.asarray(joint.sum(axis=1)).ravel() / n
+    pb = np.asarray(joint.sum(axis=0)).ravel() / n
+    coo = joint.tocoo()
+    pab = coo.data / n
+    mi = np.sum(pab * np.log(pab / (pa[coo.row] * pb[coo.col])))
+    ha = -np.sum(pa[pa > 0] * np.log(pa[pa > 0]))
+    hb = -np.sum(pb[pb > 0] * np.log(pb[pb > 0]))
+    if ha + hb == 0:
+        return 1.0
+    return float(2 * mi / (ha + hb))
+
+
+def analyze_network(source_name, source):
+    """소스별 네트워크 분석"""
+    print(f"\n{'=' * 50}")
+    print(f"{source_name} 키워드 네트워크 분석")
+    print('=' * 50)
+
+    with span('load', f'{source} 동시 출현 행렬'):
+        matrix, vocab, keyword_freq, n_docs = load_or_build_cooccurrence_matrix(source)
+
+    with span('normalize', f'{source} 그래프 구성'):
+        graph, nodes, freq = build_graph(matrix, vocab, keyword_freq)
+    print(f"노드 수: {graph.shape[0]:,} / 간선 수: {graph.nnz // 2:,}")
+
+    with span('score', f'{source} 중심성', items=graph.shape[0]):
+        degree = weighted_degree(graph)
+        rank = pagerank(graph)
+
+    with span('score', f'{source} 커뮤니티', items=graph.shape[0]):
+        labels = label_propagation(graph)
+        q = modularity(graph, labels)
+
+    sizes = np.bincount(labels)
+    print(f"커뮤니티 수: {np.count_nonzero(sizes > 1):,} (2개 이상 키워드) / 모듈성: {q:.4f}")
+
+    top_pr = np.argsort(-rank)[:NETWORK_TOP_N]
+    print(f"\n[PageRank 상위 15개 키워드]")
+    for i in top_pr[:15]:
+        print(f"  {nodes[i]:<20} PageRank {rank[i]:.5f} | 가중 연결 {degree[i]:,.0f}")
+
+    communities = []
+    for c in np.argsort(-sizes):
+        if sizes[c] < 2 or len(communities) >= NETWORK_TOP_N:
+            break
+        members = np.nonzero(labels == c)[0]
+        members = members[np.argsort(-rank[members])]
+        communities.append({
+            'id': int(c),
+            'size': int(sizes[c]),
+            'pagerank_sum': round(float(rank[members].sum()), 6),
+            'top_keywords': [nodes[i] for i in members[:20]],
+        })
+
+    print(f"\n[주요 커뮤니티]")
+    for comm in communities[:10]:
+        print(f"  #{comm['id']} ({comm['size']:,}개): {', '.join(comm['top_keywords'][:8])}")
+
+    result = {
+        'n_docs': int(n_docs),
+        'n_nodes': int(graph.shape[0]),
+        'n_edges': int(graph.nnz // 2),
+        'modularity': round(q, 6),
+        'top_pagerank': [{'keyword': nodes[i], 'pagerank': round(float(rank[i]), 8),
+                          'weighted_degree': float(degree[i]), 'freq': int(freq[i])}
+                         for i in top_pr],
+        'top_degree': [{'keyword': nodes[i], 'weighted_degree': float(degree[i])}
+                       for i in np.argsort(-degree)[:NETWORK_TOP_N]],
+        'communities': communities,
+    }
+    membership = dict(zip(nodes, labels.tolist()))
+    return result, membership
+
+
+def compare_communities(news_membership, paper_membership, news_result, paper_result):
+    """뉴스/논문 공통 키워드의 커뮤니티 구성 비교"""
+    print("\n" + "=" * 50)
+    print("뉴스 vs 논문 커뮤니티 비교")
+    print("=" * 50)
+
+    common = sorted(set(news_membership) & set(paper_membership))
+    news_labels = np.array([news_membership[kw] for kw in common], dtype=np.int64)
+    paper_labels = np.array([paper_membership[kw] for kw in common], dtype=np.int64)
+    nmi = normalized_mutual_info(news_labels, paper_labels)
+    print(f"공통 키워드 수: {len(common):,} / NMI: {nmi:.4f}")
+
+    # 뉴스 주요 커뮤니티별로 가장 많이 겹치는 논문 커뮤니티 (공통 키워드 기준 Jaccard)
+    paper_sizes = np.bincount(paper_labels) if len(paper_labels) else np.zeros(0, dtype=np.int64)
+    matches = []
+    for comm in news_result['communities']:
+        mask = news_labels == comm['id']
+        if not mask.any():
+            continue
+        paper_ids, overlap = np.unique(paper_labels[mask], return_counts=True)
+        jaccard = overlap / (mask.sum() + paper_sizes[paper_ids] - overlap)
+        best = int(np.argmax(jaccard))
+        shared_idx = np.nonzero(mask & (paper_labels == paper_ids[best]))[0]
+        shared = [common[i] for i in shared_idx]
+        matches.append({
+            'news_community': comm['id'],
+            'news_top_keywords': comm['top_keywords'][:10],
+            'paper_community': int(paper_ids[best]),
+            'jaccard': round(float(jaccard[best]), 4),
+            'shared_keywords': shared[:20],
+        })
+
+    print(f"\n[뉴스 커뮤니티별 최대 일치 논문 커뮤니티]")
+    for m in matches[:10]:
+        print(f"  뉴스 #{m['news_community']} ↔ 논문 #{m['paper_community']} "
+              f"(Jaccard {m['jaccard']:.2f}): {', '.join(m['shared_keywords'][:6])}")
+
+    return {'common_keywords': len(common), 'nmi': round(nmi, 6), 'matches': matches}
+
+
+def main():
+    print("\n" + "#" * 60)
+    print("#  키워드 네트워크 분석: 중심성 + 커뮤니티 탐지")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('network_analysis')
+
+    news_result, news_membership = analyze_network("뉴스", 'news')
+    paper_result, paper_membership = analyze_network("논문", 'paper')
+
+    with span('score', '커뮤니티 비교'):
+        comparison = compare_communities(news_membership, paper_membership, news_result, paper_result)
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'network_analysis.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'news': news_result,
+                'paper': paper_result,
+                'comparison': comparison,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  네트워크 분석 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
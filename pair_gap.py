@@ -0,0 +1,189 @@
+"""
+키워드 쌍 간극 분석 (Pair-level Gap Analysis)
+- 뉴스/논문 동시 출현 행렬을 합집합 어휘로 정렬한 뒤 상삼각(i < j) 쌍만 사용
+- 후보: 뉴스 또는 논문 동시 출현 문서 수가 기준 이상인 모든 쌍 (희소 행렬 구조 합집합)
+- 쌍 비율: 1000건당 동시 출현 문서 수 (Phase 3 간극 지수와 같은 정의), 간극 = 뉴스 - 논문
+- 유의성: 두 비율 z-검정 (합동 비율), 양측 p-value
+- 쌍마다 Python 반복 없이 배열 연산으로 수백만 후보 쌍을 한 번에 평가
+"""
+
+import json
+
+import numpy as np
+from scipy import sparse
+from scipy.special import ndtr
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR,
+    PAIR_MIN_NEWS_COUNT, PAIR_MIN_PAPER_COUNT, PAIR_MIN_Z, PAIR_TOP_N, TARGET_PAIRS,
+    init_dirs
+)
+from cooccurrence_external import load_or_build_cooccurrence_matrix
+from profiling import span, start_run, finish_run
+
+
+def align_matrices(news, paper):
+    """두 동시 출현 행렬을 합집합 어휘 기준 상삼각 행렬로 정렬
+
+    Returns:
+        news_upper, paper_upper: scipy.sparse.csr_matrix
+        vocab: list[str]
+        news_freq, paper_freq: np.ndarray (합집합 어휘 기준 문서 빈도)
+    """
+    vocab = sorted(set(news[1]) | set(paper[1]))
+    index = {kw: i for i, kw in enumerate(vocab)}
+    aligned = []
+    for matrix, source_vocab, keyword_freq, _ in (news, paper):
+        ids = np.array([index[kw] for kw in source_vocab], dtype=np.int64)
+        coo = matrix.tocoo()
+        rows, cols = ids[coo.row], ids[coo.col]
+        upper = rows < cols
+        aligned.append(sparse.csr_matrix((coo.data[upper], (rows[upper], cols[upper])),
+                                         shape=(len(vocab), len(vocab))))
+        freq = np.zeros(len(vocab), dtype=np.int64)
+        freq[ids] = keyword_freq
+        aligned.append(freq)
+    news_upper, news_freq, paper_upper, paper_freq = aligned
+    return news_upper, paper_upper, vocab, news_freq, paper_freq
+
+
+def candidate_pairs(news_upper, paper_upper, min_news=PAIR_MIN_NEWS_COUNT, min_paper=PAIR_MIN_PAPER_COUNT):
+    """지지도 기준을 넘는 쌍 (두 행렬의 희소 구조 합집합) 및 양쪽 동시 출현 수
+
+    Returns:
+        rows, cols, news_count, paper_count: np.ndarray
+    """
+    news_support = news_upper.multiply(news_upper >= min_news)
+    paper_support = paper_upper.multiply(paper_upper >= min_paper)
+    pattern = (abs(news_support) + abs(paper_support)).tocoo()
+    rows, cols = pattern.row, pattern.col
+
+    news_count = np.asarray(news_upper[rows, cols]).ravel().astype(np.int64)
+    paper_count = np.asarray(paper_upper[rows, cols]).ravel().astype(np.int64)
+    return rows, cols, news_count, paper_count
+
+
+def pair_gap_scores(news_count, paper_count, n_news, n_paper):
+    """쌍별 1000건당 비율, 간극, 두 비율 z-검정
+
+    Returns:
+        dict (news_ratio, paper_ratio, gap_index, z, p_value)
+    """
+    p1 = news_count / n_news
+    p2 = paper_count / n_paper
+    pooled = (news_count + paper_count) / (n_news + n_paper)
+    se = np.sqrt(pooled * (1 - pooled) * (1 / n_news + 1 / n_paper))
+    z = np.divide(p1 - p2, se, out=np.zeros_like(p1), where=se > 0)
+    return {
+        'news_ratio': p1 * 1000,
+        'paper_ratio': p2 * 1000,
+        'gap_index': (p1 - p2) * 1000,
+        'z': z,
+        'p_value': 2 * ndtr(-np.abs(z)),
+    }
+
+
+def pair_records(order, rows, cols, vocab, news_count, paper_count, news_freq, paper_freq, scores):
+    return [{
+        'keywords': [vocab[rows[k]], vocab[cols[k]]],
+        'news_count': int(news_count[k]),
+        'paper_count': int(paper_count[k]),
+        'news_ratio': round(float(scores['news_ratio'][k]), 4),
+        'paper_ratio': round(float(scores['paper_ratio'][k]), 4),
+        'gap_index': round(float(scores['gap_index'][k]), 4),
+        'z': round(float(scores['z'][k]), 3),
+        'p_value': float(f"{scores['p_value'][k]:.3g}"),
+        'news_keyword_freq': [int(news_freq[rows[k]]), int(news_freq[cols[k]])],
+        'paper_keyword_freq': [int(paper_freq[rows[k]]), int(paper_freq[cols[k]])],
+    } for k in order]
+
+
+def print_pairs(title, pairs):
+    print(f"\n[{title}]")
+    print("-" * 80)
+    print(f"{'키워드 쌍':<30} | {'뉴스':>7} | {'논문':>7} | {'뉴스비율':>8} | {'논문비율':>8} | {'간극':>8} | {'z':>7}")
+    print("-" * 80)
+    if not pairs:
+        print("  (해당 없음)")
+    for p in pairs[:20]:
+        name = ' - '.join(p['keywords'])
+        print(f"{name:<30} | {p['news_count']:>7,} | {p['paper_count']:>7,} | {p['news_ratio']:>8.2f} | "
+              f"{p['paper_ratio']:>8.2f} | {p['gap_index']:>8.2f} | {p['z']:>7.2f}")
+
+
+def main():
+    print("\n" + "#" * 60)
+    print("#  키워드 쌍 간극 분석")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('pair_gap')
+
+    with span('load', '동시 출현 행렬'):
+        news = load_or_build_cooccurrence_matrix('news')
+        paper = load_or_build_cooccurrence_matrix('paper')
+    n_news, n_paper = news[3], paper[3]
+
+    with span('normalize', '어휘 정렬'):
+        news_upper, paper_upper, vocab, news_freq, paper_freq = align_matrices(news, paper)
+
+    with span('score', '후보 쌍') as s:
+        rows, cols, news_count, paper_count = candidate_pairs(news_upper, paper_upper)
+        scores = pair_gap_scores(news_count, paper_count, n_news, n_paper)
+        s.items = len(rows)
+    print(f"\n후보 쌍 수 (뉴스 ≥ {PAIR_MIN_NEWS_COUNT} 또는 논문 ≥ {PAIR_MIN_PAPER_COUNT}): {len(rows):,}")
+
+    significant = np.abs(scores['z']) >= PAIR_MIN_Z
+    gap = scores['gap_index']
+    blue = np.nonzero(significant & (gap > 0))[0]
+    blue = blue[np.argsort(-gap[blue], kind='stable')][:PAIR_TOP_N]
+    academic = np.nonzero(significant & (gap < 0))[0]
+    academic = academic[np.argsort(gap[academic], kind='stable')][:PAIR_TOP_N]
+
+    args = (rows, cols, vocab, news_count, paper_count, news_freq, paper_freq, scores)
+    blue_pairs = pair_records(blue, *args)
+    academic_pairs = pair_records(academic, *args)
+    print_pairs(f"블루오션 키워드 조합 (|z| ≥ {PAIR_MIN_Z}, 간극 내림차순)", blue_pairs)
+    print_pairs(f"학술선도 키워드 조합 (|z| ≥ {PAIR_MIN_Z}, 간극 오름차순)", academic_pairs)
+
+    # Phase 5 분석 대상 쌍의 위치 (후보에 없으면 지지도 미달)
+    index = {kw: i for i, kw in enumerate(vocab)}
+    code = rows.astype(np.int64) << 32 | cols
+    sorter = np.argsort(code)
+    targets = []
+    print("\n[Phase 5 분석 대상 조합]")
+    for a, b in TARGET_PAIRS:
+        if a not in index or b not in index:
+            continue
+        i, j = sorted((index[a], index[b]))
+        pos = np.searchsorted(code, (i << 32) | j, sorter=sorter)
+        if pos < len(code) and code[sorter[pos]] == ((i << 32) | j):
+            record = pair_records([sorter[pos]], *args)[0]
+            targets.append(record)
+            print(f"  {a} - {b}: 간극 {record['gap_index']:.2f} (z = {record['z']:.2f})")
+        else:
+            print(f"  {a} - {b}: 지지도 미달")
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'pair_gap_analysis.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'n_news_docs': int(n_news),
+                'n_paper_docs': int(n_paper),
+                'n_candidates': int(len(rows)),
+                'blue_ocean_pairs': blue_pairs,
+                'academic_lead_pairs': academic_pairs,
+                'target_pairs': targets,
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  키워드 쌍 간극 분석 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+"""
+뉴스 → 논문 검색 색인 (희소 BM25 / TF-IDF)
+- 색인: 논문 × 키워드 가중치 행렬 (CSR), 논문 키워드(KYWD) + 제목 명사(RETRIEVAL_USE_TITLES)
+    bm25 : idf(t) × tf × (k1 + 1) / (tf + k1 × (1 - b + b × 문서 길이 / 평균 길이))
+    tfidf: tf × idf 행을 L2 정규화 (질의도 정규화 → 점수 = 코사인 유사도)
+  키워드와 제목 명사에 모두 나오면 tf = 2 (문서 ID = NODE_LIST 순서)
+- 질의: 뉴스 기사(키워드 + 제목 명사) 또는 간극 분석 블루오션 키워드, 자유 텍스트
+  논문 어휘에 없는 질의 키워드는 무시
+- 질의 RETRIEVAL_BATCH_SIZE개씩 묶어 (질의 × 키워드) @ (키워드 × 논문) 희소 행렬곱 1회
+  → 점수가 0이 아닌 항목만 정렬해 행별 상위 K (파이썬 반복 없이 lexsort)
+- 결과: output/paper_retrieval.json (간극 키워드, 뉴스 예시), output/news_paper_topk.npz (전체 뉴스)
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    NEWS_FILES, PAPER_FILE, OUTPUT_DIR, NEWS_EXCLUDE_CATEGORIES, NEWS_CATEGORY_COLUMN,
+    NEWS_TITLE_COLUMN, PAPER_TITLE_FIELD,
+    GAP_NEWS_MIN_FREQ, GAP_BLUE_OCEAN_THRESHOLD, GAP_TOP_N,
+    RETRIEVAL_METHOD, RETRIEVAL_BM25_K1, RETRIEVAL_BM25_B, RETRIEVAL_USE_TITLES,
+    RETRIEVAL_TOP_K, RETRIEVAL_BATCH_SIZE,
+    normalize_keyword, is_valid_keyword, init_dirs
+)
+from bitmap_index import _parse_keywords
+from corpus import build_vocab, csr_to_matrix
+from gap_sweep import sweep_candidates
+from profiling import span, start_run, finish_run
+
+
+INDEX_PATH = OUTPUT_DIR / 'paper_retrieval_index.npz'
+INDEX_META_PATH = OUTPUT_DIR / 'paper_retrieval_index.json'
+
+
+def _with_titles(docs, titles, use_titles):
+    """키워드 목록 + 제목 명사 (중복 허용: 양쪽에 나오면 tf 2)"""
+    if not use_titles:
+        return docs
+    from tokenizer import title_keywords
+
+    return [doc + nouns for doc, nouns in zip(docs, title_keywords(titles))]
+
+
+def load_papers(use_titles=RETRIEVAL_USE_TITLES):
+    """NODE_LIST → (문서별 용어 목록, 논문 제목) - 키워드 없는 논문도 ID 유지를 위해 포함"""
+    with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    items = data['NODE_LIST']
+    docs = [_parse_keywords(str(item.get('KYWD') or '')) for item in items]
+    titles = [str(item.get(PAPER_TITLE_FIELD) or '') for item in items]
+    return _with_titles(docs, titles, use_titles), titles
+
+
+def load_news(use_titles=RETRIEVAL_USE_TITLES):
+    """뉴스 원본 → (문서별 용어 목록, 기사 제목, (파일 번호, 행 번호)) - 제외 카테고리 기사 제외"""
+    import pandas as pd
+
+    docs, titles, locations = [], [], []
+    for file_no, file in enumerate(NEWS_FILES):
+        df = pd.read_excel(file, usecols=[NEWS_CATEGORY_COLUMN, NEWS_TITLE_COLUMN, '키워드'])
+        keep = ~df[NEWS_CATEGORY_COLUMN].isin(NEWS_EXCLUDE_CATEGORIES)
+        df = df[keep]
+        docs.extend(_parse_keywords(raw) for raw in df['키워드'])
+        titles.extend(t if isinstance(t, str) else '' for t in df[NEWS_TITLE_COLUMN])
+        locations.extend((file_no, int(row)) for row in np.nonzero(keep.to_numpy())[0])
+    return _with_titles(docs, titles, use_titles), titles, locations
+
+
+def terms_to_matrix(docs, vocab_index):
+    """용어 목록 → (문서 × 어휘) 빈도 CSR (어휘에 없는 용어 무시, 중복은 빈도로 합산)"""
+    indptr = np.zeros(len(docs) + 1, dtype=np.int64)
+    indices = []
+    for d, doc in enumerate(docs):
+        ids = [vocab_index[t] for t in doc if t in vocab_index]
+        indices.extend(ids)
+        indptr[d + 1] = len(indices)
+    matrix = csr_to_matrix(indptr, np.array(indices, dtype=np.int32), len(vocab_index), dtype=np.float32)
+    matrix.sum_duplicates()
+    return matrix
+
+
+def _normalize_rows(matrix):
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    scale = np.repeat(1 / norms, np.diff(matrix.indptr)).astype(matrix.dtype)
+    matrix.data *= scale
+    return matrix
+
+
+def top_k_rows(scores, k):
+    """희소 점수 행렬 → 행별 상위 k (열 번호, 점수), 빈자리는 -1 / 0
+
+    동점은 열 번호(논문 ID) 오름차순
+    점수 행렬이 조밀하면(공통 키워드가 많은 질의) 밀집 배열로 펼쳐 argpartition (정렬 비용 감소)
+    """
+    scores = scores.tocsr()
+    scores.eliminate_zeros()
+    n_rows, n_cols = scores.shape
+    if k < n_cols and scores.nnz * 8 > n_rows * n_cols:
+        dense = scores.toarray()
+        kth = -np.partition(-dense, k - 1, axis=1)[:, k - 1:k]
+        # k번째 점수보다 큰 열 전부 + k번째 점수와 같은 열은 열 번호 순으로 남은 자리만큼
+        above = dense > kth
+        tied = dense == kth
+        selected = above | (tied & (np.cumsum(tied, axis=1) <= k - above.sum(axis=1, keepdims=True)))
+        top = np.nonzero(selected)[1].reshape(n_rows, k)
+        top_scores = np.take_along_axis(dense, top, axis=1)
+        # 상위 k개 안에서 점수 내림차순, 동점은 열 번호 오름차순
+        order = np.lexsort((top, -top_scores), axis=1)
+        ids = np.take_along_axis(top, order, axis=1).astype(np.int64)
+        values = np.take_along_axis(top_scores, order, axis=1).astype(np.float32)
+        ids[values <= 0] = -1
+        values[values <= 0] = 0
+        return ids, values
+
+    rows = np.repeat(np.arange(n_rows), np.diff(scores.indptr))
+    order = np.lexsort((scores.indices, -scores.data, rows))
+    rank = np.arange(len(order)) - scores.indptr[rows[order]]
+    keep = rank < k
+
+    ids = np.full((n_rows, k), -1, dtype=np.int64)
+    values = np.zeros((n_rows, k), dtype=np.float32)
+    ids[rows[order][keep], rank[keep]] = scores.indices[order][keep]
+    values[rows[order][keep], rank[keep]] = scores.data[order][keep]
+    return ids, values
+
+
+class PaperIndex:
+    """논문 희소 검색 색인 (키워드 × 논문 가중치 행렬)"""
+
+    def __init__(self, weights, vocab, idf, titles, method=RETRIEVAL_METHOD):
+        self.weights = weights.tocsr()      # (키워드 × 논문) - 질의 @ weights 로 바로 점수 계산
+        self.vocab = list(vocab)
+        self.vocab_index = {kw: i for i, kw in enumerate(self.vocab)}
+        self.idf = idf
+        self.titles = list(titles)
+        self.method = method
+
+    @classmethod
+    def build(cls, docs, titles, method=RETRIEVAL_METHOD, k1=RETRIEVAL_BM25_K1, b=RETRIEVAL_BM25_B):
+        if method not in ('bm25', 'tfidf'):
+            raise ValueError(f"알 수 없는 검색 방식: {method} (가능: bm25, tfidf)")
+        vocab, vocab_index, doc_freq = build_vocab(docs)
+        tf = terms_to_matrix(docs, vocab_index)
+        n_docs = len(docs)
+        row_of = np.repeat(np.arange(n_docs), np.diff(tf.indptr))
+
+        if method == 'bm25':
+            idf = np.log(1 + (n_docs - doc_freq + 0.5) / (doc_freq + 0.5)).astype(np.float32)
+            length = np.asarray(tf.sum(axis=1)).ravel()
+            avg_length = length.mean() if n_docs and length.mean() > 0 else 1.0
+            norm = k1 * (1 - b + b * length / avg_length)
+            tf.data = idf[tf.indices] * tf.data * (k1 + 1) / (tf.data + norm[row_of])
+        else:
+            idf = (np.log((1 + n_docs) / (1 + doc_freq)) + 1).astype(np.float32)
+            tf.data = tf.data * idf[tf.indices]
+            tf = _normalize_rows(tf)
+        return cls(tf.T, vocab, idf, titles, method)
+
+    def __len__(self):
+        return self.weights.shape[1]
+
+    def query_matrix(self, docs):
+        """질의 용어 목록 → (질의 × 어휘) 질의 벡터 (bm25: 0/1, tfidf: L2 정규화 tf-idf)"""
+        queries = terms_to_matrix(docs, self.vocab_index)
+        if self.method == 'bm25':
+            queries.data[:] = 1
+            return queries
+        queries.data *= self.idf[queries.indices]
+        return _normalize_rows(queries)
+
+    def search(self, docs, k=RETRIEVAL_TOP_K, batch_size=RETRIEVAL_BATCH_SIZE):
+        """질의 목록 → 질의별 상위 k 논문 (ids: -1은 빈자리, scores)"""
+        queries = self.query_matrix(docs)
+        ids = np.full((len(docs), k), -1, dtype=np.int64)
+        scores = np.zeros((len(docs), k), dtype=np.float32)
+        for start in range(0, len(docs), batch_size):
+            end = min(start + batch_size, len(docs))
+            ids[start:end], scores[start:end] = top_k_rows(queries[start:end] @ self.weights, k)
+        return ids, scores
+
+    def results(self, ids, scores):
+        """한 질의의 결과 행 → [{paper_id, title, score}]"""
+        return [{'paper_id': int(i), 'title': self.titles[i], 'score': round(float(s), 4)}
+                for i, s in zip(ids, scores) if i >= 0]
+
+    def save(self):
+        np.savez(INDEX_PATH, indptr=self.weights.indptr, indices=self.weights.indices,
+                 data=self.weights.data, shape=np.array(self.weights.shape), idf=self.idf)
+        with open(INDEX_META_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'method': self.method, 'use_titles': RETRIEVAL_USE_TITLES,
+                       'k1': RETRIEVAL_BM25_K1, 'b': RETRIEVAL_BM25_B,
+                       'vocab': self.vocab, 'titles': self.titles}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls):
+        from scipy.sparse import csr_matrix
+
+        with np.load(INDEX_PATH) as data:
+            weights = csr_matrix((data['data'], data['indices'], data['indptr']), shape=tuple(data['shape']))
+            idf = data['idf']
+        with open(INDEX_META_PATH, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        return cls(weights, meta['vocab'], idf, meta['titles'], meta['method'])
+
+
+def _index_is_current():
+    """저장된 색인이 현재 설정으로 만들어졌고 논문 파일보다 최신인지"""
+    if not (INDEX_PATH.exists() and INDEX_META_PATH.exists()):
+        return False
+    if os.path.exists(PAPER_FILE) and os.path.getmtime(PAPER_FILE) > INDEX_PATH.stat().st_mtime:
+        return False
+    with open(INDEX_META_PATH, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+    return (meta['method'], meta['use_titles'], meta['k1'], meta['b']) == \
+        (RETRIEVAL_METHOD, RETRIEVAL_USE_TITLES, RETRIEVAL_BM25_K1, RETRIEVAL_BM25_B)
+
+
+def load_or_build_index(rebuild=False):
+    """저장된 색인 로드, 없거나 설정/원본이 바뀌었으면 새로 생성 후 저장"""
+    if not rebuild and _index_is_current():
+        return PaperIndex.load()
+
+    print("  논문 검색 색인을 새로 생성합니다...")
+    docs, titles = load_papers()
+    index = PaperIndex.build(docs, titles)
+    index.save()
+    return index
+
+
+def text_query(text):
+    """자유 텍스트 질의 → 용어 목록 (쉼표 구분 키워드 + 제목처럼 명사 추출)"""
+    terms = [normalize_keyword(t.strip()) for t in text.split(',') if t.strip()]
+    terms = [t for t in terms if is_valid_keyword(t)]
+    if RETRIEVAL_USE_TITLES:
+        terms += _with_titles([[]], [text], True)[0]
+    return list(dict.fromkeys(terms))
+
+
+def gap_keywords(top_n=GAP_TOP_N):
+    """gap_analysis.json의 블루오션 후보 키워드 (Phase 3과 같은 기준, 간극 내림차순)"""
+    path = OUTPUT_DIR / 'gap_analysis.json'
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        gap_data = json.load(f)
+    freq = np.array([g['news_freq'] for g in gap_data], dtype=np.float64)
+    gap = np.array([g['gap_index'] for g in gap_data], dtype=np.float64)
+    selected, _ = sweep_candidates(freq, gap, [GAP_NEWS_MIN_FREQ], [GAP_BLUE_OCEAN_THRESHOLD], top_n=top_n)
+    chosen = np.flatnonzero(selected[0, 0])
+    chosen = chosen[np.argsort(-gap[chosen], kind='stable')]
+    return [gap_data[i]['keyword'] for i in chosen]
+
+
+def print_matches(title, matches, limit=5):
+    print(f"\n  {title}")
+    if not matches:
+        print("     (일치하는 논문 없음)")
+    for m in matches[:limit]:
+        print(f"     - [{m['paper_id']}] {m['title'][:60]} ({m['score']:.3f})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 → 논문 검색 (희소 BM25 / TF-IDF)')
+    parser.add_argument('--query', nargs='+', help='자유 텍스트 질의 (지정 시 해당 질의만 검색)')
+    parser.add_argument('--top', type=int, default=RETRIEVAL_TOP_K)
+    parser.add_argument('--rebuild', action='store_true', help='저장된 색인을 무시하고 새로 생성')
+    parser.add_argument('--skip-news', action='store_true', help='전체 뉴스 기사 일괄 검색 생략')
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  뉴스 → 논문 검색")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('paper_retrieval')
+
+    with span('load', '논문 검색 색인'):
+        index = load_or_build_index(args.rebuild)
+    print(f"\n색인: 논문 {len(index):,}편 / 어휘 {len(index.vocab):,}개 / 비영 {index.weights.nnz:,} "
+          f"({index.method}{', 제목 포함' if RETRIEVAL_USE_TITLES else ''})")
+
+    if args.query:
+        text = ' '.join(args.query)
+        ids, scores = index.search([text_query(text)], args.top)
+        print_matches(f"질의: {text}", index.results(ids[0], scores[0]), args.top)
+        finish_run()
+        return
+
+    output = {'method': index.method, 'top_k': args.top, 'gap_keywords': {}, 'news_samples': []}
+
+    keywords = gap_keywords()
+    if keywords:
+        with span('score', '간극 키워드 검색', items=len(keywords)):
+            ids, scores = index.search([[kw] for kw in keywords], args.top)
+        print(f"\n[블루오션 키워드 → 관련 논문] {len(keywords)}개")
+        for kw, row_ids, row_scores in zip(keywords, ids, scores):
+            output['gap_keywords'][kw] = index.results(row_ids, row_scores)
+            print_matches(kw, output['gap_keywords'][kw], 3)
+    else:
+        print("\n  gap_analysis.json이 없거나 블루오션 후보가 없어 간극 키워드 검색을 생략합니다.")
+
+    if not args.skip_news:
+        with span('load', '뉴스 질의') as s:
+            news_docs, news_titles, locations = load_news()
+            s.items = len(news_docs)
+        start = time.perf_counter()
+        with span('score', '뉴스 일괄 검색', items=len(news_docs)):
+            ids, scores = index.search(news_docs, args.top)
+        elapsed = time.perf_counter() - start
+        matched = int((ids[:, 0] >= 0).sum()) if len(news_docs) else 0
+        print(f"\n[뉴스 기사 → 관련 논문] 기사 {len(news_docs):,}건 / 결과 있는 기사 {matched:,}건 / "
+              f"{elapsed:.2f}s ({len(news_docs) / max(elapsed, 1e-9):,.0f} 질의/초)")
+
+        for d in np.nonzero(ids[:, 0] >= 0)[0][:20]:
+            output['news_samples'].append({
+                'file': locations[d][0], 'row': locations[d][1], 'title': news_titles[d],
+                'papers': index.results(ids[d], scores[d]),
+            })
+        for sample in output['news_samples'][:3]:
+            print_matches(sample['title'][:60], sample['papers'], 3)
+
+        with span('save', '뉴스별 상위 논문'):
+            np.savez_compressed(OUTPUT_DIR / 'news_paper_topk.npz', locations=np.array(locations, dtype=np.int64),
+                                paper_ids=ids, scores=scores)
+            print(f"\n  저장: {OUTPUT_DIR / 'news_paper_topk.npz'}")
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'paper_retrieval.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  논문 검색 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -3,11 +3,34 @@ Phase 1: 데이터 전처리 - 뉴스/논문 키워드 추출 및 정제
 """
 
 import pandas as pd
+import hashlib
 import json
+import os
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 # config에서 설정 import
-from config import NEWS_FILES, PAPER_FILE, OUTPUT_DIR, NEWS_EXCLUDE_CATEGORIES, init_dirs
+from config import (
+    NEWS_FILES, PAPER_FILE, OUTPUT_DIR, NEWS_EXCLUDE_CATEGORIES,
+    PHASE1_SKETCH_MODE, SKETCH_EPSILON, SKETCH_DELTA, SKETCH_CAPACITY,
+    SKETCH_HLL_ERROR, SKETCH_BATCH_DOCS, SKETCH_TRACK_PAIRS, SKETCH_WORKERS,
+    VOCAB_PRUNE,
+    init_dirs
+)
+from ingest import iter_news_chunks
+from profiling import span, start_run, finish_run
+from sketch import KeywordSketch
+from vocab_builder import DocStream, PrunedCounter, prune_vocabulary, print_pruning
+
+
+def iter_news_keyword_lists():
+    """뉴스 엑셀 → 기사별 키워드 목록 (ingest 청크 스트림, 제외 카테고리/키워드 없는 기사는 건너뜀)"""
+    for _, _, chunk in iter_news_chunks():
+        for category, raw, _ in chunk:
+            if category in NEWS_EXCLUDE_CATEGORIES or raw in (None, ''):
+                continue
+            yield [k.strip() for k in str(raw).split(',') if k.strip()]
 
 
 def extract_news_keywords():
@@ -16,34 +39,106 @@ def extract_news_keywords():
     print("뉴스 키워드 추출 중...")
     print("=" * 50)
 
-    all_keywords = []
-    keywords_per_article = []
+    if VOCAB_PRUNE:
+        # 가지치기 모드: 청크 스트림을 두 번 순회 (기사별 전체 키워드 목록을 메모리에 만들지 않음)
+        with span('count', '뉴스 키워드 빈도') as s:
+            keywords_per_article, keyword_counter = prune_vocabulary(DocStream(iter_news_keyword_lists))
+            print_pruning('뉴스', keyword_counter)
+            n_total, n_unique = keyword_counter.pruning['total_tf'], keyword_counter.pruning['n_unique']
+            s.items = n_total
+    else:
+        all_keywords = []
+        keywords_per_article = []
+
+        for file in NEWS_FILES:
+            print(f"  처리 중: {file}")
+            with span('load', file) as s:
+                df = pd.read_excel(file)
+                s.items = len(df)
+
+            with span('normalize', file) as s:
+                # 카테고리 필터링
+                original_count = len(df)
+                df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
+                filtered_count = len(df)
+                print(f"    카테고리 필터링: {original_count:,} → {filtered_count:,} ({original_count - filtered_count:,}건 제외)")
+
+                for kw in df['키워드'].dropna():
+                    # 쉼표로 분리 후 정제
+                    keywords = [k.strip() for k in str(kw).split(',') if k.strip()]
+                    all_keywords.extend(keywords)
+                    keywords_per_article.append(set(keywords))
+                s.items = filtered_count
+
+        # 빈도수 계산
+        with span('count', '뉴스 키워드 빈도') as s:
+            keyword_counter = Counter(all_keywords)
+            n_total, n_unique = len(all_keywords), len(keyword_counter)
+            s.items = n_total
 
-    for file in NEWS_FILES:
-        print(f"  처리 중: {file}")
-        df = pd.read_excel(file)
+    print(f"\n[뉴스 결과]")
+    print(f"  총 키워드 수 (중복 포함): {n_total:,}")
+    print(f"  고유 키워드 수: {n_unique:,}")
+    print(f"  기사 수: {len(keywords_per_article):,}")
 
-        # 카테고리 필터링
-        original_count = len(df)
-        df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
-        filtered_count = len(df)
-        print(f"    카테고리 필터링: {original_count:,} → {filtered_count:,} ({original_count - filtered_count:,}건 제외)")
+    return keyword_counter, keywords_per_article
 
-        for kw in df['키워드'].dropna():
-            # 쉼표로 분리 후 정제
-            keywords = [k.strip() for k in str(kw).split(',') if k.strip()]
-            all_keywords.extend(keywords)
-            keywords_per_article.append(set(keywords))
 
-    # 빈도수 계산
-    keyword_counter = Counter(all_keywords)
+def sketch_settings_key():
+    """스케치 결과에 영향을 주는 설정의 해시 (캐시 파일 이름에 포함 → 설정이 바뀌면 다시 집계)"""
+    settings = json.dumps([sorted(NEWS_EXCLUDE_CATEGORIES), SKETCH_EPSILON, SKETCH_DELTA, SKETCH_CAPACITY,
+                           SKETCH_HLL_ERROR, SKETCH_TRACK_PAIRS, SKETCH_BATCH_DOCS], ensure_ascii=False)
+    return hashlib.sha1(settings.encode('utf-8')).hexdigest()[:12]
 
-    print(f"\n[뉴스 결과]")
-    print(f"  총 키워드 수 (중복 포함): {len(all_keywords):,}")
-    print(f"  고유 키워드 수: {len(keyword_counter):,}")
-    print(f"  기사 수: {len(keywords_per_article):,}")
 
-    return keyword_counter, keywords_per_article
+def sketch_news_file(file):
+    """뉴스 파일 1개를 스케치로 집계 (병렬 프로세스에서 실행, 파일과 설정이 같으면 캐시 재사용)"""
+    stat = os.stat(file)
+    cache_dir = OUTPUT_DIR / 'sketches'
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_dir / f'{Path(file).stem}_{stat.st_size}_{int(stat.st_mtime)}_{sketch_settings_key()}.pkl'
+    if cache_path.exists():
+        return KeywordSketch.load(cache_path), True
+
+    df = pd.read_excel(file)
+    df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
+
+    sketch = KeywordSketch(
+        epsilon=SKETCH_EPSILON, delta=SKETCH_DELTA, capacity=SKETCH_CAPACITY,
+        hll_error=SKETCH_HLL_ERROR, track_pairs=SKETCH_TRACK_PAIRS, batch_docs=SKETCH_BATCH_DOCS,
+    )
+    for kw in df['키워드'].dropna():
+        keywords = [k.strip() for k in str(kw).split(',') if k.strip()]
+        sketch.update_doc(keywords)
+
+    sketch.save(cache_path)
+    return sketch, False
+
+
+def extract_news_keywords_sketch():
+    """뉴스 데이터에서 키워드 추출 (스트리밍 스케치 모드, 고정 메모리)"""
+    print("=" * 50)
+    print("뉴스 키워드 추출 중... (스케치 모드)")
+    print("=" * 50)
+
+    with span('count', '뉴스 키워드 스케치') as s:
+        with ProcessPoolExecutor(max_workers=SKETCH_WORKERS) as pool:
+            sketches = list(pool.map(sketch_news_file, NEWS_FILES))
+
+        keyword_sketch = None
+        for file, (sketch, cached) in zip(NEWS_FILES, sketches):
+            print(f"  {'캐시 사용' if cached else '처리 완료'}: {file} ({sketch.n_docs:,}건)")
+            keyword_sketch = sketch if keyword_sketch is None else keyword_sketch.merge(sketch)
+        s.items = keyword_sketch.n_docs
+
+    bounds = keyword_sketch.error_bounds()
+    print(f"\n[뉴스 결과 (근사)]")
+    print(f"  총 키워드 수 (중복 포함): {bounds['total_keywords']:,}")
+    print(f"  고유 키워드 수 (추정): {len(keyword_sketch):,} (상대 표준오차 {bounds['hll_relative_std_error']:.2%})")
+    print(f"  기사 수: {keyword_sketch.n_docs:,}")
+    print(f"  빈도 추정 오차: ≤ {bounds['count_min_abs_error']:,} (신뢰도 {bounds['count_min_confidence']:.1%})")
+
+    return keyword_sketch, keyword_sketch.n_docs
 
 
 def extract_paper_keywords():
@@ -52,24 +147,30 @@ def extract_paper_keywords():
     print("논문 키워드 추출 중...")
     print("=" * 50)
 
-    with open(PAPER_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with span('load', PAPER_FILE) as s:
+        with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
-    node_list = data['NODE_LIST']
+        node_list = data['NODE_LIST']
+        s.items = len(node_list)
 
     all_keywords = []
     keywords_per_paper = []
 
-    for item in node_list:
-        kywd = item.get('KYWD')
-        if kywd:
-            # 쉼표로 분리 후 정제
-            keywords = [k.strip() for k in str(kywd).split(',') if k.strip()]
-            all_keywords.extend(keywords)
-            keywords_per_paper.append(set(keywords))
+    with span('normalize', PAPER_FILE) as s:
+        for item in node_list:
+            kywd = item.get('KYWD')
+            if kywd:
+                # 쉼표로 분리 후 정제
+                keywords = [k.strip() for k in str(kywd).split(',') if k.strip()]
+                all_keywords.extend(keywords)
+                keywords_per_paper.append(set(keywords))
+        s.items = len(node_list)
 
     # 빈도수 계산
-    keyword_counter = Counter(all_keywords)
+    with span('count', '논문 키워드 빈도') as s:
+        keyword_counter = Counter(all_keywords)
+        s.items = len(all_keywords)
 
     print(f"\n[논문 결과]")
     print(f"  총 키워드 수 (중복 포함): {len(all_keywords):,}")
@@ -134,6 +235,14 @@ def save_results(news_counter, paper_counter, common_keywords):
         'total_unique': len(news_counter),
         'keyword_freq': dict(news_counter.most_common(1000))
     }
+    if isinstance(news_counter, KeywordSketch):
+        news_output['approximate'] = True
+        news_output['error_bounds'] = news_counter.error_bounds()
+        news_output['top_pairs'] = [{'keywords': list(pair), 'count': cnt}
+                                    for pair, cnt in news_counter.top_pairs(1000)]
+    if isinstance(news_counter, PrunedCounter):
+        news_output['total_unique'] = news_counter.pruning['n_unique']
+        news_output['vocab_pruning'] = news_counter.pruning
     with open(OUTPUT_DIR / 'news_keywords.json', 'w', encoding='utf-8') as f:
         json.dump(news_output, f, ensure_ascii=False, indent=2)
     print(f"  저장: {OUTPUT_DIR / 'news_keywords.json'}")
@@ -159,9 +268,13 @@ def main():
     print("#" * 60)
 
     init_dirs()
+    start_run('phase1')
 
     # 1. 뉴스 키워드 추출
-    news_counter, news_per_article = extract_news_keywords()
+    if PHASE1_SKETCH_MODE:
+        news_counter, _ = extract_news_keywords_sketch()
+    else:
+        news_counter, news_per_article = extract_news_keywords()
 
     # 2. 논문 키워드 추출
     paper_counter, paper_per_doc = extract_paper_keywords()
@@ -171,10 +284,14 @@ def main():
     print_top_keywords(paper_counter, "논문", 200)
 
     # 4. 공통 키워드 분석
-    common_keywords = find_common_keywords(news_counter, paper_counter)
+    with span('score', '공통 키워드'):
+        common_keywords = find_common_keywords(news_counter, paper_counter)
 
     # 5. 결과 저장
-    save_results(news_counter, paper_counter, common_keywords)
+    with span('save'):
+        save_results(news_counter, paper_counter, common_keywords)
+
+    finish_run()
 
     print("\n" + "#" * 60)
     print("#  Phase 1 완료!")
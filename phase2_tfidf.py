@@ -3,12 +3,16 @@ Phase 2: 형태소 분석 + TF-IDF 분석
 - 한/영 키워드 통합
 - 유의어 통합
 - 불용어 제거
+- 제목 형태소 분석 키워드 추가 (config.TITLE_TOKENS, tokenizer.py)
+- 키워드 없는 문서 보완 (config.BACKFILL_KEYWORDS, keyword_matcher.py)
+- 문서 빈도 범위 밖 키워드 가지치기 (config.VOCAB_PRUNE, vocab_builder.py)
 - TF-IDF 계산
 """
 
 import pandas as pd
 import json
 from collections import Counter, defaultdict
+from itertools import chain, repeat
 from math import log
 
 # config에서 설정 import
@@ -17,8 +21,72 @@ from config import (
     NEWS_EXCLUDE_CATEGORIES,
     SYNONYM_MAP, STOPWORDS,
     NEWS_TFIDF_TOP_N, PAPER_TFIDF_TOP_N, COMMON_KEYWORD_TOP_N,
+    NEWS_TITLE_COLUMN, PAPER_TITLE_FIELD, TITLE_TOKENS, BACKFILL_KEYWORDS, VOCAB_PRUNE,
     normalize_keyword, is_valid_keyword, init_dirs
 )
+from ingest import iter_news_chunks, iter_paper_chunks
+from keyword_matcher import backfill_keywords
+from profiling import span, start_run, finish_run
+from tokenizer import title_keywords
+from vocab_builder import DocStream, prune_vocabulary, print_pruning
+
+
+def normalize_doc(raw, title_kw):
+    """키워드 원문 + 제목 키워드 → 정규화 키워드 목록 (원문 순서/중복 유지, 제목 키워드는 없는 것만 추가)"""
+    keywords = [k.strip() for k in str(raw).split(',') if k.strip()]
+    normalized = [nk for nk in map(normalize_keyword, keywords) if is_valid_keyword(nk)]
+    return normalized + [k for k in title_kw if k not in normalized]
+
+
+def iter_normalized_docs(iter_chunks):
+    """ingest 청크 스트림 → 문서별 정규화 키워드 목록 (제외 카테고리 / 키워드 없는 문서는 건너뜀)"""
+    for _, _, chunk in iter_chunks():
+        rows = [(raw, title) for category, raw, title in chunk
+                if category not in NEWS_EXCLUDE_CATEGORIES and raw not in (None, '')]
+        titles = title_keywords([title for _, title in rows]) if TITLE_TOKENS else repeat([])
+        for (raw, _), title_kw in zip(rows, titles):
+            normalized = normalize_doc(raw, title_kw)
+            if normalized:
+                yield normalized
+
+
+def count_streamed(iter_chunks, name, source):
+    """VOCAB_PRUNE: 청크 스트림을 순회마다 다시 읽어 보완/가지치기 → (문서별 키워드 집합, 키워드 빈도)
+
+    문서별 전체 키워드 목록을 메모리에 만들지 않음 (가지치기 후 남은 키워드 집합만 유지)
+    """
+    inferred = []
+    if BACKFILL_KEYWORDS:
+        missing_titles = [title for _, _, chunk in iter_chunks() for category, raw, title in chunk
+                          if category not in NEWS_EXCLUDE_CATEGORIES and raw in (None, '')]
+        with span('normalize', f'{name} 키워드 보완', items=len(missing_titles)):
+            inferred = backfill_keywords(DocStream(lambda: iter_normalized_docs(iter_chunks)), missing_titles, source)
+
+    with span('count', f'{name} 키워드 빈도') as s:
+        docs = DocStream(lambda: chain(iter_normalized_docs(iter_chunks), inferred))
+        all_docs, keyword_counter, n_total, n_unique = count_keywords(docs, name)
+        s.items = n_total
+
+    print(f"\n[{name} 정규화 결과]")
+    print(f"  문서 수: {len(all_docs):,}")
+    print(f"  총 키워드: {n_total:,}")
+    print(f"  고유 키워드: {n_unique:,}")
+
+    return all_docs, keyword_counter
+
+
+def count_keywords(doc_keywords, name):
+    """문서별 키워드 목록 → (문서별 키워드 집합, 키워드 빈도, 전체 키워드 수, 고유 키워드 수)
+
+    VOCAB_PRUNE: 문서 빈도 범위 밖 키워드는 해시 버킷으로 합산 (빈도/문서 집합에서 제외, 합계는 유지)
+        doc_keywords는 재순회 가능한 스트림(DocStream)이어도 됨 (count_streamed)
+    """
+    if VOCAB_PRUNE:
+        docs, counter = prune_vocabulary(doc_keywords)
+        print_pruning(name, counter)
+        return docs, counter, counter.pruning['total_tf'], counter.pruning['n_unique']
+    counter = Counter(chain.from_iterable(doc_keywords))
+    return [set(doc) for doc in doc_keywords], counter, sum(map(len, doc_keywords)), len(counter)
 
 
 def extract_and_normalize_news():
@@ -27,34 +95,43 @@ def extract_and_normalize_news():
     print("뉴스 키워드 추출 및 정규화 중...")
     print("=" * 50)
 
-    all_docs = []
-    all_keywords = []
+    if VOCAB_PRUNE:
+        return count_streamed(iter_news_chunks, '뉴스', 'news')
+
+    doc_keywords = []
+    missing_titles = []     # 키워드가 없는 기사 제목 (키워드 보완용)
 
     for file in NEWS_FILES:
         print(f"  처리 중: {file}")
-        df = pd.read_excel(file)
-
-        # 카테고리 필터링
-        df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
-
-        for kw in df['키워드'].dropna():
-            keywords = [k.strip() for k in str(kw).split(',') if k.strip()]
-            normalized = []
-            for k in keywords:
-                nk = normalize_keyword(k)
-                if is_valid_keyword(nk):
-                    normalized.append(nk)
-
-            if normalized:
-                all_docs.append(set(normalized))
-                all_keywords.extend(normalized)
-
-    keyword_counter = Counter(all_keywords)
+        with span('load', file) as s:
+            df = pd.read_excel(file)
+            s.items = len(df)
+
+        with span('normalize', file) as s:
+            # 카테고리 필터링
+            df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
+            missing_titles.extend(df.loc[df['키워드'].isna(), NEWS_TITLE_COLUMN])
+            df = df[df['키워드'].notna()]
+            titles = title_keywords(df[NEWS_TITLE_COLUMN]) if TITLE_TOKENS else repeat([])
+
+            for kw, title_kw in zip(df['키워드'], titles):
+                normalized = normalize_doc(kw, title_kw)
+                if normalized:
+                    doc_keywords.append(normalized)
+            s.items = len(df)
+
+    if BACKFILL_KEYWORDS:
+        with span('normalize', '뉴스 키워드 보완', items=len(missing_titles)):
+            doc_keywords.extend(backfill_keywords(doc_keywords, missing_titles, 'news'))
+
+    with span('count', '뉴스 키워드 빈도') as s:
+        all_docs, keyword_counter, n_total, n_unique = count_keywords(doc_keywords, '뉴스')
+        s.items = n_total
 
     print(f"\n[뉴스 정규화 결과]")
     print(f"  문서 수: {len(all_docs):,}")
-    print(f"  총 키워드: {len(all_keywords):,}")
-    print(f"  고유 키워드: {len(keyword_counter):,}")
+    print(f"  총 키워드: {n_total:,}")
+    print(f"  고유 키워드: {n_unique:,}")
 
     return all_docs, keyword_counter
 
@@ -65,32 +142,38 @@ def extract_and_normalize_papers():
     print("논문 키워드 추출 및 정규화 중...")
     print("=" * 50)
 
-    with open(PAPER_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    if VOCAB_PRUNE:
+        return count_streamed(iter_paper_chunks, '논문', 'paper')
 
-    all_docs = []
-    all_keywords = []
+    with span('load', PAPER_FILE) as s:
+        with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        s.items = len(data['NODE_LIST'])
 
-    for item in data['NODE_LIST']:
-        kywd = item.get('KYWD')
-        if kywd:
-            keywords = [k.strip() for k in str(kywd).split(',') if k.strip()]
-            normalized = []
-            for k in keywords:
-                nk = normalize_keyword(k)
-                if is_valid_keyword(nk):
-                    normalized.append(nk)
+    doc_keywords = []
 
+    with span('normalize', PAPER_FILE) as s:
+        items = [item for item in data['NODE_LIST'] if item.get('KYWD')]
+        titles = title_keywords([item.get(PAPER_TITLE_FIELD) for item in items]) if TITLE_TOKENS else repeat([])
+        for item, title_kw in zip(items, titles):
+            normalized = normalize_doc(item.get('KYWD'), title_kw)
             if normalized:
-                all_docs.append(set(normalized))
-                all_keywords.extend(normalized)
+                doc_keywords.append(normalized)
+        s.items = len(data['NODE_LIST'])
 
-    keyword_counter = Counter(all_keywords)
+    if BACKFILL_KEYWORDS:
+        missing_titles = [item.get(PAPER_TITLE_FIELD) for item in data['NODE_LIST'] if not item.get('KYWD')]
+        with span('normalize', '논문 키워드 보완', items=len(missing_titles)):
+            doc_keywords.extend(backfill_keywords(doc_keywords, missing_titles, 'paper'))
+
+    with span('count', '논문 키워드 빈도') as s:
+        all_docs, keyword_counter, n_total, n_unique = count_keywords(doc_keywords, '논문')
+        s.items = n_total
 
     print(f"\n[논문 정규화 결과]")
     print(f"  문서 수: {len(all_docs):,}")
-    print(f"  총 키워드: {len(all_keywords):,}")
-    print(f"  고유 키워드: {len(keyword_counter):,}")
+    print(f"  총 키워드: {n_total:,}")
+    print(f"  고유 키워드: {n_unique:,}")
 
     return all_docs, keyword_counter
 
@@ -210,6 +293,7 @@ def main():
     print("#" * 60)
 
     init_dirs()
+    start_run('phase2')
 
     news_docs, news_counter = extract_and_normalize_news()
     paper_docs, paper_counter = extract_and_normalize_papers()
@@ -218,17 +302,23 @@ def main():
     print("TF-IDF 계산 중...")
     print("=" * 50)
 
-    news_tfidf, news_df = calculate_tfidf(news_docs, news_counter, NEWS_TFIDF_TOP_N)
-    paper_tfidf, paper_df = calculate_tfidf(paper_docs, paper_counter, PAPER_TFIDF_TOP_N)
+    with span('score', '뉴스 TF-IDF', items=len(news_docs)):
+        news_tfidf, news_df = calculate_tfidf(news_docs, news_counter, NEWS_TFIDF_TOP_N)
+    with span('score', '논문 TF-IDF', items=len(paper_docs)):
+        paper_tfidf, paper_df = calculate_tfidf(paper_docs, paper_counter, PAPER_TFIDF_TOP_N)
 
     print_top_keywords(news_tfidf, "뉴스", 100)
     print_top_keywords(paper_tfidf, "논문", 100)
 
-    keyword_analysis = find_common_and_unique(
-        news_tfidf, paper_tfidf, news_counter, paper_counter
-    )
+    with span('score', '공통/고유 키워드'):
+        keyword_analysis = find_common_and_unique(
+            news_tfidf, paper_tfidf, news_counter, paper_counter
+        )
+
+    with span('save'):
+        save_results(news_tfidf, paper_tfidf, news_counter, paper_counter, keyword_analysis)
 
-    save_results(news_tfidf, paper_tfidf, news_counter, paper_counter, keyword_analysis)
+    finish_run()
 
     print("\n" + "#" * 60)
     print("#  Phase 2 완료!")
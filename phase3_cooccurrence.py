@@ -8,7 +8,7 @@ Phase 3: 동시 출현 빈도 분석 (Co-occurrence Analysis)
 import pandas as pd
 import json
 from collections import Counter, defaultdict
-from itertools import combinations
+from itertools import combinations, repeat
 
 # config에서 설정 import
 from config import (
@@ -16,37 +16,73 @@ from config import (
     NEWS_EXCLUDE_CATEGORIES,
     SYNONYM_MAP, TOPIC_KEYWORDS,
     GAP_NEWS_MIN_FREQ, GAP_PAPER_MIN_FREQ,
-    GAP_BLUE_OCEAN_THRESHOLD, GAP_ACADEMIC_THRESHOLD,
+    GAP_BLUE_OCEAN_THRESHOLD, GAP_ACADEMIC_THRESHOLD, GAP_TOP_N,
+    COOCCUR_FULL_VOCAB, NEWS_TITLE_COLUMN, PAPER_TITLE_FIELD, TITLE_TOKENS, BACKFILL_KEYWORDS,
+    INGEST_CHECKPOINT,
     normalize_keyword, is_valid_keyword, init_dirs
 )
+from cooccurrence_external import (
+    calculate_cooccurrence_store, top_cooccurring, save_cooccurrence_matrix
+)
+from corpus import CorpusStore, save_store, store_path, store_signature
+from ingest import ingest_source
+from keyword_matcher import backfill_keywords
+from profiling import span, start_run, finish_run
+from tokenizer import title_keywords
 
 
 def extract_docs_with_keywords(source='news'):
-    """문서별 키워드 추출"""
+    """문서별 키워드 추출 (BACKFILL_KEYWORDS: 키워드 없는 문서는 제목 매칭 추론 키워드로 보완)
+
+    INGEST_CHECKPOINT: 청크 단위 체크포인트 수집(ingest.py) 결과 사용 (중단 후 재실행 시 이어서 처리)
+        → 문서 목록 대신 CorpusStore 반환 (len()/순회 가능, 문서를 파이썬 목록으로 펼치지 않음)
+    """
+    if INGEST_CHECKPOINT:
+        return ingest_source(source)
+
     all_docs = []
+    missing_titles = []
 
     if source == 'news':
         for file in NEWS_FILES:
-            df = pd.read_excel(file)
-            # 카테고리 필터링
-            df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
-            for kw in df['키워드'].dropna():
-                keywords = [normalize_keyword(k.strip()) for k in str(kw).split(',') if k.strip()]
-                keywords = [k for k in keywords if is_valid_keyword(k)]  # 불용어 필터링
-                keywords = list(set(keywords))
-                if keywords:
-                    all_docs.append(keywords)
+            with span('load', file) as s:
+                df = pd.read_excel(file)
+                s.items = len(df)
+            with span('normalize', file) as s:
+                # 카테고리 필터링
+                df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
+                missing_titles.extend(df.loc[df['키워드'].isna(), NEWS_TITLE_COLUMN])
+                df = df[df['키워드'].notna()]
+                titles = title_keywords(df[NEWS_TITLE_COLUMN]) if TITLE_TOKENS else repeat([])
+                for kw, title_kw in zip(df['키워드'], titles):
+                    keywords = [normalize_keyword(k.strip()) for k in str(kw).split(',') if k.strip()]
+                    keywords = [k for k in keywords if is_valid_keyword(k)]  # 불용어 필터링
+                    keywords = list(set(keywords + title_kw))
+                    if keywords:
+                        all_docs.append(keywords)
+                s.items = len(df)
     else:
-        with open(PAPER_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        for item in data['NODE_LIST']:
-            kywd = item.get('KYWD')
-            if kywd:
-                keywords = [normalize_keyword(k.strip()) for k in str(kywd).split(',') if k.strip()]
-                keywords = [k for k in keywords if is_valid_keyword(k)]  # 불용어 필터링
-                keywords = list(set(keywords))
-                if keywords:
-                    all_docs.append(keywords)
+        with span('load', PAPER_FILE) as s:
+            with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            s.items = len(data['NODE_LIST'])
+        with span('normalize', PAPER_FILE) as s:
+            items = [item for item in data['NODE_LIST'] if item.get('KYWD')]
+            titles = title_keywords([item.get(PAPER_TITLE_FIELD) for item in items]) if TITLE_TOKENS else repeat([])
+            for item, title_kw in zip(items, titles):
+                kywd = item.get('KYWD')
+                if kywd:
+                    keywords = [normalize_keyword(k.strip()) for k in str(kywd).split(',') if k.strip()]
+                    keywords = [k for k in keywords if is_valid_keyword(k)]  # 불용어 필터링
+                    keywords = list(set(keywords + title_kw))
+                    if keywords:
+                        all_docs.append(keywords)
+            s.items = len(data['NODE_LIST'])
+        missing_titles = [item.get(PAPER_TITLE_FIELD) for item in data['NODE_LIST'] if not item.get('KYWD')]
+
+    if BACKFILL_KEYWORDS:
+        with span('normalize', f'{source} 키워드 보완', items=len(missing_titles)):
+            all_docs.extend(backfill_keywords(all_docs, missing_titles, source))
 
     return all_docs
 
@@ -77,7 +113,8 @@ def analyze_source(source_name, docs, target_keywords):
     print('=' * 50)
     print(f"총 문서 수: {len(docs):,}")
 
-    cooccur, keyword_freq = calculate_cooccurrence(docs, target_keywords)
+    with span('count', f'{source_name} 동시 출현', items=len(docs)):
+        cooccur, keyword_freq = calculate_cooccurrence(docs, target_keywords)
 
     results = {}
     for target in target_keywords:
@@ -88,6 +125,41 @@ def analyze_source(source_name, docs, target_keywords):
                 'top_cooccur': [{'keyword': k, 'count': v} for k, v in top_by_count]
             }
 
+    print_top_cooccur(results, target_keywords)
+
+    return results, cooccur, keyword_freq
+
+
+def analyze_source_full_vocab(source_name, source, docs, target_keywords):
+    """소스별 분석 (전체 어휘 외부 메모리 모드, 행렬은 output/에 저장)"""
+    print(f"\n{'=' * 50}")
+    print(f"{source_name} 동시 출현 분석 (전체 어휘)")
+    print('=' * 50)
+    print(f"총 문서 수: {len(docs):,}")
+
+    # 메모리 맵 저장소로 저장 → 병렬 워커가 복사 없이 공유 (다른 분석 모듈도 재사용)
+    # 체크포인트 수집 결과는 이미 저장소이므로 다시 쓰지 않음
+    if isinstance(docs, CorpusStore):
+        store = docs
+    else:
+        with span('save', f'{source} 코퍼스 저장소'):
+            store = save_store(store_path(source), docs, signature=store_signature(source))
+
+    with span('count', f'{source_name} 동시 출현 (전체 어휘)', items=len(docs)):
+        matrix, vocab, keyword_freq = calculate_cooccurrence_store(store)
+    print(f"어휘 수: {len(vocab):,} / 동시 출현 쌍 수: {matrix.nnz // 2:,}")
+
+    results = top_cooccurring(matrix, vocab, keyword_freq, target_keywords)
+    print_top_cooccur(results, target_keywords)
+
+    with span('save', f'{source} 동시 출현 행렬'):
+        save_cooccurrence_matrix(source, matrix, vocab, keyword_freq, len(docs))
+
+    return results
+
+
+def print_top_cooccur(results, target_keywords):
+    """주요 키워드별 동시 출현 상위 키워드 출력"""
     print(f"\n[주요 키워드별 동시 출현 상위 키워드]")
     for target in target_keywords[:15]:
         if target in results:
@@ -95,8 +167,6 @@ def analyze_source(source_name, docs, target_keywords):
             for item in results[target]['top_cooccur'][:5]:
                 print(f"   - {item['keyword']}: {item['count']:,}")
 
-    return results, cooccur, keyword_freq
-
 
 def calculate_gap_index(news_results, paper_results, news_docs, paper_docs):
     """간극 지수 계산"""
@@ -134,7 +204,7 @@ def calculate_gap_index(news_results, paper_results, news_docs, paper_docs):
     print("-" * 70)
 
     blue_ocean = [g for g in gap_analysis
-                  if g['news_freq'] > GAP_NEWS_MIN_FREQ and g['gap_index'] > GAP_BLUE_OCEAN_THRESHOLD][:20]
+                  if g['news_freq'] > GAP_NEWS_MIN_FREQ and g['gap_index'] > GAP_BLUE_OCEAN_THRESHOLD][:GAP_TOP_N]
     for item in blue_ocean:
         print(f"{item['keyword']:<15} | {item['news_freq']:>10,} | {item['paper_freq']:>10,} | "
               f"{item['news_ratio']:>10.2f} | {item['paper_ratio']:>10.2f} | {item['gap_index']:>10.2f}")
@@ -147,7 +217,7 @@ def calculate_gap_index(news_results, paper_results, news_docs, paper_docs):
     academic_lead = [g for g in gap_analysis
                      if g['paper_freq'] > GAP_PAPER_MIN_FREQ and g['gap_index'] < GAP_ACADEMIC_THRESHOLD]
     academic_lead.sort(key=lambda x: x['gap_index'])
-    for item in academic_lead[:20]:
+    for item in academic_lead[:GAP_TOP_N]:
         print(f"{item['keyword']:<15} | {item['news_freq']:>10,} | {item['paper_freq']:>10,} | "
               f"{item['news_ratio']:>10.2f} | {item['paper_ratio']:>10.2f} | {item['gap_index']:>10.2f}")
 
@@ -179,6 +249,7 @@ def main():
     print("#" * 60)
 
     init_dirs()
+    start_run('phase3')
 
     print("\n뉴스 데이터 로딩 중...")
     news_docs = extract_docs_with_keywords('news')
@@ -188,12 +259,20 @@ def main():
     paper_docs = extract_docs_with_keywords('paper')
     print(f"논문 문서 수: {len(paper_docs):,}")
 
-    news_results, _, _ = analyze_source("뉴스 (사회적 주목도)", news_docs, TOPIC_KEYWORDS)
-    paper_results, _, _ = analyze_source("논문 (학술적 연구도)", paper_docs, TOPIC_KEYWORDS)
+    if COOCCUR_FULL_VOCAB:
+        news_results = analyze_source_full_vocab("뉴스 (사회적 주목도)", 'news', news_docs, TOPIC_KEYWORDS)
+        paper_results = analyze_source_full_vocab("논문 (학술적 연구도)", 'paper', paper_docs, TOPIC_KEYWORDS)
+    else:
+        news_results, _, _ = analyze_source("뉴스 (사회적 주목도)", news_docs, TOPIC_KEYWORDS)
+        paper_results, _, _ = analyze_source("논문 (학술적 연구도)", paper_docs, TOPIC_KEYWORDS)
+
+    with span('score', '간극 분석'):
+        gap_analysis = calculate_gap_index(news_results, paper_results, news_docs, paper_docs)
 
-    gap_analysis = calculate_gap_index(news_results, paper_results, news_docs, paper_docs)
+    with span('save'):
+        save_results(news_results, paper_results, gap_analysis)
 
-    save_results(news_results, paper_results, gap_analysis)
+    finish_run()
 
     print("\n" + "#" * 60)
     print("#  Phase 3 완료!")
@@ -4,6 +4,7 @@ Phase 4: 시각화
 - 키워드 빈도 비교
 - 산점도 (뉴스 vs 논문)
 - 동시 출현 히트맵
+- 카테고리별 간극 (자동 할당 카테고리가 있으면 전체 어휘 기준)
 """
 
 import json
@@ -20,6 +21,9 @@ from config import (
     TOPIC_KEYWORDS,
     init_dirs
 )
+from category_propagation import load_keyword_categories
+from corpus import load_or_build_store
+from profiling import span, start_run, finish_run
 
 # 한글 폰트 설정
 plt.rcParams['font.family'] = 'AppleGothic'
@@ -251,6 +255,58 @@ def plot_category_comparison(gap_data):
     print(f"  저장: {VIZ_DIR / '5_category_comparison.png'}")
 
 
+def keyword_gap_indices(keywords):
+    """키워드별 간극 지수 (코퍼스 저장소의 문서 빈도 / 문서 수, Phase 3과 같은 1000건당 비율 차이)
+
+    gap_analysis.json은 TOPIC_KEYWORDS만 담고 있으므로 자동 할당된 전체 어휘는 저장소에서 직접 계산
+    """
+    ratios = []
+    for source in ('news', 'paper'):
+        store = load_or_build_store(source)
+        index = store.vocab_index
+        doc_freq = np.asarray(store.doc_freq)
+        freq = np.array([doc_freq[index[kw]] if kw in index else 0 for kw in keywords], dtype=np.float64)
+        ratios.append(freq / store.n_docs * 1000 if store.n_docs else np.zeros(len(keywords)))
+    return dict(zip(keywords, (ratios[0] - ratios[1]).tolist()))
+
+
+def plot_category_gap_overview():
+    """카테고리별 평균 간극 지수 (category_propagation.py 결과의 전체 키워드 기준)"""
+    print("7. 카테고리별 간극 개요 차트 생성 중...")
+
+    keyword_categories = load_keyword_categories()
+    if keyword_categories is None:
+        print("  건너뜀: output/keyword_categories.json 없음 (python category_propagation.py 먼저 실행)")
+        return
+
+    gaps = {cat: [] for cat in KEYWORD_CATEGORIES}
+    for kw, gap in keyword_gap_indices(list(keyword_categories)).items():
+        cat = keyword_categories[kw]
+        if cat in gaps:
+            gaps[cat].append(gap)
+
+    cats = [cat for cat in KEYWORD_CATEGORIES if gaps[cat]]
+    means = [np.mean(gaps[cat]) for cat in cats]
+    counts = [len(gaps[cat]) for cat in cats]
+
+    fig, ax = plt.subplots(figsize=(12, 7))
+    bars = ax.bar(cats, means, color=[CATEGORY_COLORS[cat] for cat in cats], width=0.6)
+
+    for bar, n in zip(bars, counts):
+        y = bar.get_height()
+        ax.text(bar.get_x() + bar.get_width() / 2, y, f'{n:,}개',
+                ha='center', va='bottom' if y >= 0 else 'top', fontsize=9)
+
+    ax.axhline(y=0, color='black', linewidth=0.8)
+    ax.set_ylabel('평균 간극 지수', fontsize=12)
+    ax.set_title('카테고리별 평균 간극 지수 (자동 할당, 전체 키워드)\n(+: 블루오션 / -: 학술선도)', fontsize=14)
+
+    plt.tight_layout()
+    plt.savefig(VIZ_DIR / '7_category_gap_overview.png', dpi=150, bbox_inches='tight')
+    plt.close()
+    print(f"  저장: {VIZ_DIR / '7_category_gap_overview.png'}")
+
+
 def plot_frequency_comparison(gap_data):
     """빈도 비교 (뉴스 vs 논문)"""
     print("6. 빈도 비교 차트 생성 중...")
@@ -289,18 +345,30 @@ def main():
     print("#" * 60)
 
     init_dirs()
+    start_run('phase4')
 
     print("\n데이터 로딩 중...")
-    gap_data, news_tfidf, paper_tfidf, news_cooccur, paper_cooccur = load_data()
+    with span('load'):
+        gap_data, news_tfidf, paper_tfidf, news_cooccur, paper_cooccur = load_data()
 
     print("\n시각화 생성 중...\n")
 
-    plot_gap_analysis(gap_data)
-    plot_scatter_comparison(gap_data)
-    plot_tfidf_comparison(news_tfidf, paper_tfidf)
-    plot_cooccurrence_heatmap(news_cooccur, paper_cooccur)
-    plot_category_comparison(gap_data)
-    plot_frequency_comparison(gap_data)
+    with span('plot', '1_gap_analysis'):
+        plot_gap_analysis(gap_data)
+    with span('plot', '2_scatter_comparison'):
+        plot_scatter_comparison(gap_data)
+    with span('plot', '3_tfidf_comparison'):
+        plot_tfidf_comparison(news_tfidf, paper_tfidf)
+    with span('plot', '4_cooccurrence_heatmap'):
+        plot_cooccurrence_heatmap(news_cooccur, paper_cooccur)
+    with span('plot', '5_category_comparison'):
+        plot_category_comparison(gap_data)
+    with span('plot', '6_frequency_comparison'):
+        plot_frequency_comparison(gap_data)
+    with span('plot', '7_category_gap_overview'):
+        plot_category_gap_overview()
+
+    finish_run()
 
     print("\n" + "#" * 60)
     print("#  Phase 4 완료!")
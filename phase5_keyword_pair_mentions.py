@@ -10,58 +10,58 @@ import io
 sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 import pandas as pd
 import json
-from config import NEWS_FILES, PAPER_FILE, OUTPUT_DIR, normalize_keyword, init_dirs
-
-# 분석 대상 키워드 쌍
-TARGET_PAIRS = [
-    ('인공지능', '혁신'),
-    ('인공지능', '청년'),
-    ('플랫폼', '혁신'),
-    ('여성', '인공지능'),
-]
+from config import NEWS_FILES, PAPER_FILE, OUTPUT_DIR, TARGET_PAIRS, normalize_keyword, init_dirs
+from profiling import span, start_run, finish_run
 
 
 def extract_news_mentions():
     """뉴스 데이터에서 키워드 조합이 함께 언급된 문서 발췌"""
     results = {pair: [] for pair in TARGET_PAIRS}
     for file in NEWS_FILES:
-        df = pd.read_excel(file)
-        for idx, row in df.iterrows():
-            keywords = [normalize_keyword(k.strip()) for k in str(row['키워드']).split(',') if k.strip()]
+        with span('load', file) as s:
+            df = pd.read_excel(file)
+            s.items = len(df)
+        with span('count', f'{file} 조합 발췌', items=len(df)):
+            for idx, row in df.iterrows():
+                keywords = [normalize_keyword(k.strip()) for k in str(row['키워드']).split(',') if k.strip()]
+                keywords = set(keywords)
+                for pair in TARGET_PAIRS:
+                    if pair[0] in keywords and pair[1] in keywords:
+                        results[pair].append({
+                            'index': idx,
+                            'title': row.get('제목', ''),
+                            'keywords': ', '.join(keywords),
+                            'category': row.get('통합 분류1', ''),
+                        })
+    return results
+
+
+def extract_paper_mentions():
+    """논문 데이터에서 키워드 조합이 함께 언급된 문서 발췌"""
+    results = {pair: [] for pair in TARGET_PAIRS}
+    with span('load', PAPER_FILE) as s:
+        with open(PAPER_FILE, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        s.items = len(data['NODE_LIST'])
+    with span('count', f'{PAPER_FILE} 조합 발췌', items=len(data['NODE_LIST'])):
+        for idx, item in enumerate(data['NODE_LIST']):
+            kywd = item.get('KYWD', '')
+            keywords = [normalize_keyword(k.strip()) for k in str(kywd).split(',') if k.strip()]
             keywords = set(keywords)
             for pair in TARGET_PAIRS:
                 if pair[0] in keywords and pair[1] in keywords:
                     results[pair].append({
                         'index': idx,
-                        'title': row.get('제목', ''),
+                        'title': item.get('TITLE', ''),
                         'keywords': ', '.join(keywords),
-                        'category': row.get('통합 분류1', ''),
+                        'authors': item.get('AUTHORS', ''),
                     })
     return results
 
 
-def extract_paper_mentions():
-    """논문 데이터에서 키워드 조합이 함께 언급된 문서 발췌"""
-    results = {pair: [] for pair in TARGET_PAIRS}
-    with open(PAPER_FILE, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    for idx, item in enumerate(data['NODE_LIST']):
-        kywd = item.get('KYWD', '')
-        keywords = [normalize_keyword(k.strip()) for k in str(kywd).split(',') if k.strip()]
-        keywords = set(keywords)
-        for pair in TARGET_PAIRS:
-            if pair[0] in keywords and pair[1] in keywords:
-                results[pair].append({
-                    'index': idx,
-                    'title': item.get('TITLE', ''),
-                    'keywords': ', '.join(keywords),
-                    'authors': item.get('AUTHORS', ''),
-                })
-    return results
-
-
 def main():
     init_dirs()
+    start_run('phase5')
     print("Phase 5: 키워드 조합별 문서 발췌 및 정리")
     news_mentions = extract_news_mentions()
     paper_mentions = extract_paper_mentions()
@@ -86,10 +86,13 @@ def main():
         'paper': tuple_key_to_str(paper_mentions)
     }
     output_path = OUTPUT_DIR / 'phase5_keyword_pair_mentions.json'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(output, f, ensure_ascii=False, indent=2)
+    with span('save'):
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
     print(f"\n결과 저장 완료: {output_path}")
 
+    finish_run()
+
 
 if __name__ == '__main__':
     main()
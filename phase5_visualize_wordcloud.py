@@ -7,15 +7,8 @@ import json
 from collections import Counter
 from wordcloud import WordCloud
 import matplotlib.pyplot as plt
-from config import normalize_keyword, VIZ_DIR, OUTPUT_DIR, init_dirs
-
-# 분석 대상 키워드 쌍
-TARGET_PAIRS = [
-    ('인공지능', '혁신'),
-    ('인공지능', '청년'),
-    ('플랫폼', '혁신'),
-    ('여성', '인공지능'),
-]
+from config import normalize_keyword, VIZ_DIR, OUTPUT_DIR, TARGET_PAIRS, init_dirs
+from profiling import span, start_run, finish_run
 
 # 파일 경로
 JSON_PATH = OUTPUT_DIR / 'phase5_keyword_pair_mentions.json'
@@ -49,9 +42,11 @@ def visualize_wordcloud(text, title, save_path):
 
 def main():
     init_dirs()
+    start_run('phase5_wordcloud')
 
-    with open(JSON_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    with span('load', str(JSON_PATH)):
+        with open(JSON_PATH, 'r', encoding='utf-8') as f:
+            data = json.load(f)
 
     for pair in TARGET_PAIRS:
         pair_str = f'{pair[0]}-{pair[1]}'
@@ -62,11 +57,15 @@ def main():
             # 제목, 카테고리, 키워드 등 텍스트 합침
             fields = ['title', 'category', 'keywords', 'authors']
             # 조합 키워드를 불용어로 제외
-            text = preprocess_text(items, fields, exclude=list(pair))
+            with span('normalize', f'{source}_{pair_str}', items=len(items)):
+                text = preprocess_text(items, fields, exclude=list(pair))
             save_path = VIZ_DIR / f'wordcloud_{source}_{pair_str}.png'
             title = f'{source.upper()} | {pair_str} 문서 맥락 워드클라우드'
-            visualize_wordcloud(text, title, save_path)
+            with span('plot', f'wordcloud_{source}_{pair_str}'):
+                visualize_wordcloud(text, title, save_path)
             print(f'{save_path} 저장 완료')
 
+    finish_run()
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,419 @@
+"""
+표본 미리보기 - 설정 변경(SYNONYM_MAP, STOPWORDS, NEWS_EXCLUDE_CATEGORIES 등)의 효과를 전체 실행 없이 확인
+- 원본 표본 (output/preview/<source>_sample.json, 비율/시드/원본 파일이 같으면 재사용)
+    뉴스: 통합 분류1별 층화 단순 무작위 추출 (층별 PREVIEW_FRACTION, 최소 PREVIEW_MIN_STRATUM건)
+    논문: 단순 무작위 추출
+    행마다 균등 난수를 붙여 층별 하위 k개를 고르므로 원본을 한 번만 스트리밍 (ingest.py 청크 읽기 재사용)
+- 실행할 때마다 표본의 키워드 원문을 현재 설정으로 다시 정규화 (Phase 3 규칙: 제목 키워드, 키워드 보완 포함)
+- 층화 추정: 키워드 문서 빈도/문서 수를 층 가중치(N_h / n_h)로 확대, 유한 모집단 보정 표준오차
+    TF-IDF (Phase 2 식) 와 간극 지수 (Phase 3) 를 추정치로 계산, 표준오차는 델타 방법
+- 신뢰구간(± PREVIEW_Z × 표준오차)이 상위 N / 후보 선정 경계를 넘는 키워드는 '변동 가능'으로 표시,
+  마지막 전체 실행과 비교: TF-IDF는 코퍼스 저장소(output/corpus/)에 같은 추정식(tf = df)을 적용한 상위 N,
+  간극 후보는 gap_analysis.json (Phase 2 news_tfidf.json은 tf가 원 빈도라 식 차이가 섞이므로 쓰지 않음)
+"""
+
+import argparse
+import heapq
+import json
+import time
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR, NEWS_EXCLUDE_CATEGORIES, TOPIC_KEYWORDS,
+    GAP_NEWS_MIN_FREQ, GAP_PAPER_MIN_FREQ, GAP_BLUE_OCEAN_THRESHOLD, GAP_ACADEMIC_THRESHOLD, GAP_TOP_N,
+    BACKFILL_KEYWORDS, BACKFILL_MIN_FREQ, BACKFILL_MAX_KEYWORDS,
+    PREVIEW_FRACTION, PREVIEW_MIN_STRATUM, PREVIEW_SEED, PREVIEW_TOP_N, PREVIEW_Z, PREVIEW_DIR,
+    init_dirs
+)
+from corpus import CorpusStore, build_vocab, store_path
+from gap_sweep import sweep_candidates
+from ingest import iter_news_chunks, iter_paper_chunks, normalize_chunk, source_files, _write_json
+from profiling import span, start_run, finish_run
+
+
+SOURCES = {'news': '뉴스', 'paper': '논문'}
+PAPER_STRATUM = '전체'
+
+
+# ============================================================
+# 표본 추출
+# ============================================================
+
+def draw_sample(chunks, fraction, seed, min_stratum=PREVIEW_MIN_STRATUM):
+    """(층, 키워드 원문, 제목) 청크 → 층별 단순 무작위 표본
+
+    행마다 균등 난수 u를 붙이고 층별로 u가 작은 max(비율 × 층 크기, 최소 표본 수)개를 고름
+    (u < fraction인 행 + u가 가장 작은 min_stratum개 힙만 유지하므로 메모리는 표본 크기 수준)
+
+    Returns:
+        list[dict]: 층별 {'name', 'population', 'rows': [[키워드 원문, 제목], ...]} (층 이름순)
+    """
+    rng = np.random.default_rng(seed)
+    population, below, smallest = {}, {}, {}
+    for _, start, chunk in chunks:
+        keys = rng.random(len(chunk))
+        for offset, ((stratum, raw, title), u) in enumerate(zip(chunk, keys.tolist())):
+            stratum = PAPER_STRATUM if stratum is None else str(stratum)
+            population[stratum] = population.get(stratum, 0) + 1
+            row = (u, start + offset, raw if raw is None else str(raw), title if isinstance(title, str) else '')
+            if u < fraction:
+                below.setdefault(stratum, []).append(row)
+            heap = smallest.setdefault(stratum, [])
+            if len(heap) < min_stratum:
+                heapq.heappush(heap, (-u, row))
+            elif u < -heap[0][0]:
+                heapq.heapreplace(heap, (-u, row))
+
+    strata = []
+    for stratum in sorted(population):
+        rows = below.get(stratum, [])
+        if len(rows) < min(min_stratum, population[stratum]):
+            rows = [row for _, row in smallest[stratum]]
+        rows.sort(key=lambda row: row[1])
+        strata.append({
+            'name': stratum,
+            'population': population[stratum],
+            'rows': [[raw, title] for _, _, raw, title in rows],
+        })
+    return strata
+
+
+def load_or_draw_sample(source, fraction=PREVIEW_FRACTION, seed=PREVIEW_SEED, resample=False):
+    """원본 표본 캐시 (비율/시드/최소 표본 수/원본 파일이 같으면 재사용, 정규화 설정과는 무관)"""
+    path = PREVIEW_DIR / f'{source}_sample.json'
+    signature = {'fraction': fraction, 'seed': seed, 'min_stratum': PREVIEW_MIN_STRATUM,
+                 'files': source_files(source)}
+    if not resample and path.exists():
+        with open(path, 'r', encoding='utf-8') as f:
+            sample = json.load(f)
+        if sample['signature'] == signature:
+            return sample['strata']
+        print(f"  {source}: 표본 설정 또는 원본 파일이 바뀌어 표본을 다시 추출합니다.")
+
+    with span('load', f'{source} 표본 추출') as s:
+        chunks = iter_news_chunks() if source == 'news' else iter_paper_chunks()
+        strata = draw_sample(chunks, fraction, seed)
+        s.items = sum(stratum['population'] for stratum in strata)
+    PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+    _write_json(path, {'signature': signature, 'strata': strata})
+    return strata
+
+
+# ============================================================
+# 층화 추정
+# ============================================================
+
+def stratified_total(counts, n, N):
+    """층별 표본 건수 → (모집단 합계 추정치, 표준오차)
+
+    Args:
+        counts: 층 × 항목 배열 (층별 표본 중 해당하는 문서 수)
+        n, N: 층별 표본 크기 / 모집단 크기
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)[:, None]
+    N = np.asarray(N, dtype=np.float64)[:, None]
+    total = (N / n * counts).sum(axis=0)
+    # 0/1 변수의 층별 표본분산 c(n - c) / (n(n - 1)) → 분산 N²(1 - n/N)s²/n
+    variance = N ** 2 * (1 - n / N) * counts * (n - counts) / (n ** 2 * np.maximum(n - 1, 1))
+    return total, np.sqrt(variance.sum(axis=0))
+
+
+def backfill_sample(docs, missing, fraction):
+    """층별 키워드 없는 제목 → 층별 추론 키워드 문서 (Phase 3과 같은 패턴 규칙, 결과 파일은 쓰지 않음)
+
+    패턴 최소 문서 빈도는 표본 비율만큼 축소 (BACKFILL_MIN_FREQ × 비율, 최소 1)
+    패턴 어휘가 표본 어휘라 전체 실행보다 보완 문서가 적게 잡힘 (문서 수 추정치가 약간 작음)
+    """
+    from keyword_matcher import KeywordMatcher, build_patterns
+
+    flat = [doc for stratum_docs in docs for doc in stratum_docs]
+    matcher = KeywordMatcher(build_patterns(flat, max(1, round(BACKFILL_MIN_FREQ * fraction))))
+    inferred = []
+    for titles in missing:
+        found = (matcher.find(title)[:BACKFILL_MAX_KEYWORDS] for title in titles if title)
+        inferred.append([keywords for keywords in found if keywords])
+    return inferred
+
+
+def estimate_source(strata, fraction):
+    """표본 → 현재 설정으로 정규화한 키워드 문서 빈도/문서 수 추정치
+
+    Returns:
+        dict: vocab, freq, freq_se (키워드별), n_docs, n_docs_se, n_rows, n_sample (문서 수)
+    """
+    strata = [s for s in strata if s['name'] not in NEWS_EXCLUDE_CATEGORIES and s['rows']]
+    docs, missing = [], []
+    for stratum in strata:
+        raws, titles = zip(*stratum['rows'])
+        stratum_docs, stratum_missing = normalize_chunk(raws, titles)
+        docs.append(stratum_docs)
+        missing.append(stratum_missing)
+
+    if BACKFILL_KEYWORDS:
+        for stratum_docs, inferred in zip(docs, backfill_sample(docs, missing, fraction)):
+            stratum_docs.extend(inferred)
+
+    vocab, vocab_index, _ = build_vocab([doc for stratum_docs in docs for doc in stratum_docs])
+    counts = np.zeros((len(strata), len(vocab)), dtype=np.int64)
+    for h, stratum_docs in enumerate(docs):
+        ids = [vocab_index[kw] for doc in stratum_docs for kw in set(doc)]
+        counts[h] = np.bincount(np.asarray(ids, dtype=np.int64), minlength=len(vocab))
+
+    n = [len(s['rows']) for s in strata]
+    N = [s['population'] for s in strata]
+    freq, freq_se = stratified_total(counts, n, N)
+    (n_docs,), (n_docs_se,) = stratified_total([[len(d)] for d in docs], n, N)
+    return {
+        'vocab': vocab, 'vocab_index': vocab_index, 'freq': freq, 'freq_se': freq_se,
+        'n_docs': n_docs, 'n_docs_se': n_docs_se,
+        'n_rows': sum(N), 'n_sample': sum(n), 'n_strata': len(strata),
+    }
+
+
+def tfidf_estimate(est):
+    """Phase 2 TF-IDF (문서별 키워드 집합 → tf = df), 표준오차는 d/dT[T(log(N/T) + 1)] = log(N/T)"""
+    freq, n_docs = est['freq'], est['n_docs']
+    log_ratio = np.log(n_docs / np.maximum(freq, 1e-12))
+    return freq * (log_ratio + 1), np.abs(log_ratio) * est['freq_se']
+
+
+# ============================================================
+# 변동 가능 키워드 표시
+# ============================================================
+
+def flag_top(vocab, score, score_se, top_n=PREVIEW_TOP_N, z=PREVIEW_Z):
+    """추정 상위 N + 경계 표시
+
+    - 상위 N 안: 신뢰구간 하한이 N+1위 점수 이하 → 변동 가능
+    - 상위 N 밖: 신뢰구간 상한이 N위 점수 초과 → 진입 가능
+
+    Returns:
+        (상위 N 레코드, 진입 가능 레코드)
+    """
+    order = np.argsort(-score, kind='stable')
+    top, rest = order[:top_n], order[top_n:]
+    last_in = score[top[-1]] if len(top) else np.inf
+    first_out = score[rest[0]] if len(rest) else -np.inf
+
+    def record(rank, i):
+        return {'rank': rank, 'keyword': vocab[i], 'score': round(float(score[i]), 2),
+                'score_ci': [round(float(score[i] - z * score_se[i]), 2),
+                             round(float(score[i] + z * score_se[i]), 2)]}
+
+    ranked = []
+    for rank, i in enumerate(top, 1):
+        r = record(rank, i)
+        r['unstable'] = bool(score[i] - z * score_se[i] <= first_out)
+        ranked.append(r)
+    entrants = [record(top_n + k + 1, i) for k, i in enumerate(rest)
+                if score[i] + z * score_se[i] > last_in]
+    return ranked, entrants
+
+
+def flag_candidates(freq, freq_se, gap, gap_se, min_freq, threshold, descending=True, z=PREVIEW_Z):
+    """간극 후보 (Phase 3 규칙, 상위 GAP_TOP_N) + 신뢰구간이 선정 경계를 넘는지
+
+    Returns:
+        selected: 추정치 기준 선정 여부
+        uncertain: 선정 → 탈락 또는 미선정 → 진입 가능 여부
+    """
+    selected_all, _ = sweep_candidates(freq, gap, [min_freq], [threshold], descending=descending)
+    selected = selected_all[0, 0]
+    sign = 1 if descending else -1
+    g, g_lo, g_hi = sign * gap, sign * gap - z * gap_se, sign * gap + z * gap_se
+    qualified = (freq > min_freq) & (g > sign * threshold)
+
+    # 상위 N이 꽉 찼으면 N위/N+1위 간극도 경계
+    floor = sign * threshold
+    weakest = g[selected].min() if selected.sum() >= GAP_TOP_N else floor
+    best_out = g[qualified & ~selected].max() if (qualified & ~selected).any() else floor
+    exits = selected & ((g_lo <= max(floor, best_out)) | (freq - z * freq_se <= min_freq))
+    enters = ~selected & (g_hi > max(floor, weakest)) & (freq + z * freq_se > min_freq)
+    return selected, exits | enters
+
+
+def full_run_top(source, top_n=PREVIEW_TOP_N):
+    """마지막 전체 실행의 TF-IDF 상위 N (기존 코퍼스 저장소에 tfidf_estimate와 같은 식 적용, 다시 생성하지 않음)"""
+    path = store_path(source)
+    if not (path / 'meta.json').exists():
+        return None
+    store = CorpusStore(path)
+    freq = store.doc_freq.astype(np.float64)
+    score, _ = tfidf_estimate({'freq': freq, 'freq_se': np.zeros_like(freq), 'n_docs': store.n_docs})
+    return [store.term(i) for i in np.argsort(-score, kind='stable')[:top_n]]
+
+
+def full_run_candidates():
+    """마지막 전체 실행의 블루오션/학술선도 후보 (gap_analysis.json에 같은 규칙 적용)"""
+    path = OUTPUT_DIR / 'gap_analysis.json'
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        gap_analysis = json.load(f)
+    keywords = [g['keyword'] for g in gap_analysis]
+    news_freq = np.array([g['news_freq'] for g in gap_analysis], dtype=np.float64)
+    paper_freq = np.array([g['paper_freq'] for g in gap_analysis], dtype=np.float64)
+    gap = np.array([g['gap_index'] for g in gap_analysis], dtype=np.float64)
+    blue, _ = sweep_candidates(news_freq, gap, [GAP_NEWS_MIN_FREQ], [GAP_BLUE_OCEAN_THRESHOLD])
+    academic, _ = sweep_candidates(paper_freq, gap, [GAP_PAPER_MIN_FREQ], [GAP_ACADEMIC_THRESHOLD],
+                                   descending=False)
+    return ({kw for kw, s in zip(keywords, blue[0, 0]) if s},
+            {kw for kw, s in zip(keywords, academic[0, 0]) if s})
+
+
+def gap_preview(news, paper, z=PREVIEW_Z):
+    """TOPIC_KEYWORDS 간극 지수 추정 (비율 = 빈도 / 문서 수 × 1000, 표준오차는 빈도 추정 오차만 반영)"""
+    def lookup(est, keywords):
+        ids = np.array([est['vocab_index'].get(kw, -1) for kw in keywords])
+        freq = np.where(ids >= 0, est['freq'][np.maximum(ids, 0)], 0.0)
+        freq_se = np.where(ids >= 0, est['freq_se'][np.maximum(ids, 0)], 0.0)
+        return freq, freq_se
+
+    keywords = list(dict.fromkeys(TOPIC_KEYWORDS))
+    news_freq, news_se = lookup(news, keywords)
+    paper_freq, paper_se = lookup(paper, keywords)
+    present = (news_freq > 0) | (paper_freq > 0)
+    keywords = [kw for kw, p in zip(keywords, present) if p]
+    news_freq, news_se, paper_freq, paper_se = (a[present] for a in (news_freq, news_se, paper_freq, paper_se))
+
+    gap = news_freq / news['n_docs'] * 1000 - paper_freq / paper['n_docs'] * 1000
+    gap_se = np.hypot(news_se / news['n_docs'], paper_se / paper['n_docs']) * 1000
+    blue, blue_unstable = flag_candidates(news_freq, news_se, gap, gap_se,
+                                          GAP_NEWS_MIN_FREQ, GAP_BLUE_OCEAN_THRESHOLD, z=z)
+    academic, academic_unstable = flag_candidates(paper_freq, paper_se, gap, gap_se,
+                                                  GAP_PAPER_MIN_FREQ, GAP_ACADEMIC_THRESHOLD,
+                                                  descending=False, z=z)
+    records = [{
+        'keyword': kw,
+        'news_freq': round(float(news_freq[k]), 1),
+        'news_freq_se': round(float(news_se[k]), 1),
+        'paper_freq': round(float(paper_freq[k]), 1),
+        'paper_freq_se': round(float(paper_se[k]), 1),
+        'gap_index': round(float(gap[k]), 4),
+        'gap_ci': [round(float(gap[k] - z * gap_se[k]), 4), round(float(gap[k] + z * gap_se[k]), 4)],
+        'blue_ocean': bool(blue[k]),
+        'blue_ocean_unstable': bool(blue_unstable[k]),
+        'academic_lead': bool(academic[k]),
+        'academic_lead_unstable': bool(academic_unstable[k]),
+    } for k, kw in enumerate(keywords)]
+    records.sort(key=lambda r: -r['gap_index'])
+    return records
+
+
+# ============================================================
+# 출력
+# ============================================================
+
+def print_sample(name, est, fraction):
+    print(f"  {name}: 원본 {est['n_rows']:,}행 중 {est['n_sample']:,}행 ({est['n_strata']}개 층, 비율 {fraction:g}) → "
+          f"추정 문서 수 {est['n_docs']:,.0f} ± {est['n_docs_se']:,.0f}, 어휘 {len(est['vocab']):,}개 (표본)")
+
+
+def print_top(name, ranked, entrants, full_top, limit=20):
+    print(f"\n[{name} TF-IDF 추정 상위 {len(ranked)}개] (*: 상위 {len(ranked)} 경계 변동 가능)")
+    print("-" * 70)
+    for r in ranked[:limit]:
+        mark = '*' if r['unstable'] else ' '
+        ci = f"{r['score_ci'][0]:,.0f} ~ {r['score_ci'][1]:,.0f}"
+        print(f"{mark}{r['rank']:>4} | {r['keyword']:<20} | {r['score']:>12,.0f} | {ci:>25}")
+    unstable = [r['keyword'] for r in ranked if r['unstable']]
+    print(f"  경계 변동 가능 {len(unstable)}개: {', '.join(unstable[:15]) or '없음'}")
+    print(f"  진입 가능 {len(entrants)}개: {', '.join(r['keyword'] for r in entrants[:15]) or '없음'}")
+    if full_top is not None:
+        preview_top = [r['keyword'] for r in ranked]
+        added = [kw for kw in preview_top if kw not in full_top]
+        removed = [kw for kw in full_top if kw not in preview_top]
+        print(f"  전체 실행(코퍼스 저장소, 같은 식) 대비 신규: {', '.join(added[:15]) or '없음'} / "
+              f"제외: {', '.join(removed[:15]) or '없음'}")
+
+
+def print_gap(title, records, flag, previous):
+    print(f"\n[{title}] (*: 변동 가능)")
+    print("-" * 80)
+    print(f" {'키워드':<15} | {'뉴스빈도':>16} | {'논문빈도':>16} | {'간극':>8} | {'간극 신뢰구간':>17}")
+    print("-" * 80)
+    chosen = [r for r in records if r[flag]]
+    if flag == 'academic_lead':
+        chosen.reverse()
+    for r in chosen:
+        mark = '*' if r[f'{flag}_unstable'] else ' '
+        news = f"{r['news_freq']:,.0f}±{r['news_freq_se']:,.0f}"
+        paper = f"{r['paper_freq']:,.0f}±{r['paper_freq_se']:,.0f}"
+        ci = f"{r['gap_ci'][0]:.2f}~{r['gap_ci'][1]:.2f}"
+        print(f"{mark}{r['keyword']:<15} | {news:>16} | {paper:>16} | {r['gap_index']:>8.2f} | {ci:>17}")
+    if not chosen:
+        print("  (해당 없음)")
+    entering = [r['keyword'] for r in records if not r[flag] and r[f'{flag}_unstable']]
+    print(f"  진입 가능: {', '.join(entering) or '없음'}")
+    if previous is not None:
+        current = {r['keyword'] for r in chosen}
+        print(f"  전체 실행 대비 신규: {', '.join(sorted(current - previous)) or '없음'} / "
+              f"제외: {', '.join(sorted(previous - current)) or '없음'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='층화 표본 미리보기 (설정 변경 효과 빠른 확인)')
+    parser.add_argument('--fraction', type=float, default=PREVIEW_FRACTION, help='표본 비율')
+    parser.add_argument('--seed', type=int, default=PREVIEW_SEED)
+    parser.add_argument('--top', type=int, default=PREVIEW_TOP_N, help='확인할 TF-IDF 상위 키워드 수')
+    parser.add_argument('--resample', action='store_true', help='표본 캐시를 무시하고 다시 추출')
+    args = parser.parse_args()
+
+    print("\n" + "#" * 60)
+    print("#  표본 미리보기")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('preview')
+    start = time.perf_counter()
+
+    estimates = {}
+    for source, name in SOURCES.items():
+        strata = load_or_draw_sample(source, args.fraction, args.seed, args.resample)
+        with span('normalize', f'{source} 표본', items=sum(len(s['rows']) for s in strata)):
+            estimates[source] = estimate_source(strata, args.fraction)
+
+    print()
+    for source, name in SOURCES.items():
+        print_sample(name, estimates[source], args.fraction)
+
+    output = {'fraction': args.fraction, 'seed': args.seed, 'z': PREVIEW_Z}
+    with span('score', 'TF-IDF / 간극 추정'):
+        for source, name in SOURCES.items():
+            est = estimates[source]
+            score, score_se = tfidf_estimate(est)
+            ranked, entrants = flag_top(est['vocab'], score, score_se, args.top)
+            print_top(name, ranked, entrants, full_run_top(source, args.top))
+            output[source] = {
+                'n_rows': est['n_rows'], 'n_sample': est['n_sample'],
+                'n_docs': round(float(est['n_docs']), 1), 'n_docs_se': round(float(est['n_docs_se']), 1),
+                'tfidf': ranked, 'entrants': entrants,
+            }
+
+        gap_records = gap_preview(estimates['news'], estimates['paper'])
+        output['gap'] = gap_records
+        previous = full_run_candidates()
+        blue_prev, academic_prev = previous if previous is not None else (None, None)
+        print_gap("블루오션 후보 추정", gap_records, 'blue_ocean', blue_prev)
+        print_gap("학술선도 후보 추정", gap_records, 'academic_lead', academic_prev)
+
+    with span('save'):
+        output_path = PREVIEW_DIR / 'preview.json'
+        PREVIEW_DIR.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+    print(f"\n미리보기 소요 시간: {time.perf_counter() - start:.2f}s")
+
+    print("\n" + "#" * 60)
+    print("#  표본 미리보기 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
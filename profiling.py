@@ -0,0 +1,254 @@
+"""
+단계별 실행 계측 (Instrumentation)
+- span 컨텍스트 매니저로 load / normalize / count / score / save / plot 단계 측정
+- 벽시계 시간, CPU 시간, 최대 메모리(peak RSS), 처리 항목 수 기록
+- JSON 실행 리포트 + (선택) Chrome trace 파일 저장 (chrome://tracing, Perfetto에서 열기)
+- (선택) 특정 단계만 cProfile로 분석하여 상위 함수 출력
+
+사용 예:
+    start_run('phase2')
+    with span('load', file) as s:
+        df = pd.read_excel(file)
+        s.items = len(df)
+    finish_run()
+"""
+
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from config import (
+    OUTPUT_DIR,
+    PROFILE_REPORT, PROFILE_TRACE, PROFILE_STAGE, PROFILE_TOP_N,
+)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+STAGES = ('load', 'normalize', 'count', 'score', 'save', 'plot')
+
+
+def peak_rss_mb():
+    """프로세스 최대 메모리 사용량 (MB), 측정 불가 시 None"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 bytes, Linux는 KB 단위
+    if sys.platform == 'darwin':
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+class Span:
+    """단일 측정 구간"""
+
+    def __init__(self, stage, label, items=None):
+        self.stage = stage
+        self.label = label
+        self.items = items
+        self.depth = 0
+        self.start_ts = 0.0
+        self.wall_sec = 0.0
+        self.cpu_sec = 0.0
+        self.peak_rss_mb = None
+        self.rss_growth_mb = None
+
+    def to_dict(self):
+        return {
+            'stage': self.stage,
+            'label': self.label,
+            'depth': self.depth,
+            'start_sec': round(self.start_ts, 6),
+            'wall_sec': round(self.wall_sec, 6),
+            'cpu_sec': round(self.cpu_sec, 6),
+            'items': self.items,
+            'peak_rss_mb': None if self.peak_rss_mb is None else round(self.peak_rss_mb, 1),
+            'rss_growth_mb': None if self.rss_growth_mb is None else round(self.rss_growth_mb, 1),
+        }
+
+
+class RunRecorder:
+    """한 번의 Phase 실행 동안 측정 구간을 수집"""
+
+    def __init__(self, name, trace=False, profile_stage=None):
+        self.name = name
+        self.trace = trace
+        self.profile_stage = profile_stage
+        self.spans = []
+        self.depth = 0
+        self.t0 = time.perf_counter()
+        self.cpu0 = time.process_time()
+        self.profiler = cProfile.Profile() if profile_stage else None
+        self.profile_depth = 0
+
+
+_current_run = None
+
+
+def _env_flag(name, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ('1', 'true', 'yes', 'on')
+
+
+def start_run(name):
+    """실행 계측 시작 (Phase main() 시작 시 호출)"""
+    global _current_run
+    trace = _env_flag('SSU_PROFILE_TRACE', PROFILE_TRACE)
+    profile_stage = os.environ.get('SSU_PROFILE_STAGE', PROFILE_STAGE) or None
+    _current_run = RunRecorder(name, trace=trace, profile_stage=profile_stage)
+    return _current_run
+
+
+@contextmanager
+def span(stage, label=None, items=None):
+    """측정 구간 컨텍스트 매니저 (실행 계측이 시작되지 않았으면 기록하지 않음)"""
+    record = Span(stage, label or stage, items)
+    run = _current_run
+    if run is None:
+        yield record
+        return
+
+    profiling = run.profiler is not None and stage == run.profile_stage
+    record.depth = run.depth
+    run.depth += 1
+    rss_before = peak_rss_mb()
+    record.start_ts = time.perf_counter() - run.t0
+    cpu_start = time.process_time()
+
+    if profiling:
+        if run.profile_depth == 0:
+            run.profiler.enable()
+        run.profile_depth += 1
+
+    try:
+        yield record
+    finally:
+        if profiling:
+            run.profile_depth -= 1
+            if run.profile_depth == 0:
+                run.profiler.disable()
+
+        record.wall_sec = time.perf_counter() - run.t0 - record.start_ts
+        record.cpu_sec = time.process_time() - cpu_start
+        record.peak_rss_mb = peak_rss_mb()
+        if rss_before is not None:
+            record.rss_growth_mb = record.peak_rss_mb - rss_before
+        run.depth -= 1
+        run.spans.append(record)
+
+
+def summarize(spans):
+    """단계별 합계 (최상위 구간 기준으로 중첩 구간의 중복 합산 방지)"""
+    min_depth = {}
+    for s in spans:
+        min_depth[s.stage] = min(min_depth.get(s.stage, s.depth), s.depth)
+
+    summary = {}
+    for s in spans:
+        entry = summary.setdefault(s.stage, {
+            'calls': 0, 'wall_sec': 0.0, 'cpu_sec': 0.0, 'items': 0, 'peak_rss_mb': None,
+        })
+        entry['calls'] += 1
+        if s.depth == min_depth[s.stage]:
+            entry['wall_sec'] += s.wall_sec
+            entry['cpu_sec'] += s.cpu_sec
+        if s.items is not None:
+            entry['items'] += s.items
+        if s.peak_rss_mb is not None:
+            entry['peak_rss_mb'] = max(entry['peak_rss_mb'] or 0, s.peak_rss_mb)
+
+    for entry in summary.values():
+        entry['wall_sec'] = round(entry['wall_sec'], 6)
+        entry['cpu_sec'] = round(entry['cpu_sec'], 6)
+        if entry['peak_rss_mb'] is not None:
+            entry['peak_rss_mb'] = round(entry['peak_rss_mb'], 1)
+    return summary
+
+
+def _chrome_trace(run):
+    """Chrome trace event 형식 변환"""
+    pid = os.getpid()
+    tid = threading.get_ident()
+    events = []
+    for s in run.spans:
+        events.append({
+            'name': s.label,
+            'cat': s.stage,
+            'ph': 'X',
+            'ts': int(s.start_ts * 1e6),
+            'dur': int(s.wall_sec * 1e6),
+            'pid': pid,
+            'tid': tid,
+            'args': {'items': s.items, 'cpu_sec': round(s.cpu_sec, 6),
+                     'peak_rss_mb': s.peak_rss_mb},
+        })
+    return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+
+def finish_run():
+    """실행 계측 종료: 단계별 요약 출력 및 리포트/trace/프로파일 저장"""
+    global _current_run
+    run = _current_run
+    if run is None:
+        return None
+    _current_run = None
+
+    wall = time.perf_counter() - run.t0
+    cpu = time.process_time() - run.cpu0
+    spans = sorted(run.spans, key=lambda s: s.start_ts)
+    summary = summarize(spans)
+
+    print("\n" + "=" * 50)
+    print(f"단계별 실행 시간 ({run.name})")
+    print("=" * 50)
+    print(f"{'단계':<10} | {'호출':>5} | {'시간(s)':>9} | {'CPU(s)':>9} | {'항목 수':>12}")
+    print("-" * 58)
+    for stage, entry in summary.items():
+        print(f"{stage:<10} | {entry['calls']:>5} | {entry['wall_sec']:>9.3f} | "
+              f"{entry['cpu_sec']:>9.3f} | {entry['items']:>12,}")
+    print(f"{'합계':<10} | {'':>5} | {wall:>9.3f} | {cpu:>9.3f} |")
+
+    report = {
+        'run': run.name,
+        'wall_sec': round(wall, 6),
+        'cpu_sec': round(cpu, 6),
+        'peak_rss_mb': None if peak_rss_mb() is None else round(peak_rss_mb(), 1),
+        'stages': summary,
+        'spans': [s.to_dict() for s in spans],
+    }
+
+    OUTPUT_DIR.mkdir(exist_ok=True)
+    if PROFILE_REPORT:
+        path = OUTPUT_DIR / f'run_report_{run.name}.json'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"  저장: {path}")
+
+    if run.trace:
+        path = OUTPUT_DIR / f'trace_{run.name}.json'
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(_chrome_trace(run), f, ensure_ascii=False)
+        print(f"  저장: {path}")
+
+    if run.profiler is not None:
+        path = OUTPUT_DIR / f'profile_{run.name}_{run.profile_stage}.prof'
+        run.profiler.dump_stats(str(path))
+        buf = io.StringIO()
+        stats = pstats.Stats(run.profiler, stream=buf)
+        stats.sort_stats('cumulative').print_stats(PROFILE_TOP_N)
+        print(f"\n[cProfile: '{run.profile_stage}' 단계 상위 {PROFILE_TOP_N}개 함수]")
+        print(buf.getvalue())
+        print(f"  저장: {path}")
+
+    return report
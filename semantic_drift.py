@@ -0,0 +1,207 @@
+"""
+뉴스 vs 논문 의미 변화(Semantic Drift) 분석
+- 간극 지수(빈도 차이)와 달리 같은 키워드가 "어떤 맥락에서" 쓰이는지 비교
+- 뉴스/논문 동시 출현 행렬을 공통 어휘로 정렬 (행·열 모두 같은 키워드 순서)
+- 맥락 유사도 1: 정렬된 PPMI 행 벡터의 코사인 유사도
+- 맥락 유사도 2: 상위 K개 동시 출현 이웃 집합의 Jaccard 유사도
+- 모든 공통 키워드를 희소 행렬 연산 한 번으로 계산 (키워드별 반복 없음)
+"""
+
+import json
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR,
+    DRIFT_MIN_FREQ, DRIFT_TOP_K, DRIFT_TOP_N,
+    init_dirs
+)
+from cooccurrence_external import load_or_build_cooccurrence_matrix
+from embedding import ppmi_matrix
+from profiling import span, start_run, finish_run
+
+
+def align_vocab(news_vocab, news_freq, paper_vocab, paper_freq, min_freq=DRIFT_MIN_FREQ):
+    """뉴스/논문 공통 어휘 (양쪽 모두 min_freq 이상)
+
+    Returns:
+        common: list[str]
+        news_ids, paper_ids: np.ndarray (각 행렬에서의 ID, common 순서)
+    """
+    paper_index = {kw: i for i, kw in enumerate(paper_vocab)}
+    common, news_ids, paper_ids = [], [], []
+    for i, kw in enumerate(news_vocab):
+        j = paper_index.get(kw)
+        if j is not None and news_freq[i] >= min_freq and paper_freq[j] >= min_freq:
+            common.append(kw)
+            news_ids.append(i)
+            paper_ids.append(j)
+    return common, np.array(news_ids, dtype=np.int64), np.array(paper_ids, dtype=np.int64)
+
+
+def row_cosine(a, b):
+    """같은 모양의 두 희소 행렬의 행별 코사인 유사도"""
+    dot = np.asarray(a.multiply(b).sum(axis=1)).ravel()
+    norm_a = np.sqrt(np.asarray(a.multiply(a).sum(axis=1)).ravel())
+    norm_b = np.sqrt(np.asarray(b.multiply(b).sum(axis=1)).ravel())
+    denom = norm_a * norm_b
+    return np.divide(dot, denom, out=np.zeros_like(dot, dtype=np.float64), where=denom > 0)
+
+
+def top_k_indicator(matrix, k):
+    """행별 상위 k개 값 위치만 1인 희소 지시 행렬 (동률은 열 ID 오름차순)"""
+    matrix = matrix.tocsr()
+    matrix.eliminate_zeros()
+    rows = np.repeat(np.arange(matrix.shape[0]), np.diff(matrix.indptr))
+    order = np.lexsort((matrix.indices, -matrix.data, rows))
+    rank = np.arange(len(order)) - matrix.indptr[rows[order]]
+    keep = order[rank < k]
+    return sparse.csr_matrix(
+        (np.ones(len(keep), dtype=np.float32), (rows[keep], matrix.indices[keep])),
+        shape=matrix.shape,
+    )
+
+
+def row_jaccard(a, b):
+    """두 지시 행렬의 행별 Jaccard 유사도"""
+    inter = np.asarray(a.multiply(b).sum(axis=1)).ravel()
+    union = np.diff(a.indptr) + np.diff(b.indptr) - inter
+    return np.divide(inter, union, out=np.zeros_like(inter, dtype=np.float64), where=union > 0)
+
+
+def calculate_drift(news, paper, top_k=DRIFT_TOP_K):
+    """공통 키워드 전체의 맥락 유사도/의미 변화 점수
+
+    Args:
+        news, paper: (matrix, vocab, keyword_freq, n_docs) 튜플
+
+    Returns:
+        dict (common, news_freq, paper_freq, cosine, jaccard, drift, news_top, paper_top)
+    """
+    news_matrix, news_vocab, news_freq, _ = news
+    paper_matrix, paper_vocab, paper_freq, _ = paper
+    common, news_ids, paper_ids = align_vocab(news_vocab, news_freq, paper_vocab, paper_freq)
+
+    # PPMI는 각 코퍼스 전체 기준으로 계산 후 공통 어휘 행/열만 정렬 추출
+    news_ppmi = ppmi_matrix(news_matrix)[news_ids][:, news_ids].tocsr()
+    paper_ppmi = ppmi_matrix(paper_matrix)[paper_ids][:, paper_ids].tocsr()
+    news_counts = news_matrix[news_ids][:, news_ids].tocsr()
+    paper_counts = paper_matrix[paper_ids][:, paper_ids].tocsr()
+
+    news_top = top_k_indicator(news_counts, top_k)
+    paper_top = top_k_indicator(paper_counts, top_k)
+
+    cosine = row_cosine(news_ppmi, paper_ppmi)
+    jaccard = row_jaccard(news_top, paper_top)
+    return {
+        'common': common,
+        'news_freq': news_freq[news_ids],
+        'paper_freq': paper_freq[paper_ids],
+        'cosine': cosine,
+        'jaccard': jaccard,
+        'drift': 1 - cosine,
+        'news_top': news_top,
+        'paper_top': paper_top,
+        'news_counts': news_counts,
+        'paper_counts': paper_counts,
+    }
+
+
+def _neighbors(top, counts, row, exclude, common):
+    """한쪽에만 있는 상위 이웃 (동시 출현 빈도 내림차순)"""
+    start, end = top.indptr[row], top.indptr[row + 1]
+    cols = [c for c in top.indices[start:end] if c not in exclude]
+    vals = counts[row, cols].toarray().ravel() if cols else []
+    return [common[c] for _, c in sorted(zip(vals, cols), key=lambda x: -x[0])]
+
+
+def summarize_drift(scores, top_n=DRIFT_TOP_N):
+    """의미 변화가 큰/작은 키워드 정리"""
+    common = scores['common']
+    news_top, paper_top = scores['news_top'], scores['paper_top']
+
+    def record(i):
+        news_set = set(news_top.indices[news_top.indptr[i]:news_top.indptr[i + 1]])
+        paper_set = set(paper_top.indices[paper_top.indptr[i]:paper_top.indptr[i + 1]])
+        shared = news_set & paper_set
+        return {
+            'keyword': common[i],
+            'news_freq': int(scores['news_freq'][i]),
+            'paper_freq': int(scores['paper_freq'][i]),
+            'cosine': round(float(scores['cosine'][i]), 4),
+            'jaccard': round(float(scores['jaccard'][i]), 4),
+            'drift': round(float(scores['drift'][i]), 4),
+            'shared_context': sorted(common[c] for c in shared),
+            'news_only_context': _neighbors(news_top, scores['news_counts'], i, shared, common)[:10],
+            'paper_only_context': _neighbors(paper_top, scores['paper_counts'], i, shared, common)[:10],
+        }
+
+    # 의미 변화 큼: 코사인 낮은 순 (동률이면 Jaccard 낮은 순), 한쪽이라도 이웃이 없으면 제외
+    valid = (np.diff(news_top.indptr) > 0) & (np.diff(paper_top.indptr) > 0)
+    order = np.lexsort((scores['jaccard'], -scores['drift']))
+    order = order[valid[order]]
+    most = [record(i) for i in order[:top_n]]
+    least = [record(i) for i in order[::-1][:top_n]]
+    return most, least
+
+
+def main():
+    print("\n" + "#" * 60)
+    print("#  뉴스 vs 논문 의미 변화(Semantic Drift) 분석")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('semantic_drift')
+
+    with span('load', '동시 출현 행렬'):
+        news = load_or_build_cooccurrence_matrix('news')
+        paper = load_or_build_cooccurrence_matrix('paper')
+
+    with span('score', '맥락 유사도'):
+        scores = calculate_drift(news, paper)
+    print(f"\n공통 키워드 수 (양쪽 빈도 {DRIFT_MIN_FREQ} 이상): {len(scores['common']):,}")
+
+    with span('score', '결과 정리'):
+        most, least = summarize_drift(scores)
+
+    print("\n[맥락 차이가 큰 키워드]")
+    print("(같은 키워드를 사회와 학계가 다른 맥락에서 사용)")
+    print("-" * 70)
+    print(f"{'키워드':<15} | {'뉴스빈도':>10} | {'논문빈도':>10} | {'코사인':>8} | {'Jaccard':>8}")
+    print("-" * 70)
+    for item in most[:20]:
+        print(f"{item['keyword']:<15} | {item['news_freq']:>10,} | {item['paper_freq']:>10,} | "
+              f"{item['cosine']:>8.3f} | {item['jaccard']:>8.3f}")
+        print(f"    뉴스: {', '.join(item['news_only_context'][:5])}")
+        print(f"    논문: {', '.join(item['paper_only_context'][:5])}")
+
+    print("\n[맥락이 일치하는 키워드]")
+    for item in least[:10]:
+        print(f"  {item['keyword']:<15} 코사인 {item['cosine']:.3f} | "
+              f"공통 맥락: {', '.join(item['shared_context'][:5])}")
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'semantic_drift.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'n_common': len(scores['common']),
+                'min_freq': DRIFT_MIN_FREQ,
+                'top_k': DRIFT_TOP_K,
+                'most_drifted': most,
+                'least_drifted': least,
+                'all': [{'keyword': kw, 'cosine': round(float(c), 4), 'jaccard': round(float(j), 4)}
+                        for kw, c, j in zip(scores['common'], scores['cosine'], scores['jaccard'])],
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  의미 변화 분석 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
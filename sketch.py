@@ -0,0 +1,257 @@
+"""
+스트리밍 근사 빈도 집계 (Sketch)
+- Count-Min Sketch: 임의 키워드 빈도 추정 (과대추정 오차 ≤ ε·N, 확률 1-δ)
+- Space-Saving: 상위 키워드/키워드 쌍 추적 (고정 용량 k, 오차 ≤ N/k)
+- HyperLogLog: 고유 키워드 수 추정 (상대 표준오차 ≈ 1.04/√m)
+- 모든 스케치는 고정 메모리이며 파일/프로세스 간 병합(merge) 가능
+"""
+
+import hashlib
+import math
+import pickle
+from collections import Counter
+from itertools import combinations
+
+import numpy as np
+
+
+def hash64(items):
+    """문자열 목록 → 64비트 해시 배열 (프로세스 간 동일한 값, Python hash()와 달리 고정)"""
+    out = np.empty(len(items), dtype=np.uint64)
+    for i, item in enumerate(items):
+        digest = hashlib.blake2b(str(item).encode('utf-8'), digest_size=8).digest()
+        out[i] = int.from_bytes(digest, 'little')
+    return out
+
+
+def _bit_length(values):
+    """uint64 배열의 비트 길이 (32비트씩 나누어 float64 지수로 정확히 계산)"""
+    hi = (values >> np.uint64(32)).astype(np.float64)
+    lo = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(hi > 0, 32 + np.frexp(hi)[1], np.frexp(lo)[1])
+
+
+class CountMinSketch:
+    """Count-Min Sketch (빈도 과대추정, 오차 ≤ epsilon·N 확률 1-delta)"""
+
+    def __init__(self, epsilon=1e-5, delta=1e-3):
+        self.epsilon = epsilon
+        self.delta = delta
+        self.width = int(math.ceil(math.e / epsilon))
+        self.depth = int(math.ceil(math.log(1 / delta)))
+        self.table = np.zeros((self.depth, self.width), dtype=np.int64)
+        self.total = 0
+
+    def _columns(self, hashes):
+        # 이중 해싱 (Kirsch-Mitzenmacher): h_d = h1 + d·h2
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        rows = np.arange(self.depth, dtype=np.uint64)[:, None]
+        return ((h1[None, :] + rows * h2[None, :]) % np.uint64(self.width)).astype(np.int64)
+
+    def update(self, hashes, counts=1):
+        counts = np.broadcast_to(np.asarray(counts, dtype=np.int64), hashes.shape)
+        cols = self._columns(hashes)
+        for d in range(self.depth):
+            np.add.at(self.table[d], cols[d], counts)
+        self.total += int(counts.sum())
+
+    def estimate(self, hashes):
+        cols = self._columns(hashes)
+        return self.table[np.arange(self.depth)[:, None], cols].min(axis=0)
+
+    def merge(self, other):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError('Count-Min Sketch 크기가 달라 병합할 수 없습니다.')
+        self.table += other.table
+        self.total += other.total
+        return self
+
+
+class SpaceSaving:
+    """Space-Saving 상위 항목 추적 (용량 capacity, 항목별 과대추정 오차 ≤ N/capacity)"""
+
+    def __init__(self, capacity=5000):
+        self.capacity = capacity
+        self.counts = {}    # 항목 → 추정 빈도 (과대추정)
+        self.errors = {}    # 항목 → 최대 과대추정량
+        self.total = 0
+
+    def _floor(self):
+        """용량이 찬 경우 요약에 없는 항목의 빈도 상한 (= 최소 카운트)"""
+        if len(self.counts) < self.capacity:
+            return 0
+        return min(self.counts.values())
+
+    def _truncate(self, counts, errors):
+        if len(counts) > self.capacity:
+            keep = sorted(counts, key=counts.get, reverse=True)[:self.capacity]
+            counts = {k: counts[k] for k in keep}
+            errors = {k: errors[k] for k in keep}
+        self.counts, self.errors = counts, errors
+
+    def update_counts(self, batch):
+        """정확한 배치 집계(Counter)를 요약에 병합"""
+        floor = self._floor()
+        counts, errors = dict(self.counts), dict(self.errors)
+        for item, cnt in batch.items():
+            if item in counts:
+                counts[item] += cnt
+            else:
+                counts[item] = floor + cnt
+                errors[item] = floor
+        self.total += sum(batch.values())
+        self._truncate(counts, errors)
+
+    def merge(self, other):
+        """다른 요약과 병합 (요약에 없는 항목은 상대 요약의 최소 카운트로 상한 보정)"""
+        floor_a, floor_b = self._floor(), other._floor()
+        counts, errors = {}, {}
+        for item in set(self.counts) | set(other.counts):
+            counts[item] = self.counts.get(item, floor_a) + other.counts.get(item, floor_b)
+            errors[item] = self.errors.get(item, floor_a) + other.errors.get(item, floor_b)
+        self.total += other.total
+        self._truncate(counts, errors)
+        return self
+
+    def top(self, n):
+        items = sorted(self.counts.items(), key=lambda x: x[1], reverse=True)[:n]
+        return [(item, cnt, self.errors[item]) for item, cnt in items]
+
+
+class HyperLogLog:
+    """HyperLogLog 고유 개수 추정 (레지스터 2^precision개, 상대 표준오차 ≈ 1.04/√m)"""
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = np.zeros(self.m, dtype=np.uint8)
+
+    @classmethod
+    def for_error(cls, relative_error):
+        """목표 상대 표준오차로부터 정밀도 결정"""
+        precision = int(math.ceil(math.log2((1.04 / relative_error) ** 2)))
+        return cls(min(max(precision, 4), 18))
+
+    def update(self, hashes):
+        p = np.uint64(self.precision)
+        idx = (hashes >> (np.uint64(64) - p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - self.precision)) - 1)
+        rank = ((64 - self.precision) - _bit_length(rest) + 1).astype(np.uint8)
+        np.maximum.at(self.registers, idx, rank)
+
+    def estimate(self):
+        alpha = 0.7213 / (1 + 1.079 / self.m)
+        raw = alpha * self.m ** 2 / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if raw <= 2.5 * self.m and zeros:
+            return self.m * math.log(self.m / zeros)   # 소규모 보정 (linear counting)
+        return float(raw)
+
+    def merge(self, other):
+        if self.precision != other.precision:
+            raise ValueError('HyperLogLog 정밀도가 달라 병합할 수 없습니다.')
+        np.maximum(self.registers, other.registers, out=self.registers)
+        return self
+
+
+class KeywordSketch:
+    """키워드/키워드 쌍 스트리밍 집계 묶음 (Counter와 호환되는 조회 인터페이스 제공)
+
+    - most_common(n), get(keyword, default), len() 지원 → phase1 출력/저장 함수에서 그대로 사용
+    """
+
+    def __init__(self, epsilon=1e-5, delta=1e-3, capacity=5000, hll_error=0.01,
+                 track_pairs=True, batch_docs=10_000):
+        self.batch_docs = batch_docs
+        self.cms = CountMinSketch(epsilon, delta)
+        self.keywords = SpaceSaving(capacity)
+        self.pairs = SpaceSaving(capacity) if track_pairs else None
+        self.unique = HyperLogLog.for_error(hll_error)
+        self.n_docs = 0
+        self._batch = Counter()
+        self._pair_batch = Counter()
+        self._batched_docs = 0
+
+    def update_doc(self, keywords):
+        """문서 1건의 키워드 목록 반영 (배치에 모았다가 flush 시 스케치에 반영)"""
+        self._batch.update(keywords)
+        if self.pairs is not None:
+            self._pair_batch.update(combinations(sorted(set(keywords)), 2))
+        self.n_docs += 1
+        self._batched_docs += 1
+        if self._batched_docs >= self.batch_docs:
+            self.flush()
+
+    def flush(self):
+        self._batched_docs = 0
+        if self._batch:
+            items = list(self._batch)
+            hashes = hash64(items)
+            self.cms.update(hashes, np.array([self._batch[k] for k in items], dtype=np.int64))
+            self.unique.update(hashes)
+            self.keywords.update_counts(self._batch)
+            self._batch = Counter()
+        if self._pair_batch:
+            self.pairs.update_counts(self._pair_batch)
+            self._pair_batch = Counter()
+
+    def merge(self, other):
+        self.flush()
+        other.flush()
+        self.cms.merge(other.cms)
+        self.keywords.merge(other.keywords)
+        if self.pairs is not None and other.pairs is not None:
+            self.pairs.merge(other.pairs)
+        self.unique.merge(other.unique)
+        self.n_docs += other.n_docs
+        return self
+
+    # --- Counter 호환 인터페이스 ---
+
+    def most_common(self, n=None):
+        """상위 키워드 (Space-Saving 후보의 빈도를 Count-Min 추정치로 보정)"""
+        self.flush()
+        candidates = self.keywords.top(len(self.keywords.counts))
+        if not candidates:
+            return []
+        estimates = self.cms.estimate(hash64([c[0] for c in candidates]))
+        result = [(kw, int(min(cnt, est))) for (kw, cnt, _), est in zip(candidates, estimates)]
+        result.sort(key=lambda x: x[1], reverse=True)
+        return result[:n] if n is not None else result
+
+    def get(self, keyword, default=0):
+        self.flush()
+        est = int(self.cms.estimate(hash64([keyword]))[0])
+        return est if est > 0 else default
+
+    def __len__(self):
+        self.flush()
+        return int(round(self.unique.estimate()))
+
+    def top_pairs(self, n):
+        self.flush()
+        if self.pairs is None:
+            return []
+        return [(pair, cnt) for pair, cnt, _ in self.pairs.top(n)]
+
+    def error_bounds(self):
+        """현재 스케치의 오차 한계"""
+        self.flush()
+        return {
+            'total_keywords': self.cms.total,
+            'count_min_abs_error': math.ceil(self.cms.epsilon * self.cms.total),
+            'count_min_confidence': 1 - self.cms.delta,
+            'space_saving_max_error': math.ceil(self.keywords.total / self.keywords.capacity),
+            'hll_relative_std_error': round(1.04 / math.sqrt(self.unique.m), 5),
+        }
+
+    def save(self, path):
+        self.flush()
+        with open(path, 'wb') as f:
+            pickle.dump(self, f)
+
+    @staticmethod
+    def load(path):
+        with open(path, 'rb') as f:
+            return pickle.load(f)
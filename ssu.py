@@ -0,0 +1,289 @@
+"""
+통합 실행 CLI - python -m ssu <run|query|plot|bench>
+- 하위 명령이 실제로 필요로 할 때만 분석 모듈을 import (pandas, matplotlib, wordcloud, scipy 지연 로딩)
+- query: 원본 데이터 대신 저장된 분석 결과(output/)만 읽어 즉시 응답
+    cooccur  : 키워드의 동시 출현 상위 키워드 (동시 출현 행렬 npz를 numpy로 읽어 해당 행만 잘라 씀, scipy 불필요)
+    similar  : 임베딩 최근접 이웃
+    gap      : 간극 지수 (gap_analysis.json)
+    docs     : 주어진 키워드를 모두 포함한 문서 수 (메모리 맵 코퍼스 저장소)
+    category : 카테고리/기간 조건별 상위 키워드 (집계 큐브)
+    bool     : 불리언 키워드 질의 (비트맵 색인, 예: "(인공지능 OR 머신러닝) AND 청년 NOT 코로나19")
+    papers   : 주제/기사 텍스트와 관련된 논문 (BM25 검색 색인)
+- run/plot/bench: 기존 스크립트의 main()을 그대로 실행 (나머지 인자는 해당 스크립트로 전달)
+
+예시:
+    python -m ssu run phase1 phase2 phase3
+    python -m ssu query cooccur 인공지능 --source paper
+    python -m ssu plot gap wordcloud
+    python -m ssu run sweep -- --top 10
+    python -m ssu bench -- --scales 10000
+"""
+
+import argparse
+import importlib
+import json
+import sys
+import time
+
+import numpy as np
+
+# config에서 설정 import (표준 라이브러리만 사용하므로 가벼움)
+from config import OUTPUT_DIR, VIZ_TOP_N
+
+
+# 실행 대상 이름 → 모듈 (import는 실행 시점에)
+RUN_TARGETS = {
+    'phase1': 'phase1_preprocess',
+    'phase2': 'phase2_tfidf',
+    'phase3': 'phase3_cooccurrence',
+    'phase4': 'phase4_visualization',
+    'phase5': 'phase5_keyword_pair_mentions',
+    'wordcloud': 'phase5_visualize_wordcloud',
+    'top5': 'top5_cooccurrence_analysis',
+    'paper-co': 'paper_top_co_keywords',
+    'network': 'network_analysis',
+    'embedding': 'embedding',
+    'drift': 'semantic_drift',
+    'topics': 'topic_model',
+    'categories': 'category_propagation',
+    'cube': 'category_cube',
+    'sweep': 'gap_sweep',
+    'pair-gap': 'pair_gap',
+    'burst': 'burst_detection',
+    'bitmap': 'bitmap_index',
+    'itemsets': 'itemset_mining',
+    'retrieval': 'paper_retrieval',
+    'ingest': 'ingest',
+    'bootstrap': 'bootstrap_stability',
+    'preview': 'preview',
+}
+PIPELINE = ['phase1', 'phase2', 'phase3', 'phase4']
+PLOT_TARGETS = {
+    'gap': 'phase4_visualization',
+    'wordcloud': 'phase5_visualize_wordcloud',
+    'paper-co': 'paper_top_co_keywords',
+}
+
+
+def run_module(module_name, argv=()):
+    """모듈 import 후 main() 실행 (argparse를 쓰는 스크립트에는 argv 전달)"""
+    module = importlib.import_module(module_name)
+    saved = sys.argv
+    sys.argv = [f'{module_name}.py', *argv]
+    try:
+        module.main()
+    finally:
+        sys.argv = saved
+
+
+def _load_json(path):
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def top_cooccur(source, term, top_n=VIZ_TOP_N):
+    """키워드의 동시 출현 상위 키워드
+
+    - 전체 어휘 행렬(output/<source>_cooccurrence_matrix.npz)이 있으면 해당 행 구간만 잘라 씀
+      (압축 npz는 메모리 매핑이 안 되므로 indptr/indices/data 배열은 통째로 읽어 풀림)
+    - 없으면 Phase 3 결과(output/<source>_cooccurrence.json, 주요 키워드만) 사용
+
+    Returns:
+        (문서 빈도, [(키워드, 동시 출현 수)]) 또는 None
+    """
+    matrix_path = OUTPUT_DIR / f'{source}_cooccurrence_matrix.npz'
+    if matrix_path.exists():
+        meta = _load_json(OUTPUT_DIR / f'{source}_cooccurrence_vocab.json')
+        vocab = meta['vocab']
+        i = {kw: k for k, kw in enumerate(vocab)}.get(term)
+        if i is None:
+            return None
+        # scipy.sparse.save_npz 형식(CSR)을 numpy로 직접 읽음 (shape/format 등 나머지 항목은 로드하지 않음)
+        with np.load(matrix_path) as data:
+            indptr = data['indptr']
+            start, end = indptr[i], indptr[i + 1]
+            cols = data['indices'][start:end]
+            vals = data['data'][start:end]
+        order = np.lexsort((cols, -vals))[:top_n]
+        return meta['keyword_freq'][i], [(vocab[cols[k]], int(vals[k])) for k in order]
+
+    results = _load_json(OUTPUT_DIR / f'{source}_cooccurrence.json') or {}
+    if term not in results:
+        return None
+    return results[term]['freq'], [(c['keyword'], c['count']) for c in results[term]['top_cooccur'][:top_n]]
+
+
+def query_cooccur(args):
+    for source in args.source:
+        result = top_cooccur(source, args.term, args.top)
+        print(f"\n[{source}] {args.term}")
+        if result is None:
+            print("  (결과 없음: 어휘에 없거나 동시 출현 결과가 저장되지 않음)")
+            continue
+        freq, items = result
+        print(f"  출현 문서 수: {freq:,}")
+        for kw, cnt in items:
+            print(f"   - {kw}: {cnt:,}")
+
+
+def query_similar(args):
+    from embedding import load_index
+
+    for source in args.source:
+        if not (OUTPUT_DIR / f'{source}_embeddings.npz').exists():
+            print(f"\n[{source}] 임베딩이 없습니다 (python -m ssu run embedding)")
+            continue
+        neighbors = load_index(source).similar([args.term], args.top).get(args.term)
+        print(f"\n[{source}] {args.term}")
+        if not neighbors:
+            print("  (결과 없음)")
+            continue
+        for item in neighbors:
+            print(f"   - {item['keyword']}: {item['similarity']:.3f}")
+
+
+def query_gap(args):
+    gap_data = _load_json(OUTPUT_DIR / 'gap_analysis.json')
+    if gap_data is None:
+        print("gap_analysis.json이 없습니다 (python -m ssu run phase3)")
+        return
+    for g in gap_data:
+        if g['keyword'] == args.term:
+            print(f"\n{g['keyword']}: 뉴스 {g['news_freq']:,} ({g['news_ratio']:.2f}‰) / "
+                  f"논문 {g['paper_freq']:,} ({g['paper_ratio']:.2f}‰) → 간극 {g['gap_index']:+.2f}")
+            return
+    print(f"\n{args.term}: 간극 분석 결과에 없음")
+
+
+def query_docs(args):
+    from corpus import CorpusStore, store_path, find_docs
+
+    for source in args.source:
+        path = store_path(source)
+        if not (path / 'meta.json').exists():
+            print(f"\n[{source}] 코퍼스 저장소가 없습니다 (COOCCUR_FULL_VOCAB=True로 Phase 3 실행)")
+            continue
+        store = CorpusStore(path)
+        doc_ids = find_docs(store, args.terms)
+        print(f"\n[{source}] {' + '.join(args.terms)}: {len(doc_ids):,}건 "
+              f"(1000건당 {len(doc_ids) / max(len(store), 1) * 1000:.2f})")
+
+
+def query_category(args):
+    from category_cube import CUBE_PATH, CategoryCube
+
+    if not CUBE_PATH.exists():
+        print("집계 큐브가 없습니다 (python -m ssu run cube)")
+        return
+    cube = CategoryCube.load()
+    mask = cube.select(categories=args.categories, exclude=args.exclude, periods=args.periods)
+    print(f"\n기사 수: {cube.n_docs(mask):,} / 셀 수: {int(mask.sum()):,}")
+    for kw, cnt in cube.top_keywords(mask, args.top):
+        print(f"   - {kw}: {cnt:,}")
+
+
+def query_bool(args):
+    from bitmap_index import load_or_build_index, run_query, print_results
+
+    expression = ' '.join(args.expression)
+    indexes = {source: load_or_build_index(source) for source in args.source}
+    print_results(expression, run_query(indexes, expression), args.limit)
+
+
+def query_papers(args):
+    from paper_retrieval import load_or_build_index, text_query, print_matches
+
+    index = load_or_build_index()
+    text = ' '.join(args.text)
+    ids, scores = index.search([text_query(text)], args.top)
+    print_matches(f"질의: {text}", index.results(ids[0], scores[0]), args.top)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m ssu', description='SSU 데이터톤 분석 통합 CLI')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='분석 스크립트 실행')
+    run.add_argument('targets', nargs='*', metavar='target',
+                     help=f"실행 대상 ({', '.join(RUN_TARGETS)}, all / 기본값: {' '.join(PIPELINE)}). "
+                          f"-- 뒤의 인자는 마지막 대상 스크립트로 전달")
+
+    query = commands.add_parser('query', help='저장된 결과 조회')
+    kinds = query.add_subparsers(dest='kind', required=True)
+    for name, handler, help_text in (('cooccur', query_cooccur, '동시 출현 상위 키워드'),
+                                     ('similar', query_similar, '임베딩 유사 키워드')):
+        q = kinds.add_parser(name, help=help_text)
+        q.add_argument('term')
+        q.add_argument('--source', nargs='+', choices=['news', 'paper'], default=['news', 'paper'])
+        q.add_argument('--top', type=int, default=VIZ_TOP_N)
+        q.set_defaults(handler=handler)
+    q = kinds.add_parser('gap', help='키워드 간극 지수')
+    q.add_argument('term')
+    q.set_defaults(handler=query_gap)
+    q = kinds.add_parser('docs', help='키워드를 모두 포함한 문서 수')
+    q.add_argument('terms', nargs='+')
+    q.add_argument('--source', nargs='+', choices=['news', 'paper'], default=['news', 'paper'])
+    q.set_defaults(handler=query_docs)
+    q = kinds.add_parser('category', help='카테고리/기간 조건별 상위 키워드 (뉴스)')
+    q.add_argument('--categories', nargs='+')
+    q.add_argument('--exclude', nargs='+')
+    q.add_argument('--periods', nargs='+')
+    q.add_argument('--top', type=int, default=VIZ_TOP_N)
+    q.set_defaults(handler=query_category)
+    q = kinds.add_parser('bool', help='불리언 키워드 질의 (AND/OR/NOT, 괄호, category:<통합 분류1>)')
+    q.add_argument('expression', nargs='+')
+    q.add_argument('--source', nargs='+', choices=['news', 'paper'], default=['news', 'paper'])
+    q.add_argument('--limit', type=int, default=10, help='출력할 문서 ID 수')
+    q.set_defaults(handler=query_bool)
+    q = kinds.add_parser('papers', help='주제/기사 텍스트와 관련된 논문 (BM25)')
+    q.add_argument('text', nargs='+')
+    q.add_argument('--top', type=int, default=VIZ_TOP_N)
+    q.set_defaults(handler=query_papers)
+
+    plot = commands.add_parser('plot', help='시각화 생성')
+    plot.add_argument('targets', nargs='*', metavar='target',
+                      help=f"시각화 대상 ({', '.join(PLOT_TARGETS)} / 기본값: gap)")
+
+    commands.add_parser('bench', help='합성 코퍼스 벤치마크 (-- 뒤의 인자는 benchmark.py로 전달)')
+    return parser
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # -- 뒤의 인자는 실행할 스크립트의 argparse로 그대로 전달
+    extra = []
+    if '--' in argv:
+        k = argv.index('--')
+        argv, extra = argv[:k], argv[k + 1:]
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+
+    if args.command == 'run':
+        targets = args.targets or PIPELINE
+        if 'all' in targets:
+            targets = PIPELINE + ['phase5', 'wordcloud']
+        unknown = [t for t in targets if t not in RUN_TARGETS]
+        if unknown:
+            parser.error(f"알 수 없는 실행 대상: {', '.join(unknown)} (가능: {', '.join(RUN_TARGETS)}, all)")
+        for i, target in enumerate(targets):
+            run_module(RUN_TARGETS[target], extra if i == len(targets) - 1 else ())
+    elif args.command == 'query':
+        args.handler(args)
+        print(f"\n조회 시간: {(time.perf_counter() - start) * 1000:.1f}ms")
+    elif args.command == 'plot':
+        targets = args.targets or ['gap']
+        unknown = [t for t in targets if t not in PLOT_TARGETS]
+        if unknown:
+            parser.error(f"알 수 없는 시각화 대상: {', '.join(unknown)} (가능: {', '.join(PLOT_TARGETS)})")
+        for target in targets:
+            run_module(PLOT_TARGETS[target])
+    elif args.command == 'bench':
+        run_module('benchmark', extra)
+
+
+if __name__ == '__main__':
+    main()
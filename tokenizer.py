@@ -0,0 +1,247 @@
+"""
+제목 형태소 분석 (토큰화)
+- 뉴스 제목 / 논문 TITLE에서 명사 추출 → 정규화(동의어, 불용어) 후 문서 키워드에 추가
+- 백엔드
+    simple: 순수 Python 명사/n-gram 추출 (한글 어절의 조사·어미 제거, 인접 명사 복합어)
+        명사 끝 음절과 같은 한 글자 조사(의/가/서/이/로/도/만/과)는 떼지 않은 어절도 함께 후보로 냄
+        (예: 민주주의 → 민주주의, 민주주 / 정부가 → 정부가, 정부)
+    kiwi: kiwipiepy 형태소 분석기 (일반/고유 명사, 외국어, 붙어 있는 명사는 복합어로 결합)
+    auto: kiwipiepy가 설치되어 있으면 kiwi, 없으면 simple
+- 분석 결과 캐시: SQLite (백엔드 설정 + 텍스트 해시 → 명사 목록, simple은 조사/어미 목록 해시 포함)
+  정규화 전 명사를 저장하므로 동의어/불용어 설정이 바뀌어도 캐시 재사용, 바뀐 문서만 재분석
+- 캐시에 없는 제목만 프로세스 풀로 나누어 분석 (워커마다 분석기 1회 초기화)
+"""
+
+import hashlib
+import importlib.util
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+# config에서 설정 import
+from config import (
+    TOKENIZER_BACKEND, TOKENIZER_NGRAM, TOKENIZER_CACHE, TOKENIZER_WORKERS, TOKENIZER_CHUNK,
+    normalize_keyword, is_valid_keyword
+)
+
+
+# simple 백엔드: 어절 끝에서 제거할 조사 (긴 것부터 검사)
+_JOSA = sorted([
+    '으로부터', '에서부터', '이라는', '이라고', '에서는', '에게서', '으로서', '으로써', '까지의', '부터의',
+    '에서의', '으로의', '에게는', '이지만', '이었다', '에서', '에게', '으로', '라는', '라고', '부터', '까지',
+    '처럼', '보다', '마다', '조차', '이나', '이며', '이고', '이다', '과의', '와의', '에는', '에도', '로서',
+    '로써', '은', '는', '이', '가', '을', '를', '의', '에', '로', '와', '과', '도', '만', '서',
+], key=len, reverse=True)
+
+# 명사의 끝 음절일 수도 있는 한 글자 조사 (예: 민주주의, 전문가, 보고서, 어린이, 교과서)
+_AMBIGUOUS_JOSA = frozenset(['의', '가', '서', '이', '로', '도', '만', '과'])
+
+# 서술어/관형어로 보고 제외할 어절 끝 (명사가 아님)
+_PREDICATE_ENDINGS = (
+    '했다', '한다', '된다', '됐다', '한다고', '했다고', '하는', '하고', '하며', '해야', '하나', '했던',
+    '되는', '되고', '되며', '있다', '없다', '있는', '없는', '이다', '였다', '겠다', '나선다', '밝혔다',
+    '하여', '해서', '되어', '치는', '지는', '리는', '위한', '대한', '관한', '통한', '따른', '향한', '인한',
+    '의한', '활용한', '위해', '통해', '대해', '관해', '따라',
+)
+
+_TOKEN_PATTERN = re.compile(r'[가-힣]+|[A-Za-z][A-Za-z0-9+#.\-]*[A-Za-z0-9+#]|[A-Za-z]')
+
+
+class SimpleTokenizer:
+    """순수 Python 명사/n-gram 추출 (형태소 분석기 없이 동작하는 기본 백엔드)"""
+
+    name = 'simple'
+
+    def __init__(self, ngram=TOKENIZER_NGRAM):
+        self.ngram = ngram
+
+    def _noun(self, token):
+        """어절 → 명사 후보 (서술어, 한 글자 어절이면 None)"""
+        if not '가' <= token[0] <= '힣':
+            return token
+        if len(token) < 2 or token.endswith(_PREDICATE_ENDINGS):
+            return None
+        for josa in _JOSA:
+            if token.endswith(josa) and len(token) - len(josa) >= 2:
+                return token[:-len(josa)]
+        return token
+
+    def nouns(self, text):
+        nouns = []
+        run = []    # 공백으로만 구분되고 조사가 없는 명사 어절 (복합어 후보)
+        prev_end = 0
+        for match in _TOKEN_PATTERN.finditer(text):
+            token = match.group()
+            noun = self._noun(token)
+            # 숫자/문장부호 등을 사이에 두면 복합어를 끊음
+            if noun is None or text[prev_end:match.start()].strip():
+                run = []
+            prev_end = match.end()
+            if noun is None:
+                continue
+            if noun != token and token[len(noun):] in _AMBIGUOUS_JOSA:
+                nouns.append(token)
+            nouns.append(noun)
+            is_hangul = '가' <= noun[0] <= '힣'
+            if is_hangul and self.ngram > 1:
+                run.append(noun)
+                for n in range(2, min(self.ngram, len(run)) + 1):
+                    nouns.append(''.join(run[-n:]))
+            # 조사가 붙은 어절 뒤에서는 복합어를 끊음
+            if not is_hangul or noun != token:
+                run = []
+        return nouns
+
+
+class KiwiTokenizer:
+    """kiwipiepy 형태소 분석기 백엔드 (pip install kiwipiepy)"""
+
+    name = 'kiwi'
+    TAGS = ('NNG', 'NNP', 'SL')
+
+    def __init__(self, ngram=TOKENIZER_NGRAM):
+        from kiwipiepy import Kiwi
+
+        self.kiwi = Kiwi()
+
+    def nouns(self, text):
+        nouns = []
+        prev_end = None
+        compound = ''
+        for token in self.kiwi.tokenize(text):
+            if token.tag not in self.TAGS:
+                prev_end = None
+                continue
+            nouns.append(token.form)
+            # 공백 없이 붙어 있는 명사는 복합어로 결합 (예: 인공 + 지능 → 인공지능)
+            if prev_end == token.start and compound:
+                compound += token.form
+                nouns.append(compound)
+            else:
+                compound = token.form
+            prev_end = token.start + token.len
+        return nouns
+
+
+BACKENDS = {'simple': SimpleTokenizer, 'kiwi': KiwiTokenizer}
+
+
+def resolve_backend(backend=TOKENIZER_BACKEND):
+    """'auto' → 설치된 백엔드 이름"""
+    if backend == 'auto':
+        return 'kiwi' if importlib.util.find_spec('kiwipiepy') is not None else 'simple'
+    if backend not in BACKENDS:
+        raise ValueError(f"알 수 없는 토크나이저 백엔드: {backend} (가능: auto, {', '.join(BACKENDS)})")
+    return backend
+
+
+def make_tokenizer(backend=TOKENIZER_BACKEND, ngram=TOKENIZER_NGRAM):
+    return BACKENDS[resolve_backend(backend)](ngram)
+
+
+def backend_key(backend, ngram=TOKENIZER_NGRAM):
+    """캐시 키에 포함할 백엔드 설정 (분석기 버전/설정, simple 조사·어미 목록이 바뀌면 새로 분석)"""
+    if backend == 'kiwi':
+        from importlib.metadata import version
+        return f"kiwi:{version('kiwipiepy')}"
+    rules = '\t'.join(_JOSA + sorted(_AMBIGUOUS_JOSA) + list(_PREDICATE_ENDINGS))
+    return f"simple:{ngram}:{hashlib.sha1(rules.encode('utf-8')).hexdigest()[:8]}"
+
+
+class TokenCache:
+    """분석 결과 캐시 (SQLite, 키: 백엔드 설정 + 텍스트의 SHA-1)"""
+
+    def __init__(self, path=TOKENIZER_CACHE):
+        self.conn = sqlite3.connect(str(path))
+        self.conn.execute('CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, nouns TEXT)')
+
+    @staticmethod
+    def make_key(prefix, text):
+        return hashlib.sha1(f'{prefix}\0{text}'.encode('utf-8')).hexdigest()
+
+    def get_many(self, keys, batch=500):
+        found = {}
+        for i in range(0, len(keys), batch):
+            part = keys[i:i + batch]
+            rows = self.conn.execute(
+                f"SELECT key, nouns FROM tokens WHERE key IN ({','.join('?' * len(part))})", part)
+            for key, nouns in rows:
+                found[key] = nouns.split('\t') if nouns else []
+        return found
+
+    def put_many(self, items):
+        self.conn.executemany('INSERT OR REPLACE INTO tokens VALUES (?, ?)',
+                              ((key, '\t'.join(nouns)) for key, nouns in items))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+# 워커 프로세스별 분석기 (ProcessPoolExecutor initializer에서 1회 생성)
+_worker_tokenizer = None
+
+
+def _init_worker(backend, ngram):
+    global _worker_tokenizer
+    _worker_tokenizer = make_tokenizer(backend, ngram)
+
+
+def _analyze_chunk(texts):
+    return [_worker_tokenizer.nouns(text) for text in texts]
+
+
+def analyze_texts(texts, backend=TOKENIZER_BACKEND, ngram=TOKENIZER_NGRAM, workers=TOKENIZER_WORKERS,
+                  chunk_size=TOKENIZER_CHUNK, cache_path=TOKENIZER_CACHE):
+    """텍스트 목록 → 텍스트별 명사 목록 (캐시 우선, 없는 것만 병렬 분석)
+
+    Returns:
+        nouns: list[list[str]] (입력 순서)
+        stats: dict (backend, unique, cached, analyzed)
+    """
+    backend = resolve_backend(backend)
+    prefix = backend_key(backend, ngram)
+
+    unique = list(dict.fromkeys(texts))
+    keys = {text: TokenCache.make_key(prefix, text) for text in unique}
+
+    cache = TokenCache(cache_path)
+    try:
+        results = cache.get_many(list(keys.values()))
+        missing = [text for text in unique if keys[text] not in results]
+        n_cached = len(unique) - len(missing)
+
+        if missing:
+            if len(missing) <= chunk_size or workers == 1:
+                tokenizer = make_tokenizer(backend, ngram)
+                analyzed = [tokenizer.nouns(text) for text in missing]
+            else:
+                chunks = [missing[i:i + chunk_size] for i in range(0, len(missing), chunk_size)]
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                         initargs=(backend, ngram)) as pool:
+                    analyzed = [nouns for part in pool.map(_analyze_chunk, chunks) for nouns in part]
+            new_items = [(keys[text], nouns) for text, nouns in zip(missing, analyzed)]
+            cache.put_many(new_items)
+            results.update(new_items)
+    finally:
+        cache.close()
+
+    stats = {'backend': backend, 'unique': len(unique), 'cached': n_cached, 'analyzed': len(missing)}
+    return [results[keys[text]] for text in texts], stats
+
+
+def title_keywords(titles, **kwargs):
+    """제목 목록 → 제목별 정규화 키워드 목록 (동의어 통합, 불용어 제거, 순서 유지 중복 제거)
+
+    결측(None/NaN)은 빈 목록
+    """
+    texts = [title if isinstance(title, str) else '' for title in titles]
+    nouns, stats = analyze_texts(texts, **kwargs)
+    print(f"  제목 형태소 분석 ({stats['backend']}): 고유 제목 {stats['unique']:,}건 "
+          f"(캐시 {stats['cached']:,}건, 신규 분석 {stats['analyzed']:,}건)")
+
+    result = []
+    for doc_nouns in nouns:
+        keywords = [normalize_keyword(n) for n in doc_nouns]
+        result.append(list(dict.fromkeys(k for k in keywords if is_valid_keyword(k))))
+    return result
@@ -1,280 +1,296 @@
 """
-상위 5개 키워드 간 동시 출현 분석
-- Paper 상위 5개: 코로나19, 인공지능, ESG, 직무만족, 우울
-- News 상위 5개: 인공지능, 여성, 청년, 혁신, 플랫폼
+상위 N개 키워드 간 동시 출현 분석
+- Paper/News 각각 문서 빈도 상위 N개 키워드를 코퍼스 저장소에서 자동 선정 (TOP_COOCCUR_N, 기본 5)
+- 코퍼스별 동시 출현 행렬은 통합 키워드 집합에 대해 한 번만 계산
+    선택 행렬 P (어휘 × 키워드) → 문서 × 키워드 부분 행렬 X·P → (X·P)ᵀ(X·P) (대각 = 개별 출현 문서 수)
+    결과는 (코퍼스, 키워드 집합)으로 메모이즈 → 개별 빈도, 동시출현률, 요약 테이블이 같은 행렬을 재사용
+- 희소 행렬로 계산하므로 N이 수천 개여도 동작 (콘솔 출력은 TOP_COOCCUR_PRINT_N개까지, 저장 결과는 전체)
 """
 
-import pandas as pd
+import argparse
 import json
-from collections import Counter, defaultdict
+
+import numpy as np
 
 # config에서 설정 import
 from config import (
-    NEWS_FILES, PAPER_FILE, OUTPUT_DIR,
-    NEWS_EXCLUDE_CATEGORIES,
-    normalize_keyword, init_dirs
+    OUTPUT_DIR, TOP_COOCCUR_N, TOP_COOCCUR_PRINT_N,
+    init_dirs
 )
+from corpus import load_or_build_store
+from profiling import span, start_run, finish_run
 
 
-# 분석 대상 키워드 정의
-PAPER_TOP5 = ['코로나19', '인공지능', 'ESG', '직무만족', '우울']
-NEWS_TOP5 = ['인공지능', '여성', '청년', '혁신', '플랫폼']
-
-# 통합 키워드 목록 (중복 제거)
-ALL_KEYWORDS = list(set(PAPER_TOP5 + NEWS_TOP5))
-
-
-def extract_docs_with_keywords(source='news'):
-    """문서별 키워드 추출 (동의어 정규화 적용)"""
-    all_docs = []
-
-    if source == 'news':
-        for file in NEWS_FILES:
-            df = pd.read_excel(file)
-            # 카테고리 필터링
-            df = df[~df['통합 분류1'].isin(NEWS_EXCLUDE_CATEGORIES)]
-            for kw in df['키워드'].dropna():
-                # 동의어 정규화 적용
-                keywords = [normalize_keyword(k.strip()) for k in str(kw).split(',') if k.strip()]
-                keywords = list(set(keywords))  # 중복 제거
-                if keywords:
-                    all_docs.append(keywords)
-    else:  # paper
-        with open(PAPER_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        for item in data['NODE_LIST']:
-            kywd = item.get('KYWD')
-            if kywd:
-                # 동의어 정규화 적용
-                keywords = [normalize_keyword(k.strip()) for k in str(kywd).split(',') if k.strip()]
-                keywords = list(set(keywords))  # 중복 제거
-                if keywords:
-                    all_docs.append(keywords)
-
-    return all_docs
-
-
-def calculate_cooccurrence_matrix(docs, target_keywords):
-    """
-    대상 키워드 간의 동시 출현 매트릭스 계산
+# 코퍼스 저장소 / 동시 출현 행렬 메모이즈 (프로세스 내 재사용)
+_stores = {}
+_matrices = {}
+
+
+def get_store(source):
+    if source not in _stores:
+        _stores[source] = load_or_build_store(source)
+    return _stores[source]
+
+
+def top_keywords(source, n=TOP_COOCCUR_N):
+    """문서 빈도 상위 n개 키워드 (빈도 내림차순, 동률은 어휘 순서)"""
+    store = get_store(source)
+    order = np.argsort(-np.asarray(store.doc_freq), kind='stable')[:n]
+    return [store.vocab[i] for i in order]
+
+
+class KeywordCooccurrence:
+    """키워드 집합의 동시 출현 행렬 (키워드 × 키워드 CSR, 대각 = 개별 출현 문서 수)"""
+
+    def __init__(self, keywords, counts, n_docs):
+        self.keywords = list(keywords)
+        self.index = {kw: i for i, kw in enumerate(self.keywords)}
+        self.counts = counts
+        self.freq = counts.diagonal().astype(np.int64)
+        self.n_docs = n_docs
+
+    def __len__(self):
+        return len(self.keywords)
+
+    def keyword_freq(self, kw):
+        return int(self.freq[self.index[kw]])
+
+    def ratio(self, kw):
+        """전체 문서 중 키워드 출현 비율 (%)"""
+        return self.keyword_freq(kw) / self.n_docs * 100 if self.n_docs else 0
+
+    def count(self, kw1, kw2):
+        if kw1 == kw2:
+            return 0
+        return int(self.counts[self.index[kw1], self.index[kw2]])
+
+    def neighbors(self, kw):
+        """kw와 함께 출현한 키워드 [(키워드, 동시 출현 수, 동시출현률 %)] (동시 출현 수 내림차순)"""
+        i = self.index[kw]
+        start, end = self.counts.indptr[i], self.counts.indptr[i + 1]
+        cols = self.counts.indices[start:end]
+        vals = self.counts.data[start:end]
+        keep = (cols != i) & (vals > 0)
+        cols, vals = cols[keep], vals[keep]
+        order = np.lexsort((cols, -vals))
+        freq = max(int(self.freq[i]), 1)
+        return [(self.keywords[cols[k]], int(vals[k]), vals[k] / freq * 100) for k in order]
 
-    Returns:
-        matrix: dict[keyword1][keyword2] = count (동시 출현 문서 수)
-        keyword_freq: dict[keyword] = count (개별 출현 문서 수)
+    def pairs(self):
+        """상삼각 (i < j) 동시 출현 쌍 → (행 번호, 열 번호, 동시 출현 수)"""
+        from scipy import sparse
+
+        upper = sparse.triu(self.counts, k=1).tocoo()
+        keep = upper.data > 0
+        return upper.row[keep].astype(np.int64), upper.col[keep].astype(np.int64), upper.data[keep].astype(np.int64)
+
+    def to_dict(self):
+        """{kw1: {kw2: 동시 출현 수}} (0인 쌍과 대각 제외)"""
+        return {kw: {kw2: count for kw2, count, _ in self.neighbors(kw)}
+                for kw in self.keywords if self.freq[self.index[kw]] > 0}
+
+
+def cooccurrence_matrix(source, keywords):
+    """코퍼스의 키워드 집합 동시 출현 행렬 ((코퍼스, 키워드 집합) 단위 메모이즈)
+
+    키워드는 정렬된 순서로 행/열에 배치 (입력 순서와 무관하게 같은 행렬 재사용),
+    코퍼스 어휘에 없는 키워드는 빈도 0 행/열
     """
-    matrix = defaultdict(lambda: defaultdict(int))
-    keyword_freq = Counter()
+    from scipy import sparse
 
-    for doc in docs:
-        doc_set = set(doc)
+    key = (source, frozenset(keywords))
+    if key in _matrices:
+        return _matrices[key]
 
-        # 각 키워드의 개별 출현 빈도 계산
-        for kw in target_keywords:
-            if kw in doc_set:
-                keyword_freq[kw] += 1
+    store = get_store(source)
+    keywords = sorted(key[1])
+    vocab_index = store.vocab_index
+    present = [(j, vocab_index[kw]) for j, kw in enumerate(keywords) if kw in vocab_index]
+    positions = np.array([j for j, _ in present], dtype=np.int64)
+    term_ids = np.array([t for _, t in present], dtype=np.int64)
+    selector = sparse.csr_matrix((np.ones(len(present), dtype=np.float32), (term_ids, positions)),
+                                 shape=(store.n_terms, len(keywords)))
 
-        # 대상 키워드 간 동시 출현 계산
-        for kw1 in target_keywords:
-            if kw1 in doc_set:
-                for kw2 in target_keywords:
-                    if kw2 in doc_set and kw1 != kw2:
-                        matrix[kw1][kw2] += 1
+    sub = store.to_matrix() @ selector
+    counts = (sub.T @ sub).tocsr()
+    counts.data = np.rint(counts.data).astype(np.int64)
+    counts.sort_indices()
 
-    return matrix, keyword_freq
+    _matrices[key] = KeywordCooccurrence(keywords, counts, store.n_docs)
+    return _matrices[key]
 
 
-def print_cooccurrence_analysis(source_name, docs, target_keywords, top5_label, top5_keywords):
-    """동시 출현 분석 결과 출력"""
+def print_cooccurrence_analysis(source_name, matrix, top_list, top_label, limit=TOP_COOCCUR_PRINT_N):
+    """상위 키워드 개별 빈도 + 키워드 간 동시 출현 매트릭스 출력 (통합 행렬에서 읽음)"""
+    n = len(top_list)
     print(f"\n{'=' * 70}")
-    print(f"{source_name} 데이터에서 {top5_label} 상위 5개 키워드 동시 출현 분석")
+    print(f"{source_name} 데이터에서 {top_label} 상위 {n}개 키워드 동시 출현 분석")
     print('=' * 70)
-    print(f"총 문서 수: {len(docs):,}")
-
-    matrix, keyword_freq = calculate_cooccurrence_matrix(docs, target_keywords)
+    print(f"총 문서 수: {matrix.n_docs:,}")
 
-    # 개별 키워드 출현 빈도
-    print(f"\n[{top5_label} 상위 5개 키워드 개별 출현 빈도]")
+    print(f"\n[{top_label} 상위 {n}개 키워드 개별 출현 빈도]")
     print("-" * 50)
-    for kw in top5_keywords:
-        freq = keyword_freq.get(kw, 0)
-        ratio = freq / len(docs) * 100 if docs else 0
-        print(f"  {kw}: {freq:,}회 ({ratio:.2f}%)")
+    for kw in top_list[:limit]:
+        print(f"  {kw}: {matrix.keyword_freq(kw):,}회 ({matrix.ratio(kw):.2f}%)")
 
-    # 동시 출현 매트릭스 출력
-    print(f"\n[{top5_label} 상위 5개 키워드 간 동시 출현 매트릭스]")
+    # 매트릭스는 열 수가 적을 때만 출력
+    shown = top_list[:min(limit, 10)]
+    print(f"\n[{top_label} 상위 {len(shown)}개 키워드 간 동시 출현 매트릭스]")
     print("-" * 70)
-
-    # 헤더 출력
     header = f"{'키워드':<12}"
-    for kw in top5_keywords:
+    for kw in shown:
         header += f" {kw:>10}"
     print(header)
     print("-" * 70)
-
-    # 각 행 출력
-    for kw1 in top5_keywords:
+    for kw1 in shown:
         row = f"{kw1:<12}"
-        for kw2 in top5_keywords:
-            if kw1 == kw2:
-                row += f" {'-':>10}"
-            else:
-                count = matrix[kw1][kw2]
-                row += f" {count:>10,}"
+        for kw2 in shown:
+            row += f" {'-':>10}" if kw1 == kw2 else f" {matrix.count(kw1, kw2):>10,}"
         print(row)
 
-    return matrix, keyword_freq
-
 
-def analyze_cross_occurrence(docs, source_name):
-    """모든 대상 키워드 간 동시 출현 분석"""
+def analyze_cross_occurrence(source_name, matrix, paper_top, news_top, limit=TOP_COOCCUR_PRINT_N):
+    """통합 키워드 간 동시 출현 분석 (개별 빈도, 키워드별 동시출현률)"""
     print(f"\n{'=' * 70}")
     print(f"{source_name} 데이터: 전체 주요 키워드 간 동시 출현 분석")
     print('=' * 70)
 
-    matrix, keyword_freq = calculate_cooccurrence_matrix(docs, ALL_KEYWORDS)
+    paper_set, news_set = set(paper_top), set(news_top)
+    order = np.lexsort((np.arange(len(matrix)), -matrix.freq))
+    sorted_keywords = [matrix.keywords[i] for i in order]
 
-    # 개별 출현 빈도
-    print(f"\n[전체 주요 키워드 개별 출현 빈도]")
+    print(f"\n[전체 주요 키워드 개별 출현 빈도] ({len(sorted_keywords):,}개 중 상위 {min(limit, len(sorted_keywords))}개)")
     print("-" * 50)
-    sorted_keywords = sorted(ALL_KEYWORDS, key=lambda x: keyword_freq.get(x, 0), reverse=True)
-    for kw in sorted_keywords:
-        freq = keyword_freq.get(kw, 0)
-        ratio = freq / len(docs) * 100 if docs else 0
-        source_label = ""
-        if kw in PAPER_TOP5 and kw in NEWS_TOP5:
+    for kw in sorted_keywords[:limit]:
+        if kw in paper_set and kw in news_set:
             source_label = "[Paper+News]"
-        elif kw in PAPER_TOP5:
+        elif kw in paper_set:
             source_label = "[Paper]"
         else:
             source_label = "[News]"
-        print(f"  {kw:<10} {source_label:<15}: {freq:,}회 ({ratio:.2f}%)")
+        print(f"  {kw:<10} {source_label:<15}: {matrix.keyword_freq(kw):,}회 ({matrix.ratio(kw):.2f}%)")
 
-    # 동시 출현 상세 분석
     print(f"\n[키워드별 동시 출현 상세]")
-    for kw1 in sorted_keywords:
-        if keyword_freq.get(kw1, 0) == 0:
+    for kw1 in sorted_keywords[:limit]:
+        if matrix.keyword_freq(kw1) == 0:
             continue
-        print(f"\n▶ {kw1} (출현: {keyword_freq.get(kw1, 0):,}회)")
-        cooccur_list = []
-        for kw2 in ALL_KEYWORDS:
-            if kw1 != kw2 and matrix[kw1][kw2] > 0:
-                cooccur_list.append((kw2, matrix[kw1][kw2]))
-        cooccur_list.sort(key=lambda x: x[1], reverse=True)
-
-        if cooccur_list:
-            for kw2, count in cooccur_list:
-                # kw1이 출현한 문서 중 kw2도 함께 출현한 비율
-                ratio = count / keyword_freq.get(kw1, 1) * 100
-                print(f"   - {kw2}: {count:,}회 (동시출현률: {ratio:.1f}%)")
-        else:
+        print(f"\n▶ {kw1} (출현: {matrix.keyword_freq(kw1):,}회)")
+        neighbors = matrix.neighbors(kw1)
+        if not neighbors:
             print("   (동시 출현 없음)")
+        # kw1이 출현한 문서 중 kw2도 함께 출현한 비율
+        for kw2, count, rate in neighbors[:limit]:
+            print(f"   - {kw2}: {count:,}회 (동시출현률: {rate:.1f}%)")
 
-    return matrix, keyword_freq
 
+def create_summary_table(paper_matrix, news_matrix, limit=TOP_COOCCUR_PRINT_N):
+    """요약 테이블 (Paper/News 중 한쪽이라도 동시 출현한 쌍, 동시 출현 합계 내림차순)
 
-def create_summary_table(paper_docs, news_docs):
-    """요약 테이블 생성"""
+    두 행렬은 같은 키워드 집합 (정렬 순서 동일)
+    """
     print("\n" + "=" * 80)
     print("동시 출현 분석 요약 테이블")
     print("=" * 80)
 
-    # Paper 분석
-    paper_matrix, paper_freq = calculate_cooccurrence_matrix(paper_docs, ALL_KEYWORDS)
-    # News 분석
-    news_matrix, news_freq = calculate_cooccurrence_matrix(news_docs, ALL_KEYWORDS)
+    keywords = paper_matrix.keywords
+    n = len(keywords)
+    codes = {}
+    for name, matrix in (('paper', paper_matrix), ('news', news_matrix)):
+        rows, cols, counts = matrix.pairs()
+        codes[name] = (rows * n + cols, counts)
+    all_codes = np.union1d(codes['paper'][0], codes['news'][0])
+
+    pair_counts = {}
+    for name, (pair_codes, counts) in codes.items():
+        full = np.zeros(len(all_codes), dtype=np.int64)
+        full[np.searchsorted(all_codes, pair_codes)] = counts
+        pair_counts[name] = full
+    total = pair_counts['paper'] + pair_counts['news']
+    order = np.argsort(-total, kind='stable')
 
     results = []
-    for kw1 in ALL_KEYWORDS:
-        for kw2 in ALL_KEYWORDS:
-            if kw1 < kw2:  # 중복 방지
-                paper_count = paper_matrix[kw1][kw2]
-                news_count = news_matrix[kw1][kw2]
-                results.append({
-                    '키워드1': kw1,
-                    '키워드2': kw2,
-                    'Paper동시출현': paper_count,
-                    'News동시출현': news_count,
-                    'Paper키워드1빈도': paper_freq.get(kw1, 0),
-                    'Paper키워드2빈도': paper_freq.get(kw2, 0),
-                    'News키워드1빈도': news_freq.get(kw1, 0),
-                    'News키워드2빈도': news_freq.get(kw2, 0),
-                })
-
-    # 정렬: Paper 동시출현 기준 내림차순
-    results.sort(key=lambda x: (x['Paper동시출현'] + x['News동시출현']), reverse=True)
-
-    # 출력
+    for k in order:
+        i, j = divmod(int(all_codes[k]), n)
+        kw1, kw2 = keywords[i], keywords[j]
+        results.append({
+            '키워드1': kw1,
+            '키워드2': kw2,
+            'Paper동시출현': int(pair_counts['paper'][k]),
+            'News동시출현': int(pair_counts['news'][k]),
+            'Paper키워드1빈도': int(paper_matrix.freq[i]),
+            'Paper키워드2빈도': int(paper_matrix.freq[j]),
+            'News키워드1빈도': int(news_matrix.freq[i]),
+            'News키워드2빈도': int(news_matrix.freq[j]),
+        })
+
     print(f"\n{'키워드1':<10} | {'키워드2':<10} | {'Paper동시출현':>12} | {'News동시출현':>12}")
     print("-" * 55)
-    for r in results:
-        if r['Paper동시출현'] > 0 or r['News동시출현'] > 0:
-            print(f"{r['키워드1']:<10} | {r['키워드2']:<10} | {r['Paper동시출현']:>12,} | {r['News동시출현']:>12,}")
+    for r in results[:limit]:
+        print(f"{r['키워드1']:<10} | {r['키워드2']:<10} | {r['Paper동시출현']:>12,} | {r['News동시출현']:>12,}")
+    if len(results) > limit:
+        print(f"  ... 외 {len(results) - limit:,}쌍 (전체는 결과 파일에 저장)")
 
     return results
 
 
 def main():
     """메인 실행"""
+    parser = argparse.ArgumentParser(description='상위 N개 키워드 간 동시 출현 분석')
+    parser.add_argument('--top', type=int, default=TOP_COOCCUR_N, help='코퍼스별 상위 키워드 수')
+    args = parser.parse_args()
+
     init_dirs()
+    start_run('top5_cooccurrence_analysis')
 
     print("=" * 70)
-    print("상위 5개 키워드 동시 출현 분석")
+    print(f"상위 {args.top}개 키워드 동시 출현 분석")
     print("=" * 70)
-    print(f"\nPaper 상위 5개: {PAPER_TOP5}")
-    print(f"News 상위 5개: {NEWS_TOP5}")
-    print(f"통합 키워드: {ALL_KEYWORDS}")
 
-    # 데이터 로드
     print("\n[데이터 로드 중...]")
-    paper_docs = extract_docs_with_keywords(source='paper')
-    news_docs = extract_docs_with_keywords(source='news')
-
-    print(f"  Paper 문서 수: {len(paper_docs):,}")
-    print(f"  News 문서 수: {len(news_docs):,}")
-
-    # 1. Paper 데이터에서 Paper 상위 5개 키워드 분석
-    print_cooccurrence_analysis("Paper", paper_docs, PAPER_TOP5, "Paper", PAPER_TOP5)
-
-    # 2. News 데이터에서 News 상위 5개 키워드 분석
-    print_cooccurrence_analysis("News", news_docs, NEWS_TOP5, "News", NEWS_TOP5)
-
-    # 3. Paper 데이터에서 전체 주요 키워드 분석
-    analyze_cross_occurrence(paper_docs, "Paper")
-
-    # 4. News 데이터에서 전체 주요 키워드 분석
-    analyze_cross_occurrence(news_docs, "News")
-
-    # 5. 요약 테이블
-    summary = create_summary_table(paper_docs, news_docs)
-
-    # 결과 저장
-    output_file = OUTPUT_DIR / 'top5_cooccurrence_analysis.json'
-
-    # Paper/News 매트릭스 저장
-    paper_matrix, paper_freq = calculate_cooccurrence_matrix(paper_docs, ALL_KEYWORDS)
-    news_matrix, news_freq = calculate_cooccurrence_matrix(news_docs, ALL_KEYWORDS)
-
-    output_data = {
-        'paper_top5': PAPER_TOP5,
-        'news_top5': NEWS_TOP5,
-        'all_keywords': ALL_KEYWORDS,
-        'paper': {
-            'doc_count': len(paper_docs),
-            'keyword_freq': dict(paper_freq),
-            'cooccurrence': {k1: dict(v) for k1, v in paper_matrix.items()}
-        },
-        'news': {
-            'doc_count': len(news_docs),
-            'keyword_freq': dict(news_freq),
-            'cooccurrence': {k1: dict(v) for k1, v in news_matrix.items()}
-        },
-        'summary': summary
-    }
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
-
-    print(f"\n\n결과 저장 완료: {output_file}")
+    with span('load', '코퍼스 저장소'):
+        paper_top = top_keywords('paper', args.top)
+        news_top = top_keywords('news', args.top)
+    all_keywords = list(dict.fromkeys(paper_top + news_top))
+    print(f"  Paper 문서 수: {get_store('paper').n_docs:,}")
+    print(f"  News 문서 수: {get_store('news').n_docs:,}")
+    print(f"\nPaper 상위 {args.top}개: {paper_top[:TOP_COOCCUR_PRINT_N]}")
+    print(f"News 상위 {args.top}개: {news_top[:TOP_COOCCUR_PRINT_N]}")
+    print(f"통합 키워드: {len(all_keywords):,}개")
+
+    # 코퍼스별 행렬 1회 계산 (이후 분석은 모두 같은 행렬 사용)
+    with span('count', '동시 출현 행렬', items=len(all_keywords)):
+        paper_matrix = cooccurrence_matrix('paper', all_keywords)
+        news_matrix = cooccurrence_matrix('news', all_keywords)
+
+    with span('report'):
+        print_cooccurrence_analysis("Paper", paper_matrix, paper_top, "Paper")
+        print_cooccurrence_analysis("News", news_matrix, news_top, "News")
+        analyze_cross_occurrence("Paper", paper_matrix, paper_top, news_top)
+        analyze_cross_occurrence("News", news_matrix, paper_top, news_top)
+        summary = create_summary_table(paper_matrix, news_matrix)
+
+    with span('save'):
+        output_file = OUTPUT_DIR / 'top5_cooccurrence_analysis.json'
+        output_data = {
+            'top_n': args.top,
+            'paper_top': paper_top,
+            'news_top': news_top,
+            'all_keywords': all_keywords,
+        }
+        for name, matrix in (('paper', paper_matrix), ('news', news_matrix)):
+            output_data[name] = {
+                'doc_count': matrix.n_docs,
+                'keyword_freq': {kw: matrix.keyword_freq(kw) for kw in all_keywords},
+                'keyword_ratio': {kw: round(matrix.ratio(kw), 4) for kw in all_keywords},
+                'cooccurrence': matrix.to_dict(),
+            }
+        output_data['summary'] = summary
+
+        with open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(output_data, f, ensure_ascii=False, indent=2)
+        print(f"\n\n결과 저장 완료: {output_file}")
+
+    finish_run()
 
 
 if __name__ == '__main__':
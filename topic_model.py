@@ -0,0 +1,278 @@
+"""
+토픽 모델링 (미니배치 온라인 NMF)
+- 뉴스+논문 공통 어휘 (코퍼스 저장소의 문서 빈도 합산, IDF 가중, 문서별 L2 정규화)
+- 미니배치마다 문서-토픽 가중치(W)를 구하고 누적 통계로 토픽-키워드 행렬(H) 갱신
+  → 문서는 메모리 맵 코퍼스 저장소(corpus.py)에서 배치/청크 단위로만 읽어 행렬로 변환
+  → 메모리 사용량은 배치 크기 × 토픽 수 + 토픽 수 × 어휘 수로 제한
+- 미니배치는 뉴스/논문 절반씩 구성 (문서 수가 많은 뉴스가 토픽을 독점하지 않도록)
+- 학습 후 전체 문서의 토픽 비중을 병렬 프로세스로 계산
+- 토픽별 대표 키워드 + 뉴스/논문 비중 → 토픽 단위 간극 분석
+"""
+
+import json
+import math
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from scipy import sparse
+
+# config에서 설정 import
+from config import (
+    OUTPUT_DIR,
+    GAP_BLUE_OCEAN_THRESHOLD, GAP_ACADEMIC_THRESHOLD,
+    TOPIC_N_TOPICS, TOPIC_MIN_DF, TOPIC_MAX_DF_RATIO, TOPIC_BATCH_SIZE,
+    TOPIC_EPOCHS, TOPIC_INNER_ITER, TOPIC_DECAY, TOPIC_TOP_WORDS,
+    TOPIC_WORKERS, TOPIC_SEED,
+    init_dirs
+)
+from corpus import csr_to_matrix, load_or_build_store
+from profiling import span, start_run, finish_run
+
+
+_EPS = 1e-10
+
+
+class TopicSource:
+    """코퍼스 저장소 → 공통 어휘 IDF 가중 행 (필요한 문서만 저장소에서 읽어 행렬로 변환)"""
+
+    def __init__(self, store, vocab_index, idf):
+        self.store = store
+        self.n_docs = store.n_docs
+        self.n_terms = len(idf)
+        self.idf = idf
+        # 저장소 키워드 ID → 공통 어휘 ID (-1: 어휘 밖)
+        self.mapping = np.array([vocab_index.get(kw, -1) for kw in store.vocab], dtype=np.int64)
+
+    def _matrix(self, lengths, ids):
+        """문서별 키워드 수 + 저장소 키워드 ID → 행 L2 정규화 IDF 가중 CSR"""
+        rows = np.repeat(np.arange(len(lengths)), lengths)
+        cols = self.mapping[ids]
+        keep = cols >= 0
+        rows, cols = rows[keep], cols[keep]
+        data = self.idf[cols]
+        norms = np.sqrt(np.bincount(rows, weights=data ** 2, minlength=len(lengths)))
+        data = (data / np.where(norms > 0, norms, 1)[rows]).astype(np.float32)
+        indptr = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(rows, minlength=len(lengths)), out=indptr[1:])
+        return csr_to_matrix(indptr, cols.astype(np.int32), self.n_terms, data=data)
+
+    def rows(self, doc_ids):
+        """임의 문서 ID 묶음 → 행렬 (미니배치)"""
+        doc_ids = np.asarray(doc_ids, dtype=np.int64)
+        starts = np.asarray(self.store.indptr[doc_ids])
+        lengths = np.asarray(self.store.indptr[doc_ids + 1]) - starts
+        shift = starts - np.r_[0, np.cumsum(lengths)[:-1]]
+        positions = np.repeat(shift, lengths) + np.arange(int(lengths.sum()))
+        return self._matrix(lengths, np.asarray(self.store.indices[positions]))
+
+    def chunks(self, chunk_docs):
+        """연속 문서 범위별 행렬 (store.slice)"""
+        for start in range(0, self.n_docs, chunk_docs):
+            indptr, indices, _ = self.store.slice(start, min(start + chunk_docs, self.n_docs))
+            yield self._matrix(np.diff(indptr), np.asarray(indices))
+
+
+def build_topic_sources(news_store, paper_store, min_df=TOPIC_MIN_DF, max_df_ratio=TOPIC_MAX_DF_RATIO):
+    """뉴스/논문 저장소 → 공통 어휘 (문서 빈도 합산, 빈도 내림차순) + 소스별 TopicSource
+
+    Returns:
+        news_source, paper_source: TopicSource
+        vocab: list[str]
+    """
+    doc_freq = Counter()
+    for store in (news_store, paper_store):
+        doc_freq.update(dict(zip(store.vocab, np.asarray(store.doc_freq).tolist())))
+    n_docs = news_store.n_docs + paper_store.n_docs
+
+    vocab = sorted((kw for kw, df in doc_freq.items() if min_df <= df <= max_df_ratio * n_docs),
+                   key=lambda kw: (-doc_freq[kw], kw))
+    vocab_index = {kw: i for i, kw in enumerate(vocab)}
+    idf = (np.log(n_docs / np.array([doc_freq[kw] for kw in vocab], dtype=np.float64)) + 1).astype(np.float32)
+
+    return TopicSource(news_store, vocab_index, idf), TopicSource(paper_store, vocab_index, idf), vocab
+
+
+def solve_weights(x, h, hht=None, n_iter=TOPIC_INNER_ITER, seed=TOPIC_SEED):
+    """H 고정 시 문서-토픽 가중치 W (곱셈 갱신)"""
+    if hht is None:
+        hht = h @ h.T
+    xht = np.asarray(x @ h.T)
+    rng = np.random.default_rng(seed)
+    w = rng.uniform(0.5, 1.5, (x.shape[0], h.shape[0])).astype(np.float32) * (xht.mean() + _EPS)
+    for _ in range(n_iter):
+        w *= xht / (w @ hht + _EPS)
+    return w
+
+
+def fit_nmf(sources, n_topics=TOPIC_N_TOPICS, batch_size=TOPIC_BATCH_SIZE,
+            epochs=TOPIC_EPOCHS, decay=TOPIC_DECAY, seed=TOPIC_SEED):
+    """미니배치 온라인 NMF (누적 통계 A = Σ WᵀW, B = Σ WᵀX 기반 H 갱신)
+
+    Args:
+        sources: TopicSource 목록 (미니배치는 소스별로 같은 수의 문서)
+
+    Returns:
+        h: np.ndarray[float32] (토픽 수 × 어휘 수, 문서나 어휘가 없으면 0 행렬)
+    """
+    rng = np.random.default_rng(seed)
+    n_terms = sources[0].n_terms if sources else 0
+    sources = [src for src in sources if src.n_docs > 0]
+    if not sources or n_terms == 0:
+        return np.zeros((n_topics, n_terms), dtype=np.float32)
+    half = max(batch_size // len(sources), 1)
+
+    # 초기 H: 토픽마다 무작위 문서 몇 건의 평균 + 잡음
+    h = np.zeros((n_topics, n_terms), dtype=np.float32)
+    for src in sources:
+        sample = src.rows(rng.integers(0, src.n_docs, n_topics * 4))
+        h += np.vstack([np.asarray(sample[t::n_topics].mean(axis=0)) for t in range(n_topics)])
+    h += rng.uniform(0, h.mean() + _EPS, h.shape).astype(np.float32)
+
+    a = np.zeros((n_topics, n_topics), dtype=np.float32)
+    b = np.zeros((n_topics, n_terms), dtype=np.float32)
+    n_batches = math.ceil(max(src.n_docs for src in sources) / half)
+
+    for _ in range(epochs):
+        perms = [rng.permutation(src.n_docs) for src in sources]
+        for step in range(n_batches):
+            pos = step * half + np.arange(half)
+            rows = [src.rows(p[pos % len(p)]) for src, p in zip(sources, perms)]
+            x = sparse.vstack(rows, format='csr')
+
+            w = solve_weights(x, h, seed=seed + step)
+            a = decay * a + w.T @ w
+            b = decay * b + np.asarray((x.T @ w).T)
+            for _ in range(2):
+                h *= b / (a @ h + _EPS)
+
+    return h
+
+
+_worker_h = None
+_worker_hht = None
+
+
+def _init_worker(h):
+    global _worker_h, _worker_hht
+    _worker_h = h
+    _worker_hht = h @ h.T
+
+
+def _topic_stats(chunk):
+    """문서 묶음의 토픽 비중 합계 + 주 토픽 문서 수 (병렬 프로세스에서 실행)"""
+    data, indices, indptr, n_terms = chunk
+    x = csr_to_matrix(indptr, indices, n_terms, data=data)
+    w = solve_weights(x, _worker_h, _worker_hht)
+    total = w.sum(axis=1, keepdims=True)
+    has_topic = total.ravel() > _EPS
+    share = np.divide(w, total, out=np.zeros_like(w), where=total > _EPS)
+    dominant = np.bincount(np.argmax(w[has_topic], axis=1), minlength=w.shape[1])
+    return share.sum(axis=0), dominant
+
+
+def _chunks(source, chunk_docs):
+    for sub in source.chunks(chunk_docs):
+        yield sub.data, sub.indices, sub.indptr, source.n_terms
+
+
+def topic_prevalence(source, h, chunk_docs=TOPIC_BATCH_SIZE, workers=TOPIC_WORKERS):
+    """전체 문서의 토픽 비중 (평균 비중, 주 토픽 문서 수)"""
+    share_sum = np.zeros(h.shape[0])
+    dominant = np.zeros(h.shape[0], dtype=np.int64)
+    if source.n_docs == 0 or source.n_terms == 0:
+        return share_sum, dominant
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(h,)) as pool:
+        for s, d in pool.map(_topic_stats, _chunks(source, chunk_docs)):
+            share_sum += s
+            dominant += d
+    return share_sum / source.n_docs, dominant
+
+
+def summarize_topics(h, vocab, news_prev, paper_prev, top_words=TOPIC_TOP_WORDS):
+    """토픽별 대표 키워드 + 뉴스/논문 비중 + 간극 지수 (Phase 3과 같은 1000건당 비율 차이)"""
+    (news_share, news_dom, n_news), (paper_share, paper_dom, n_paper) = news_prev, paper_prev
+    topics = []
+    for t in range(h.shape[0]):
+        top = np.argsort(-h[t])[:top_words]
+        news_ratio = news_dom[t] / n_news * 1000 if n_news else 0
+        paper_ratio = paper_dom[t] / n_paper * 1000 if n_paper else 0
+        topics.append({
+            'topic': t,
+            'top_keywords': [{'keyword': vocab[i], 'weight': round(float(h[t, i]), 5)} for i in top],
+            'news_share': round(float(news_share[t]), 5),
+            'paper_share': round(float(paper_share[t]), 5),
+            'news_docs': int(news_dom[t]),
+            'paper_docs': int(paper_dom[t]),
+            'news_ratio': round(news_ratio, 4),
+            'paper_ratio': round(paper_ratio, 4),
+            'gap_index': round(news_ratio - paper_ratio, 4),
+        })
+    topics.sort(key=lambda x: x['gap_index'], reverse=True)
+    return topics
+
+
+def main():
+    print("\n" + "#" * 60)
+    print("#  토픽 모델링: 미니배치 온라인 NMF")
+    print("#" * 60)
+
+    init_dirs()
+    start_run('topic_model')
+
+    print("\n[1] 코퍼스 저장소 연결...")
+    with span('load', '코퍼스 저장소'):
+        news_store = load_or_build_store('news')
+        paper_store = load_or_build_store('paper')
+    n_docs = news_store.n_docs + paper_store.n_docs
+    print(f"  뉴스: {news_store.n_docs:,}건 / 논문: {paper_store.n_docs:,}건")
+
+    with span('normalize', '공통 어휘', items=n_docs):
+        news_source, paper_source, vocab = build_topic_sources(news_store, paper_store)
+    print(f"  어휘 수: {len(vocab):,}")
+
+    print(f"\n[2] NMF 학습 (토픽 {TOPIC_N_TOPICS}개, 배치 {TOPIC_BATCH_SIZE:,}, {TOPIC_EPOCHS} epoch)...")
+    with span('score', 'NMF 학습', items=n_docs):
+        h = fit_nmf([news_source, paper_source])
+
+    print("\n[3] 토픽 비중 계산...")
+    with span('score', '토픽 비중', items=n_docs):
+        news_prev = (*topic_prevalence(news_source, h), news_source.n_docs)
+        paper_prev = (*topic_prevalence(paper_source, h), paper_source.n_docs)
+
+    topics = summarize_topics(h, vocab, news_prev, paper_prev)
+
+    print("\n[토픽 간극 분석]")
+    print("-" * 70)
+    print(f"{'토픽':>4} | {'뉴스비율':>10} | {'논문비율':>10} | {'간극':>10} | 대표 키워드")
+    print("-" * 70)
+    for t in topics:
+        words = ', '.join(w['keyword'] for w in t['top_keywords'][:6])
+        print(f"{t['topic']:>4} | {t['news_ratio']:>10.2f} | {t['paper_ratio']:>10.2f} | "
+              f"{t['gap_index']:>10.2f} | {words}")
+
+    with span('save'):
+        output_path = OUTPUT_DIR / 'topic_model.json'
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'n_topics': TOPIC_N_TOPICS,
+                'n_vocab': len(vocab),
+                'n_news_docs': news_source.n_docs,
+                'n_paper_docs': paper_source.n_docs,
+                'topics': topics,
+                'blue_ocean_topics': [t['topic'] for t in topics
+                                      if t['gap_index'] > GAP_BLUE_OCEAN_THRESHOLD],
+                'academic_lead_topics': [t['topic'] for t in topics
+                                         if t['gap_index'] < GAP_ACADEMIC_THRESHOLD],
+            }, f, ensure_ascii=False, indent=2)
+        print(f"\n  저장: {output_path}")
+
+    finish_run()
+
+    print("\n" + "#" * 60)
+    print("#  토픽 모델링 완료!")
+    print("#" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,167 @@
+"""
+2단계 어휘 구축 (min-df / max-df 가지치기 + 해시 버킷)
+- 1단계: 키워드 문자열 대신 64비트 해시(sketch.hash64)로 문서 빈도 집계
+    정렬된 (해시, 빈도) 배열에 VOCAB_BATCH_DOCS 문서씩 병합 → 키워드당 16바이트 (문자열/Counter 항목 없음)
+    배치마다 정렬된 배치 키를 searchsorted로 기존 표에 끼워 넣음 (표 전체를 다시 정렬하지 않음)
+- 2단계: 문서 빈도가 [VOCAB_MIN_DF, VOCAB_MAX_DF] 안인 키워드만 문자열로 집계하고 문서 재구성
+    범위 밖 키워드는 (해시 % VOCAB_OVERFLOW_BUCKETS) 버킷의 빈도로 합산 → 전체 키워드 수, 문서 수는 그대로
+- 대부분 한 번만 나오는 긴 꼬리 키워드가 Counter, 문서 집합, TF-IDF 정렬에 들어가지 않음
+- 입력은 DocStream(원본을 순회마다 다시 읽는 스트림) → 문서별 전체 키워드 목록을 메모리에 만들지 않음
+"""
+
+from collections import Counter
+
+import numpy as np
+
+# config에서 설정 import
+from config import (
+    VOCAB_MIN_DF, VOCAB_MAX_DF, VOCAB_OVERFLOW_BUCKETS, VOCAB_BATCH_DOCS
+)
+from sketch import hash64
+
+
+class DocFreqTable:
+    """키워드 해시 → 문서 빈도 (정렬된 uint64 키 배열 + int64 빈도 배열)"""
+
+    def __init__(self):
+        self.keys = np.zeros(0, dtype=np.uint64)
+        self.counts = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def update(self, hashes):
+        """해시 배열 반영 (문서마다 중복 제거된 키워드의 해시를 이어 붙인 배열)"""
+        keys, counts = np.unique(hashes, return_counts=True)
+        idx = np.searchsorted(self.keys, keys)
+        found = idx < len(self.keys)
+        found[found] = self.keys[idx[found]] == keys[found]
+        self.counts[idx[found]] += counts[found]
+        new = ~found
+        self.keys = np.insert(self.keys, idx[new], keys[new])
+        self.counts = np.insert(self.counts, idx[new], counts[new].astype(np.int64))
+
+    def lookup(self, hashes):
+        """해시 배열 → 문서 빈도 (없으면 0)"""
+        if not len(self.keys):
+            return np.zeros(len(hashes), dtype=np.int64)
+        idx = np.minimum(np.searchsorted(self.keys, hashes), len(self.keys) - 1)
+        return np.where(self.keys[idx] == hashes, self.counts[idx], 0)
+
+
+class DocStream:
+    """재순회 가능한 문서 스트림 (순회할 때마다 make_iter()로 원본을 처음부터 다시 읽음)"""
+
+    def __init__(self, make_iter):
+        self.make_iter = make_iter
+
+    def __iter__(self):
+        return iter(self.make_iter())
+
+
+class PrunedCounter(Counter):
+    """가지치기된 어휘의 키워드 빈도 (Counter 호환)
+
+    - pruning: 가지치기 통계 (고유 키워드 수, 전체/버킷 빈도 합계 등)
+    - bucket_tf / bucket_df: 해시 버킷별 가지치기된 키워드 출현 수 / 문서 수
+    """
+
+    pruning = None
+    bucket_tf = None
+    bucket_df = None
+
+
+def _batches(docs, size):
+    batch = []
+    for doc in docs:
+        batch.append(doc)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def max_df_count(max_df, n_docs):
+    """VOCAB_MAX_DF → 문서 수 상한 (1 이하 실수는 문서 비율)"""
+    if isinstance(max_df, float) and max_df <= 1:
+        return int(max_df * n_docs)
+    return int(max_df)
+
+
+def prune_vocabulary(docs, min_df=VOCAB_MIN_DF, max_df=VOCAB_MAX_DF,
+                     n_buckets=VOCAB_OVERFLOW_BUCKETS, batch_docs=VOCAB_BATCH_DOCS):
+    """문서별 키워드 목록 → (문서별 키워드 집합, PrunedCounter)
+
+    Args:
+        docs: 문서별 키워드 목록 (2번 순회하므로 재순회 가능한 시퀀스나 DocStream, 문서 내 중복은 빈도에 반영)
+
+    Returns:
+        doc_sets: list[set] (범위 안 키워드만, 모두 가지치기된 문서도 빈 집합으로 유지 → 문서 수 보존)
+        counter: PrunedCounter (범위 안 키워드 빈도)
+    """
+    # 1단계: 해시 문서 빈도
+    table = DocFreqTable()
+    n_docs = 0
+    for batch in _batches(docs, batch_docs):
+        table.update(hash64([kw for doc in batch for kw in set(doc)]))
+        n_docs += len(batch)
+
+    max_count = max_df_count(max_df, n_docs)
+    kept_keys = table.keys[(table.counts >= min_df) & (table.counts <= max_count)]
+
+    # 2단계: 범위 안 키워드만 문자열로 집계, 나머지는 해시 버킷
+    counter = PrunedCounter()
+    bucket_tf = np.zeros(n_buckets, dtype=np.int64)
+    bucket_df = np.zeros(n_buckets, dtype=np.int64)
+    doc_sets = []
+    for batch in _batches(docs, batch_docs):
+        flat = [kw for doc in batch for kw in doc]
+        hashes = hash64(flat)
+        if len(kept_keys):
+            idx = np.minimum(np.searchsorted(kept_keys, hashes), len(kept_keys) - 1)
+            keep = kept_keys[idx] == hashes
+        else:
+            keep = np.zeros(len(flat), dtype=bool)
+
+        kept = [kw for kw, k in zip(flat, keep.tolist()) if k]
+        counter.update(kept)
+        pos = 0
+        for doc in batch:
+            end = pos + len(doc)
+            doc_sets.append({kw for kw, k in zip(doc, keep[pos:end].tolist()) if k})
+            pos = end
+
+        lengths = np.array([len(doc) for doc in batch], dtype=np.int64)
+        doc_of = np.repeat(np.arange(len(batch)), lengths)[~keep]
+        buckets = (hashes[~keep] % np.uint64(n_buckets)).astype(np.int64)
+        bucket_tf += np.bincount(buckets, minlength=n_buckets)
+        # 버킷 문서 수: (문서, 버킷) 고유 조합 수
+        pairs = np.unique(doc_of * n_buckets + buckets)
+        bucket_df += np.bincount(pairs % n_buckets, minlength=n_buckets)
+
+    kept_tf = sum(counter.values())
+    pruned_tf = int(bucket_tf.sum())
+    counter.bucket_tf = bucket_tf
+    counter.bucket_df = bucket_df
+    counter.pruning = {
+        'n_docs': n_docs,
+        'min_df': min_df,
+        'max_df': max_count,
+        'n_unique': len(table),
+        'n_kept': len(counter),
+        'n_pruned': len(table) - len(kept_keys),
+        'total_tf': kept_tf + pruned_tf,
+        'kept_tf': kept_tf,
+        'pruned_tf': pruned_tf,
+        'overflow_buckets': n_buckets,
+    }
+    return doc_sets, counter
+
+
+def print_pruning(name, counter):
+    stats = counter.pruning
+    print(f"  어휘 가지치기 ({name}): 고유 키워드 {stats['n_unique']:,}개 중 {stats['n_kept']:,}개 유지 "
+          f"(문서 빈도 {stats['min_df']:,} ~ {stats['max_df']:,}), "
+          f"{stats['n_pruned']:,}개는 해시 버킷 {stats['overflow_buckets']:,}개로 합산 "
+          f"(출현 {stats['pruned_tf']:,} / 전체 {stats['total_tf']:,})")